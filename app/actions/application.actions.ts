@@ -1,16 +1,26 @@
 "use server";
 
 import { JobApplication } from "@prisma/client";
-import { revalidatePath } from "next/cache";
 import {
   createApplicationSchema,
   updateApplicationSchema,
+  bulkUpdateStatusSchema,
+  bulkDeleteSchema,
   filterSchema,
+  type ApplicationStatus,
   type CreateApplicationInput,
   type UpdateApplicationInput,
   type FilterInput,
 } from "@/lib/zod/application.schema";
 import * as repository from "@/lib/repositories/application.repository";
+import {
+  cachedAnalytics,
+  cachedFindAll,
+  cachedFindById,
+  cachedStatusCounts,
+  invalidateWrite,
+  invalidateWrites,
+} from "@/lib/cache/data-cache";
 
 export type ActionState<T> = {
   success: boolean;
@@ -34,7 +44,7 @@ export async function createApplication(
 
   try {
     const application = await repository.create(result.data);
-    revalidatePath("/applications");
+    invalidateWrite({ id: application.id, statuses: [application.status] });
     return { success: true, data: application };
   } catch (error) {
     console.error("Failed to create application:", error);
@@ -57,8 +67,9 @@ export async function updateApplication(
 
   try {
     const { id, ...updateData } = result.data;
-    const application = await repository.update(id, updateData);
-    revalidatePath("/applications");
+    // The replaced status tells us which filtered lists the row is leaving
+    const { application, previousStatus } = await repository.update(id, updateData);
+    invalidateWrite({ id, statuses: [previousStatus, application.status] });
     return { success: true, data: application };
   } catch (error) {
     console.error("Failed to update application:", error);
@@ -68,8 +79,8 @@ export async function updateApplication(
 
 export async function deleteApplication(id: string): Promise<ActionState<void>> {
   try {
-    await repository.remove(id);
-    revalidatePath("/applications");
+    const removed = await repository.remove(id);
+    invalidateWrite({ id, statuses: [removed?.status] });
     return { success: true };
   } catch (error) {
     console.error("Failed to delete application:", error);
@@ -77,21 +88,77 @@ export async function deleteApplication(id: string): Promise<ActionState<void>>
   }
 }
 
+// Invalidates once for a whole bulk write: the rows' old statuses (and the
+// new one) name every list that changed.
+function invalidateBulkWrite(rows: { id: string; status: string }[], status?: ApplicationStatus) {
+  invalidateWrites(rows.map((row) => ({ id: row.id, statuses: [row.status, status] })));
+}
+
+export async function bulkUpdateStatus(
+  ids: string[],
+  status: ApplicationStatus
+): Promise<ActionState<{ count: number }>> {
+  const result = bulkUpdateStatusSchema.safeParse({ ids, status });
+
+  if (!result.success) {
+    return {
+      success: false,
+      error: "Validation failed",
+      fieldErrors: result.error.flatten().fieldErrors,
+    };
+  }
+
+  try {
+    const changed = await repository.bulkUpdateStatus(result.data.ids, result.data.status);
+    invalidateBulkWrite(changed, result.data.status);
+    return { success: true, data: { count: changed.length } };
+  } catch (error) {
+    console.error("Failed to update applications:", error);
+    return { success: false, error: "Failed to update applications" };
+  }
+}
+
+export async function bulkDelete(ids: string[]): Promise<ActionState<{ count: number }>> {
+  const result = bulkDeleteSchema.safeParse({ ids });
+
+  if (!result.success) {
+    return {
+      success: false,
+      error: "Validation failed",
+      fieldErrors: result.error.flatten().fieldErrors,
+    };
+  }
+
+  try {
+    const removed = await repository.bulkRemove(result.data.ids);
+    invalidateBulkWrite(removed);
+    return { success: true, data: { count: removed.length } };
+  } catch (error) {
+    console.error("Failed to delete applications:", error);
+    return { success: false, error: "Failed to delete applications" };
+  }
+}
+
 // Data fetching actions (no revalidation needed, but good to have as server functions)
 export async function getApplications(filters: FilterInput) {
   const result = filterSchema.safeParse(filters);
-  
-  if (result.success) {
-    return repository.findAll(result.data);
-  }
-  
+
   // Fallback to defaults if validation fails
-  return repository.findAll({
-    sortBy: "applicationDate",
-    sortOrder: "desc",
-  });
+  const validFilters: FilterInput = result.success
+    ? result.data
+    : { sortBy: "applicationDate", sortOrder: "desc" };
+
+  return cachedFindAll(validFilters);
 }
 
 export async function getApplicationById(id: string) {
-  return repository.findById(id);
+  return cachedFindById(id);
+}
+
+export async function getStatusCounts() {
+  return cachedStatusCounts();
+}
+
+export async function getAnalytics() {
+  return cachedAnalytics();
 }
@@ -0,0 +1,210 @@
+import Link from "next/link";
+import { ArrowLeft } from "lucide-react";
+import { getAnalytics } from "@/app/actions/application.actions";
+import { Button } from "@/components/ui/button";
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { STATUS_CONFIG } from "@/lib/constants/status";
+import type { ApplicationStatus } from "@/lib/zod/application.schema";
+
+export const dynamic = "force-dynamic";
+
+function formatDays(days: number | null) {
+  if (days === null) return "–";
+  return days === 1 ? "1 day" : `${days} days`;
+}
+
+function statusLabel(status: string) {
+  return STATUS_CONFIG[status as ApplicationStatus]?.label ?? status;
+}
+
+export default async function AnalyticsPage() {
+  const {
+    weekly,
+    funnel,
+    responseRate,
+    medianDaysToStatusChange,
+    medianDaysByStatus,
+    timeInStage,
+    conversions,
+  } = await getAnalytics();
+  const busiestWeek = Math.max(1, ...weekly.map((week) => week.count));
+  const applied = Math.max(1, funnel[0].count);
+
+  return (
+    <div className="space-y-6">
+      <header className="flex flex-col sm:flex-row justify-between items-start sm:items-center gap-4 border-b pb-6">
+        <div>
+          <h1 className="text-3xl font-bold tracking-tight">Analytics</h1>
+          <p className="text-muted-foreground mt-1">How your job search is converting.</p>
+        </div>
+        <Button variant="outline" asChild>
+          <Link href="/applications">
+            <ArrowLeft className="h-4 w-4" />
+            Applications
+          </Link>
+        </Button>
+      </header>
+
+      <div className="grid grid-cols-1 sm:grid-cols-3 gap-6">
+        <Card>
+          <CardHeader>
+            <CardDescription>Response rate</CardDescription>
+            <CardTitle className="text-3xl tabular-nums">
+              {responseRate === null ? "–" : `${Math.round(responseRate * 100)}%`}
+            </CardTitle>
+          </CardHeader>
+        </Card>
+        <Card>
+          <CardHeader>
+            <CardDescription>Median time to a status change</CardDescription>
+            <CardTitle className="text-3xl tabular-nums">{formatDays(medianDaysToStatusChange)}</CardTitle>
+          </CardHeader>
+        </Card>
+        <Card>
+          <CardHeader>
+            <CardDescription>Applications in the last {weekly.length} weeks</CardDescription>
+            <CardTitle className="text-3xl tabular-nums">
+              {weekly.reduce((sum, week) => sum + week.count, 0)}
+            </CardTitle>
+          </CardHeader>
+        </Card>
+      </div>
+
+      <Card>
+        <CardHeader>
+          <CardTitle>Applications per week</CardTitle>
+          <CardDescription>By application date, weeks starting Monday (UTC).</CardDescription>
+        </CardHeader>
+        <CardContent>
+          <ol aria-label="Applications per week" className="flex items-end gap-1 h-48">
+            {weekly.map((week) => (
+              <li
+                key={week.weekStart}
+                title={`Week of ${week.weekStart}: ${week.count}`}
+                className="flex-1 rounded-t bg-primary/70"
+                style={{ height: `${(week.count / busiestWeek) * 100}%` }}
+              />
+            ))}
+          </ol>
+          <div className="flex justify-between text-xs text-muted-foreground mt-2">
+            <span>{weekly[0]?.weekStart}</span>
+            <span>{weekly[weekly.length - 1]?.weekStart}</span>
+          </div>
+        </CardContent>
+      </Card>
+
+      <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+        <Card>
+          <CardHeader>
+            <CardTitle>Status funnel</CardTitle>
+            <CardDescription>Applications that have reached each stage, by current status.</CardDescription>
+          </CardHeader>
+          <CardContent className="space-y-3">
+            {funnel.map((stage) => (
+              <div key={stage.label}>
+                <div className="flex justify-between text-sm mb-1">
+                  <span>{stage.label}</span>
+                  <span className="tabular-nums text-muted-foreground">{stage.count}</span>
+                </div>
+                <div className="h-2 rounded bg-muted">
+                  <div className="h-2 rounded bg-primary" style={{ width: `${(stage.count / applied) * 100}%` }} />
+                </div>
+              </div>
+            ))}
+          </CardContent>
+        </Card>
+
+        <Card>
+          <CardHeader>
+            <CardTitle>Days from applying to a status change</CardTitle>
+            <CardDescription>Median per new status, over every recorded change.</CardDescription>
+          </CardHeader>
+          <CardContent>
+            {medianDaysByStatus.length === 0 ? (
+              <p className="text-muted-foreground">No status changes recorded yet.</p>
+            ) : (
+              <table className="w-full text-sm">
+                <thead className="text-left text-muted-foreground">
+                  <tr>
+                    <th className="py-2">New status</th>
+                    <th>Median</th>
+                    <th>Changes</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {medianDaysByStatus.map((row) => (
+                    <tr key={row.status} className="border-t">
+                      <td className="py-2">{statusLabel(row.status)}</td>
+                      <td className="tabular-nums">{formatDays(row.days)}</td>
+                      <td className="tabular-nums">{row.changes}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            )}
+          </CardContent>
+        </Card>
+      </div>
+
+      <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+        <Card>
+          <CardHeader>
+            <CardTitle>Time in stage</CardTitle>
+            <CardDescription>Median days before moving on, for stages entered in the last {weekly.length} weeks.</CardDescription>
+          </CardHeader>
+          <CardContent>
+            <table className="w-full text-sm">
+              <thead className="text-left text-muted-foreground">
+                <tr>
+                  <th className="py-2">Stage</th>
+                  <th>Median</th>
+                  <th>Moved on</th>
+                </tr>
+              </thead>
+              <tbody>
+                {timeInStage.map((stage) => (
+                  <tr key={stage.status} className="border-t">
+                    <td className="py-2">{statusLabel(stage.status)}</td>
+                    <td className="tabular-nums">{formatDays(stage.medianDays)}</td>
+                    <td className="tabular-nums">
+                      {stage.left} of {stage.entered}
+                    </td>
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+          </CardContent>
+        </Card>
+
+        <Card>
+          <CardHeader>
+            <CardTitle>Conversion</CardTitle>
+            <CardDescription>Share of stages entered in the last {weekly.length} weeks that led to the next one.</CardDescription>
+          </CardHeader>
+          <CardContent>
+            <table className="w-full text-sm">
+              <thead className="text-left text-muted-foreground">
+                <tr>
+                  <th className="py-2">From</th>
+                  <th>To</th>
+                  <th>Rate</th>
+                </tr>
+              </thead>
+              <tbody>
+                {conversions.map((row) => (
+                  <tr key={`${row.from}-${row.to}`} className="border-t">
+                    <td className="py-2">{statusLabel(row.from)}</td>
+                    <td>{statusLabel(row.to)}</td>
+                    <td className="tabular-nums">
+                      {row.rate === null ? "–" : `${Math.round(row.rate * 100)}% (${row.converted} of ${row.entered})`}
+                    </td>
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+          </CardContent>
+        </Card>
+      </div>
+    </div>
+  );
+}
@@ -0,0 +1,80 @@
+import * as repository from "@/lib/repositories/application.repository";
+import { csvHeader, toCsvRow, toNdjsonLine } from "@/lib/export/format";
+import { filterSchema, type FilterInput } from "@/lib/zod/application.schema";
+
+export const dynamic = "force-dynamic";
+
+// Rows fetched per keyset page; memory use is bounded by one chunk.
+const EXPORT_CHUNK_SIZE = 1000;
+
+const FORMATS = {
+  csv: { contentType: "text/csv; charset=utf-8", header: csvHeader, row: toCsvRow },
+  ndjson: { contentType: "application/x-ndjson", header: () => "", row: toNdjsonLine },
+};
+
+// Streams every application matching the same filters as the list page
+// (?search=&status=&sortBy=&sortOrder=) as CSV (default) or NDJSON (?format=ndjson).
+export async function GET(request: Request) {
+  const params = new URL(request.url).searchParams;
+  const format = FORMATS[params.get("format") === "ndjson" ? "ndjson" : "csv"];
+
+  const result = filterSchema.safeParse({
+    search: params.get("search") || undefined,
+    status: params.get("status") || undefined,
+    sortBy: params.get("sortBy") || undefined,
+    sortOrder: params.get("sortOrder") || undefined,
+  });
+  if (!result.success) {
+    return Response.json(
+      { success: false, error: "Invalid filters", fieldErrors: result.error.flatten().fieldErrors },
+      { status: 400 }
+    );
+  }
+
+  // Set after parsing on purpose: filterSchema caps limit at MAX_PAGE_SIZE for
+  // the list page, while an export walks every page in larger chunks.
+  const filters: FilterInput = { ...result.data, limit: EXPORT_CHUNK_SIZE };
+  const encoder = new TextEncoder();
+  let cursor: string | undefined;
+  let started = false;
+  let done = false;
+
+  // Pull-based: the next page is only read once the client has consumed the
+  // previous one, so a slow download never buffers the whole table.
+  const stream = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      if (!started) {
+        started = true;
+        const header = format.header();
+        if (header) controller.enqueue(encoder.encode(header));
+      }
+      if (done) {
+        controller.close();
+        return;
+      }
+
+      try {
+        const page = await repository.findAll({ ...filters, cursor });
+        if (page.items.length > 0) {
+          controller.enqueue(encoder.encode(page.items.map(format.row).join("")));
+        }
+        cursor = page.nextCursor ?? undefined;
+        done = !page.nextCursor;
+      } catch (error) {
+        // The 200 status has already gone out, so abort the body: the client
+        // sees a failed download instead of a file that silently ends early.
+        console.error("Failed to export applications:", error);
+        controller.error(new Error("Failed to export applications"));
+      }
+    },
+  });
+
+  const extension = format === FORMATS.csv ? "csv" : "ndjson";
+  return new Response(stream, {
+    headers: {
+      "Content-Type": format.contentType,
+      "Content-Disposition": `attachment; filename="applications.${extension}"`,
+      "Cache-Control": "no-store",
+    },
+  });
+}
@@ -0,0 +1,38 @@
+import { invalidateStatusLists } from "@/lib/cache/data-cache";
+import { DEFAULT_IMPORT_BATCH_SIZE, MAX_IMPORT_BATCH_SIZE, importApplications } from "@/lib/import/importer";
+import { decodeText, parseCsv, parseJsonArray, parseNdjson } from "@/lib/import/parsers";
+
+const PARSERS = {
+  "text/csv": parseCsv,
+  "application/x-ndjson": parseNdjson,
+  "application/json": parseJsonArray,
+};
+
+// Streams an upload of CSV (header row required), NDJSON or a JSON array of
+// applications into the database, e.g.
+//   curl --data-binary @applications.csv -H "Content-Type: text/csv" \
+//     http://localhost:3000/api/applications/import
+export async function POST(request: Request) {
+  const contentType = request.headers.get("content-type")?.split(";")[0].trim() ?? "";
+  const parse = PARSERS[contentType as keyof typeof PARSERS];
+
+  if (!parse) {
+    return Response.json(
+      { success: false, error: `Unsupported content type; use one of ${Object.keys(PARSERS).join(", ")}` },
+      { status: 415 }
+    );
+  }
+  if (!request.body) {
+    return Response.json({ success: false, error: "Request body is empty" }, { status: 400 });
+  }
+
+  const requested = Number(new URL(request.url).searchParams.get("batchSize")) || DEFAULT_IMPORT_BATCH_SIZE;
+  const batchSize = Math.min(Math.max(Math.trunc(requested), 1), MAX_IMPORT_BATCH_SIZE);
+  const summary = await importApplications(parse(decodeText(request.body)), { batchSize });
+
+  if (summary.imported > 0) {
+    invalidateStatusLists(summary.statuses);
+  }
+
+  return Response.json({ success: true, data: summary });
+}
@@ -0,0 +1,17 @@
+import { invalidateAll } from "@/lib/cache/data-cache";
+
+export const dynamic = "force-dynamic";
+
+// Called by the e2e harness (testsprite_tests/database.py) right after it has
+// restored this server's database from the seeded template, so no cached page
+// outlives the data it was read from. Only enabled on servers the harness
+// starts itself.
+export async function POST() {
+  if (process.env.E2E_RESET_ENABLED !== "1") {
+    return new Response(null, { status: 404 });
+  }
+
+  invalidateAll();
+
+  return Response.json({ success: true });
+}
@@ -0,0 +1,15 @@
+import { getCacheStats } from "@/lib/cache/data-cache";
+import { getQueryMetrics, slowQueryThresholdMs } from "@/lib/metrics/query-metrics";
+
+export const dynamic = "force-dynamic";
+
+// In-process counters for this server instance; they reset on restart.
+// "queries" holds one latency histogram per repository operation and filter
+// shape, plus "sql" series with the engine time per statement kind.
+export async function GET() {
+  return Response.json({
+    cache: getCacheStats(),
+    slowQueryThresholdMs: slowQueryThresholdMs(),
+    queries: getQueryMetrics(),
+  });
+}
@@ -0,0 +1,27 @@
+import { vitalReportsSchema } from "@/lib/vitals/metrics";
+import { getVitalsSummary, recordVitals } from "@/lib/vitals/store";
+
+export const dynamic = "force-dynamic";
+
+// Batches from lib/vitals/report.ts. sendBeacon posts them as text/plain,
+// so the body is parsed by hand rather than with request.json().
+export async function POST(request: Request) {
+  let payload: unknown;
+  try {
+    payload = JSON.parse(await request.text());
+  } catch {
+    return Response.json({ success: false, error: "Body must be JSON" }, { status: 400 });
+  }
+
+  const result = vitalReportsSchema.safeParse(payload);
+  if (!result.success) {
+    return Response.json({ success: false, error: "Invalid vitals payload" }, { status: 400 });
+  }
+
+  recordVitals(result.data);
+  return new Response(null, { status: 204 });
+}
+
+export async function GET() {
+  return Response.json({ vitals: getVitalsSummary() });
+}
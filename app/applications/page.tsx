@@ -1,6 +1,11 @@
 import { ApplicationList } from "@/components/applications/ApplicationList";
 import { ApplicationFilters } from "@/components/applications/ApplicationFilters";
+import { ApplicationMutationsProvider } from "@/components/applications/ApplicationMutations";
+import { StatusSummary } from "@/components/applications/StatusSummary";
 import { Suspense } from "react";
+import Link from "next/link";
+import { ChartColumn } from "lucide-react";
+import { Button } from "@/components/ui/button";
 import { CreateButton } from "@/components/applications/CreateButton"; // Need to create this client component wrapper
 
 export default async function ApplicationsPage({
@@ -9,25 +14,39 @@ export default async function ApplicationsPage({
   searchParams: Promise<Record<string, string | string[] | undefined>>;
 }) {
   return (
-    <div className="space-y-6">
-      <header className="flex flex-col sm:flex-row justify-between items-start sm:items-center gap-4 border-b pb-6">
-        <div>
-          <h1 className="text-3xl font-bold tracking-tight">Job Applications</h1>
-          <p className="text-muted-foreground mt-1">
-            Manage and track your job search progress.
-          </p>
-        </div>
-        <CreateButton />
-      </header>
-
+    <ApplicationMutationsProvider>
       <div className="space-y-6">
-        <ApplicationFilters />
-        
-        <Suspense fallback={<ApplicationsSkeleton />}>
-          <ApplicationList searchParams={searchParams} />
-        </Suspense>
+        <header className="flex flex-col sm:flex-row justify-between items-start sm:items-center gap-4 border-b pb-6">
+          <div>
+            <h1 className="text-3xl font-bold tracking-tight">Job Applications</h1>
+            <p className="text-muted-foreground mt-1">
+              Manage and track your job search progress.
+            </p>
+          </div>
+          <div className="flex gap-2">
+            <Button variant="outline" asChild>
+              <Link href="/analytics">
+                <ChartColumn className="h-4 w-4" />
+                Analytics
+              </Link>
+            </Button>
+            <CreateButton />
+          </div>
+        </header>
+
+        <div className="space-y-6">
+          <Suspense fallback={<div className="h-[74px] rounded-lg border bg-card/50 animate-pulse" />}>
+            <StatusSummary />
+          </Suspense>
+
+          <ApplicationFilters />
+          
+          <Suspense fallback={<ApplicationsSkeleton />}>
+            <ApplicationList searchParams={searchParams} />
+          </Suspense>
+        </div>
       </div>
-    </div>
+    </ApplicationMutationsProvider>
   );
 }
 
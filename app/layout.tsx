@@ -1,6 +1,7 @@
 import type { Metadata } from "next";
 import { Inter } from "next/font/google";
 import "./globals.css";
+import { WebVitals } from "@/components/WebVitals";
 
 const inter = Inter({ subsets: ["latin"], variable: "--font-inter" });
 
@@ -17,6 +18,7 @@ export default function RootLayout({
   return (
     <html lang="en" className="dark">
       <body className={`${inter.variable} antialiased min-h-screen bg-background text-foreground font-sans`}>
+        <WebVitals />
         <main className="container mx-auto px-4 py-8 max-w-7xl">
           {children}
         </main>
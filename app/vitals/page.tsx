@@ -0,0 +1,67 @@
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { getVitalsSummary } from "@/lib/vitals/store";
+
+export const dynamic = "force-dynamic";
+
+function format(name: string, value: number) {
+  return name === "CLS" ? value.toFixed(3) : `${Math.round(value)} ms`;
+}
+
+export default function VitalsPage() {
+  const vitals = getVitalsSummary();
+
+  return (
+    <div className="space-y-6">
+      <header className="border-b pb-6">
+        <h1 className="text-3xl font-bold tracking-tight">Web Vitals</h1>
+        <p className="text-muted-foreground mt-1">
+          Field measurements reported by browsers since this server started.
+        </p>
+      </header>
+
+      <Card>
+        <CardHeader>
+          <CardTitle>Percentiles</CardTitle>
+          <CardDescription>
+            p75 is the figure Core Web Vitals are judged on. filter-to-results runs from a
+            filter, sort or search change to the new list being rendered.
+          </CardDescription>
+        </CardHeader>
+        <CardContent>
+          {vitals.length === 0 ? (
+            <p className="text-muted-foreground">No measurements yet.</p>
+          ) : (
+            <table className="w-full text-sm">
+              <thead className="text-left text-muted-foreground">
+                <tr>
+                  <th className="py-2">Metric</th>
+                  <th>Samples</th>
+                  <th>p50</th>
+                  <th>p75</th>
+                  <th>p95</th>
+                  <th>p99</th>
+                  <th>Good / NI / Poor</th>
+                </tr>
+              </thead>
+              <tbody>
+                {vitals.map((vital) => (
+                  <tr key={vital.name} className="border-t">
+                    <td className="py-2 font-medium">{vital.name}</td>
+                    <td>{vital.count}</td>
+                    <td>{format(vital.name, vital.p50)}</td>
+                    <td>{format(vital.name, vital.p75)}</td>
+                    <td>{format(vital.name, vital.p95)}</td>
+                    <td>{format(vital.name, vital.p99)}</td>
+                    <td>
+                      {vital.ratings.good} / {vital.ratings["needs-improvement"]} / {vital.ratings.poor}
+                    </td>
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+          )}
+        </CardContent>
+      </Card>
+    </div>
+  );
+}
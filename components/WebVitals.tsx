@@ -0,0 +1,19 @@
+"use client";
+
+import { useReportWebVitals } from "next/web-vitals";
+import { VITAL_NAMES, type VitalName } from "@/lib/vitals/metrics";
+import { reportVital } from "@/lib/vitals/report";
+
+export function WebVitals() {
+  useReportWebVitals((metric) => {
+    // Next also reports its own Next.js-* timings; only keep the web vitals.
+    if (!VITAL_NAMES.includes(metric.name as VitalName)) return;
+    reportVital({
+      name: metric.name as VitalName,
+      value: metric.value,
+      rating: metric.rating,
+    });
+  });
+
+  return null;
+}
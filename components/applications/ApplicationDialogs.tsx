@@ -0,0 +1,87 @@
+"use client";
+
+import { createContext, useCallback, useContext, useMemo, useState } from "react";
+import dynamic from "next/dynamic";
+import type { JobApplication } from "@prisma/client";
+import type { UpdateApplicationInput } from "@/lib/zod/application.schema";
+
+// Loaded on first use so the form (react-hook-form + zod resolver) stays out
+// of the initial bundle and hydration of the grid.
+const ApplicationForm = dynamic(
+  () => import("./ApplicationForm").then((mod) => mod.ApplicationForm),
+  { ssr: false }
+);
+const DeleteConfirmDialog = dynamic(
+  () => import("./DeleteConfirmDialog").then((mod) => mod.DeleteConfirmDialog),
+  { ssr: false }
+);
+
+type DialogKind = "edit" | "delete";
+
+interface ApplicationDialogsContextValue {
+  openEdit: (application: JobApplication) => void;
+  openDelete: (application: JobApplication) => void;
+}
+
+const ApplicationDialogsContext = createContext<ApplicationDialogsContextValue | null>(null);
+
+export function useApplicationDialogs() {
+  const context = useContext(ApplicationDialogsContext);
+  if (!context) {
+    throw new Error("useApplicationDialogs must be used within ApplicationDialogsProvider");
+  }
+  return context;
+}
+
+/**
+ * Hosts a single edit dialog and a single delete dialog for every card in the
+ * grid, instead of one pair per card.
+ */
+export function ApplicationDialogsProvider({ children }: { children: React.ReactNode }) {
+  const [target, setTarget] = useState<JobApplication | null>(null);
+  const [openDialog, setOpenDialog] = useState<DialogKind | null>(null);
+  const [mounted, setMounted] = useState<Record<DialogKind, boolean>>({ edit: false, delete: false });
+
+  const open = useCallback((kind: DialogKind, application: JobApplication) => {
+    setTarget(application);
+    setOpenDialog(kind);
+    setMounted((current) => (current[kind] ? current : { ...current, [kind]: true }));
+  }, []);
+
+  const value = useMemo(
+    () => ({
+      openEdit: (application: JobApplication) => open("edit", application),
+      openDelete: (application: JobApplication) => open("delete", application),
+    }),
+    [open]
+  );
+
+  // Keep `target` while closing so the dialog content doesn't blank out
+  // during the exit animation.
+  const handleOpenChange = (kind: DialogKind) => (isOpen: boolean) => {
+    setOpenDialog(isOpen ? kind : null);
+  };
+
+  return (
+    <ApplicationDialogsContext.Provider value={value}>
+      {children}
+
+      {mounted.delete && target && (
+        <DeleteConfirmDialog
+          id={target.id}
+          companyName={target.companyName}
+          open={openDialog === "delete"}
+          onOpenChange={handleOpenChange("delete")}
+        />
+      )}
+
+      {mounted.edit && target && (
+        <ApplicationForm
+          open={openDialog === "edit"}
+          onOpenChange={handleOpenChange("edit")}
+          defaultValues={target as unknown as UpdateApplicationInput} // Cast because Prisma types vs Zod types
+        />
+      )}
+    </ApplicationDialogsContext.Provider>
+  );
+}
@@ -11,25 +11,48 @@ import {
 import { APPLICATION_STATUSES } from "@/lib/zod/application.schema";
 import { useRouter, useSearchParams } from "next/navigation";
 import { useTransition } from "react";
-import { Search } from "lucide-react";
+import { Download, Loader2, Search } from "lucide-react";
+import { Button } from "@/components/ui/button";
+import { useDebouncedCallback } from "@/hooks/use-debounced-callback";
+import { SEARCH_DEBOUNCE_MS, SEARCH_MIN_LENGTH } from "@/lib/constants/search";
+import { markFilterChange } from "@/lib/vitals/report";
 
 export function ApplicationFilters() {
   const router = useRouter();
   const searchParams = useSearchParams();
-  const [, startTransition] = useTransition();
+  const [isPending, startTransition] = useTransition();
 
-  const handleSearch = (term: string) => {
+  const applySearch = (term: string) => {
     const params = new URLSearchParams(searchParams);
     if (term) {
       params.set("search", term);
     } else {
       params.delete("search");
     }
+    // Skip the round-trip if the effective query did not change
+    if (params.get("search") === searchParams.get("search")) return;
+    // A newer router.replace supersedes this one, so late responses for
+    // earlier terms are discarded rather than rendered over fresher results.
+    markFilterChange();
     startTransition(() => {
       router.replace(`?${params.toString()}`);
     });
   };
 
+  const [debouncedSearch, cancelSearch] = useDebouncedCallback(applySearch, SEARCH_DEBOUNCE_MS);
+
+  const handleSearch = (value: string) => {
+    const term = value.trim();
+    if (term.length < SEARCH_MIN_LENGTH) {
+      // An empty or too-short box searches for nothing, so restore the full
+      // list straight away rather than keep showing the previous term's results
+      cancelSearch();
+      applySearch("");
+    } else {
+      debouncedSearch(term);
+    }
+  };
+
   const handleStatusFilter = (status: string) => {
     const params = new URLSearchParams(searchParams);
     if (status && status !== "ALL") {
@@ -37,6 +60,7 @@ export function ApplicationFilters() {
     } else {
       params.delete("status");
     }
+    markFilterChange();
     startTransition(() => {
       router.replace(`?${params.toString()}`);
     });
@@ -56,7 +80,11 @@ export function ApplicationFilters() {
     } else if (sort === "company_desc") {
       params.set("sortBy", "companyName");
       params.set("sortOrder", "desc");
+    } else if (sort === "relevance") {
+      params.set("sortBy", "relevance");
+      params.delete("sortOrder");
     }
+    markFilterChange();
     startTransition(() => {
       router.replace(`?${params.toString()}`);
     });
@@ -67,18 +95,22 @@ export function ApplicationFilters() {
       <div className="relative flex-1">
         <Search className="absolute left-2.5 top-2.5 h-4 w-4 text-muted-foreground" />
         <Input
-          placeholder="Search companies or roles..."
+          aria-label="Search applications"
+          placeholder="Search companies, roles, locations or notes..."
           className="pl-9"
           defaultValue={searchParams.get("search")?.toString()}
           onChange={(e) => handleSearch(e.target.value)}
         />
+        {isPending && (
+          <Loader2 className="absolute right-2.5 top-2.5 h-4 w-4 animate-spin text-muted-foreground" />
+        )}
       </div>
       <div className="flex gap-2 w-full sm:w-auto">
         <Select
           defaultValue={searchParams.get("status") || "ALL"}
           onValueChange={handleStatusFilter}
         >
-          <SelectTrigger className="w-full sm:w-[150px]">
+          <SelectTrigger className="w-full sm:w-[150px]" aria-label="Filter by status">
             <SelectValue placeholder="Filter by status" />
           </SelectTrigger>
           <SelectContent>
@@ -93,13 +125,15 @@ export function ApplicationFilters() {
 
         <Select
           defaultValue={
-            searchParams.get("sortBy") === "companyName"
-              ? `company_${searchParams.get("sortOrder") || "asc"}`
-              : `date_${searchParams.get("sortOrder") || "desc"}`
+            searchParams.get("sortBy") === "relevance"
+              ? "relevance"
+              : searchParams.get("sortBy") === "companyName"
+                ? `company_${searchParams.get("sortOrder") || "asc"}`
+                : `date_${searchParams.get("sortOrder") || "desc"}`
           }
           onValueChange={handleSortChange}
         >
-          <SelectTrigger className="w-full sm:w-[150px]">
+          <SelectTrigger className="w-full sm:w-[150px]" aria-label="Sort applications">
             <SelectValue placeholder="Sort by" />
           </SelectTrigger>
           <SelectContent>
@@ -107,8 +141,19 @@ export function ApplicationFilters() {
             <SelectItem value="date_asc">Oldest First</SelectItem>
             <SelectItem value="company_asc">Company (A-Z)</SelectItem>
             <SelectItem value="company_desc">Company (Z-A)</SelectItem>
+            <SelectItem value="relevance">Best Match</SelectItem>
           </SelectContent>
         </Select>
+
+        <Button variant="outline" size="icon" className="shrink-0" asChild>
+          <a
+            href={`/api/applications/export?${searchParams.toString()}`}
+            download
+            aria-label="Export applications as CSV"
+          >
+            <Download className="h-4 w-4" />
+          </a>
+        </Button>
       </div>
     </div>
   );
@@ -1,6 +1,7 @@
 "use client";
 
-import { useState, useTransition, useEffect } from "react";
+import { useEffect, useRef } from "react";
+import type { JobApplication } from "@prisma/client";
 import { useForm } from "react-hook-form";
 import { zodResolver } from "@hookform/resolvers/zod";
 import {
@@ -35,9 +36,17 @@ import {
   type CreateApplicationInput,
   type UpdateApplicationInput,
 } from "@/lib/zod/application.schema";
-import { createApplication, updateApplication } from "@/app/actions/application.actions";
-import { Loader2 } from "lucide-react";
+import { createApplication, updateApplication, type ActionState } from "@/app/actions/application.actions";
+import { optimisticId } from "@/lib/optimistic/applications";
 import { format } from "date-fns";
+import { useApplicationMutations } from "./ApplicationMutations";
+
+// A submission the server refused, put back in the form when it reopens.
+interface RejectedSubmission {
+  id?: string;
+  values: CreateApplicationInput;
+  result: ActionState<unknown>;
+}
 
 interface ApplicationFormProps {
   open: boolean;
@@ -50,10 +59,15 @@ export function ApplicationForm({
   onOpenChange,
   defaultValues,
 }: ApplicationFormProps) {
-  const [isPending, startTransition] = useTransition();
-  const [serverError, setServerError] = useState<string | null>(null);
+  const { mutate } = useApplicationMutations();
 
   const isEditing = !!defaultValues;
+  const rejected = useRef<RejectedSubmission | null>(null);
+  // What the dialog shows now, for failures that arrive after it has closed.
+  const showing = useRef({ open, id: defaultValues?.id });
+  useEffect(() => {
+    showing.current = { open, id: defaultValues?.id };
+  });
 
   const form = useForm<CreateApplicationInput>({
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -72,7 +86,15 @@ export function ApplicationForm({
   // Reset form when dialog opens/closes or defaultValues change
   useEffect(() => {
     if (open) {
-      if (defaultValues) {
+      const restored = rejected.current;
+      rejected.current = null;
+      if (restored && restored.id === defaultValues?.id) {
+        form.reset(restored.values);
+        form.setError("root.serverError", { message: restored.result.error });
+        Object.entries(restored.result.fieldErrors ?? {}).forEach(([field, errors]) => {
+          form.setError(field as keyof CreateApplicationInput, { message: errors[0] });
+        });
+      } else if (defaultValues) {
         form.reset({
           ...defaultValues,
           // Ensure dates are dates if they come as strings, though types say Date
@@ -92,39 +114,42 @@ export function ApplicationForm({
     }
   }, [open, defaultValues, form]);
 
-  const handleOpenChange = (newOpen: boolean) => {
-    if (newOpen) {
-      setServerError(null);
-    }
-    onOpenChange(newOpen);
-  };
-
+  // Closes straight away: the grid shows the change while the action runs,
+  // and ApplicationMutationsProvider reports it if the server refuses. The
+  // form then reopens with what was typed and the server's errors, unless
+  // it has since been opened again or moved on to another application.
   const onSubmit = (data: CreateApplicationInput) => {
-    setServerError(null);
-    startTransition(async () => {
-      let result;
-      if (isEditing && defaultValues) {
-        result = await updateApplication({ ...data, id: defaultValues.id });
-      } else {
-        result = await createApplication(data);
-      }
-
-      if (result.success) {
-        onOpenChange(false);
-      } else {
-        setServerError(result.error || "An unexpected error occurred");
-        // If there are field errors, set them in the form
-        if (result.fieldErrors) {
-          Object.entries(result.fieldErrors).forEach(([field, errors]) => {
-            form.setError(field as keyof CreateApplicationInput, { message: errors[0] });
-          });
-        }
-      }
-    });
+    const id = defaultValues?.id;
+    const reopen = (result: ActionState<unknown>) => {
+      if (showing.current.open || showing.current.id !== id) return;
+      rejected.current = { id, values: data, result };
+      onOpenChange(true);
+    };
+    const now = new Date();
+    if (isEditing && defaultValues) {
+      const application = { ...defaultValues, ...data, updatedAt: now } as JobApplication;
+      mutate(
+        { type: "update", application },
+        () => updateApplication({ ...data, id: defaultValues.id }),
+        data.companyName,
+        reopen
+      );
+    } else {
+      const application: JobApplication = {
+        ...data,
+        id: optimisticId(),
+        salaryRange: data.salaryRange ?? null,
+        notes: data.notes ?? null,
+        createdAt: now,
+        updatedAt: now,
+      };
+      mutate({ type: "create", application }, () => createApplication(data), data.companyName, reopen);
+    }
+    onOpenChange(false);
   };
 
   return (
-    <Dialog open={open} onOpenChange={handleOpenChange}>
+    <Dialog open={open} onOpenChange={onOpenChange}>
       <DialogContent className="sm:max-w-[500px] max-h-[90vh] overflow-y-auto">
         <DialogHeader>
           <DialogTitle>{isEditing ? "Edit Application" : "New Application"}</DialogTitle>
@@ -137,9 +162,9 @@ export function ApplicationForm({
 
         <Form {...form}>
           <form onSubmit={form.handleSubmit(onSubmit)} className="space-y-4">
-            {serverError && (
+            {form.formState.errors.root?.serverError && (
               <div className="bg-destructive/15 text-destructive text-sm p-3 rounded-md font-medium">
-                {serverError}
+                {form.formState.errors.root.serverError.message}
               </div>
             )}
 
@@ -277,12 +302,10 @@ export function ApplicationForm({
                 type="button"
                 variant="outline"
                 onClick={() => onOpenChange(false)}
-                disabled={isPending}
               >
                 Cancel
               </Button>
-              <Button type="submit" disabled={isPending}>
-                {isPending && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
+              <Button type="submit">
                 {isEditing ? "Update Application" : "Create Application"}
               </Button>
             </DialogFooter>
@@ -0,0 +1,146 @@
+"use client";
+
+import { useCallback, useEffect, useMemo, useRef, useState, useTransition } from "react";
+import type { JobApplication } from "@prisma/client";
+import { Button } from "@/components/ui/button";
+import { getApplications } from "@/app/actions/application.actions";
+import { applyMutation, isOptimistic, mutationTargets } from "@/lib/optimistic/applications";
+import type { FilterInput } from "@/lib/zod/application.schema";
+import { ApplicationCard } from "./ApplicationCard";
+import { ApplicationDialogsProvider } from "./ApplicationDialogs";
+import { useApplicationMutations } from "./ApplicationMutations";
+import { BulkActionsBar } from "./BulkActionsBar";
+import { EmptyState } from "./EmptyState";
+import { VirtualApplicationGrid } from "./VirtualApplicationGrid";
+import { Loader2 } from "lucide-react";
+
+// Below this many cards the plain grid is cheap enough to render in full.
+const VIRTUALIZE_THRESHOLD = 60;
+
+interface ApplicationGridProps {
+  filters: FilterInput;
+  initialItems: JobApplication[];
+  initialCursor: string | null;
+}
+
+export function ApplicationGrid({ filters, initialItems, initialCursor }: ApplicationGridProps) {
+  const [items, setItems] = useState(initialItems);
+  const [cursor, setCursor] = useState(initialCursor);
+  const [prevInitialItems, setPrevInitialItems] = useState(initialItems);
+  const [isPending, startTransition] = useTransition();
+  const sentinelRef = useRef<HTMLDivElement>(null);
+  const { pending } = useApplicationMutations();
+
+  // A server re-render (e.g. after a mutation) hands us a new first page;
+  // drop the pages we appended so the list reflects the fresh data.
+  if (initialItems !== prevInitialItems) {
+    setPrevInitialItems(initialItems);
+    setItems(initialItems);
+    setCursor(initialCursor);
+  }
+
+  const loadMore = () => {
+    if (!cursor || isPending) return;
+    startTransition(async () => {
+      const page = await getApplications({ ...filters, cursor });
+      setItems((current) => {
+        const seen = new Set(current.map((app) => app.id));
+        return [...current, ...page.items.filter((app) => !seen.has(app.id))];
+      });
+      setCursor(page.nextCursor);
+    });
+  };
+
+  // What the list will be once in-flight mutations land.
+  const visibleItems = useMemo(
+    () => pending.reduce((list, mutation) => applyMutation(list, mutation, { filters, complete: !cursor }), items),
+    [items, pending, filters, cursor]
+  );
+  const pendingIds = useMemo(() => {
+    const ids = new Set(pending.flatMap(mutationTargets));
+    visibleItems.filter(isOptimistic).forEach((app) => ids.add(app.id));
+    return ids;
+  }, [pending, visibleItems]);
+
+  // Selection for bulk actions, limited to cards still on screen.
+  const [selected, setSelected] = useState<Set<string>>(() => new Set());
+  const selectable = useMemo(
+    () => visibleItems.filter((app) => !pendingIds.has(app.id)).map((app) => app.id),
+    [visibleItems, pendingIds]
+  );
+  const selectedIds = useMemo(() => selectable.filter((id) => selected.has(id)), [selectable, selected]);
+  const selectedSet = useMemo(() => new Set(selectedIds), [selectedIds]);
+
+  const toggleSelected = useCallback((id: string) => {
+    setSelected((current) => {
+      const next = new Set(current);
+      if (!next.delete(id)) next.add(id);
+      return next;
+    });
+  }, []);
+  const clearSelection = useCallback(() => setSelected(new Set()), []);
+
+  // Infinite scroll: fetch the next page once the sentinel nears the viewport.
+  useEffect(() => {
+    const sentinel = sentinelRef.current;
+    if (!sentinel || !cursor) return;
+
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+          loadMore();
+        }
+      },
+      { rootMargin: "400px" }
+    );
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  });
+
+  return (
+    <ApplicationDialogsProvider>
+      <div className="mt-6 pb-20 space-y-6">
+        {visibleItems.length === 0 && !cursor ? (
+          <EmptyState />
+        ) : visibleItems.length > VIRTUALIZE_THRESHOLD ? (
+          <VirtualApplicationGrid
+            items={visibleItems}
+            pendingIds={pendingIds}
+            selectedIds={selectedSet}
+            onToggleSelected={toggleSelected}
+          />
+        ) : (
+          <div role="list" className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+            {visibleItems.map((app) => (
+              <ApplicationCard
+                key={app.id}
+                application={app}
+                pending={pendingIds.has(app.id)}
+                selected={selectedSet.has(app.id)}
+                onToggleSelected={toggleSelected}
+              />
+            ))}
+          </div>
+        )}
+
+        {selectedIds.length > 0 && (
+          <BulkActionsBar
+            selectedIds={selectedIds}
+            allSelected={selectedIds.length === selectable.length}
+            onSelectAll={() => setSelected(new Set(selectable))}
+            onClear={clearSelection}
+          />
+        )}
+
+        {cursor && (
+          <div ref={sentinelRef} className="flex justify-center">
+            <Button variant="outline" onClick={loadMore} disabled={isPending}>
+              {isPending && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
+              Load more
+            </Button>
+          </div>
+        )}
+      </div>
+    </ApplicationDialogsProvider>
+  );
+}
@@ -1,6 +1,6 @@
 import { getApplications } from "@/app/actions/application.actions";
-import { ApplicationCard } from "./ApplicationCard";
-import { EmptyState } from "./EmptyState";
+import { ApplicationGrid } from "./ApplicationGrid";
+import { ResultsRendered } from "./ResultsRendered";
 import type { FilterInput } from "@/lib/zod/application.schema";
 
 interface ApplicationListProps {
@@ -17,21 +17,22 @@ export async function ApplicationList({ searchParams }: ApplicationListProps) {
     sortOrder: typeof params.sortOrder === "string" ? (params.sortOrder as FilterInput["sortOrder"]) : "desc",
   };
 
-  const applications = await getApplications(filters);
-
-  if (applications.length === 0) {
-    return (
-      <div className="mt-6">
-        <EmptyState />
-      </div>
-    );
-  }
+  const { items, nextCursor } = await getApplications(filters);
 
+  // Keyed on the filter tuple so a new search/sort starts from a fresh first page
+  // (and ResultsRendered remounts, timing the change that produced it). An
+  // empty page still mounts the grid, which shows the empty state until an
+  // optimistic create lands in it.
+  const key = JSON.stringify(filters);
   return (
-    <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6 mt-6 pb-20">
-      {applications.map((app) => (
-        <ApplicationCard key={app.id} application={app} />
-      ))}
-    </div>
+    <>
+      <ResultsRendered key={`${key}:rendered`} />
+      <ApplicationGrid
+        key={`${key}:grid`}
+        filters={filters}
+        initialItems={items}
+        initialCursor={nextCursor}
+      />
+    </>
   );
 }
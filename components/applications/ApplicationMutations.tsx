@@ -0,0 +1,94 @@
+"use client";
+
+import { createContext, useCallback, useContext, useMemo, useOptimistic, useState, useTransition } from "react";
+import { X } from "lucide-react";
+import type { ActionState } from "@/app/actions/application.actions";
+import { Button } from "@/components/ui/button";
+import type { ApplicationMutation } from "@/lib/optimistic/applications";
+
+interface ApplicationMutationsContextValue {
+  // Mutations sent to the server whose re-rendered page has not arrived yet.
+  pending: ApplicationMutation[];
+  mutate: (
+    mutation: ApplicationMutation,
+    action: () => Promise<ActionState<unknown>>,
+    // Names what changed in the error message, e.g. the company name.
+    subject: string,
+    // Called with the failed result after the rollback, e.g. to reopen a form.
+    onFailure?: (result: ActionState<unknown>) => void
+  ) => void;
+}
+
+const ApplicationMutationsContext = createContext<ApplicationMutationsContextValue | null>(null);
+
+export function useApplicationMutations() {
+  const context = useContext(ApplicationMutationsContext);
+  if (!context) {
+    throw new Error("useApplicationMutations must be used within ApplicationMutationsProvider");
+  }
+  return context;
+}
+
+/**
+ * Shows creates, edits and deletes in the grid as soon as they are
+ * submitted. Each mutation lives in optimistic state for the length of its
+ * transition, which ends once the action has returned and the revalidated
+ * page has rendered: on success the server data replaces the guess, on
+ * failure the guess is dropped (rolled back) and the error is shown here.
+ */
+export function ApplicationMutationsProvider({ children }: { children: React.ReactNode }) {
+  const [pending, addPending] = useOptimistic<ApplicationMutation[], ApplicationMutation>(
+    [],
+    (current, mutation) => [...current, mutation]
+  );
+  const [failure, setFailure] = useState<string | null>(null);
+  const [, startTransition] = useTransition();
+
+  const mutate = useCallback<ApplicationMutationsContextValue["mutate"]>(
+    (mutation, action, subject, onFailure) => {
+      setFailure(null);
+      startTransition(async () => {
+        addPending(mutation);
+        let failed: ActionState<unknown> | undefined;
+        try {
+          const result = await action();
+          if (!result.success) failed = { ...result, error: result.error ?? "An unexpected error occurred" };
+        } catch (thrown) {
+          console.error(thrown);
+          failed = { success: false, error: "Could not reach the server" };
+        }
+        if (failed) {
+          setFailure(`${failed.error} (${subject}). Your change was undone.`);
+          onFailure?.(failed);
+        }
+      });
+    },
+    [addPending]
+  );
+
+  const value = useMemo(() => ({ pending, mutate }), [pending, mutate]);
+
+  return (
+    <ApplicationMutationsContext.Provider value={value}>
+      {children}
+
+      {failure && (
+        <div
+          role="alert"
+          className="fixed bottom-4 right-4 z-50 flex max-w-sm items-start gap-3 rounded-md border border-destructive/50 bg-background p-4 text-sm text-destructive shadow-lg"
+        >
+          <p className="font-medium">{failure}</p>
+          <Button
+            variant="ghost"
+            size="icon"
+            className="h-6 w-6 shrink-0"
+            onClick={() => setFailure(null)}
+            aria-label="Dismiss"
+          >
+            <X className="h-4 w-4" />
+          </Button>
+        </div>
+      )}
+    </ApplicationMutationsContext.Provider>
+  );
+}
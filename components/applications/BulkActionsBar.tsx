@@ -0,0 +1,116 @@
+"use client";
+
+import { useState } from "react";
+import { Trash2 } from "lucide-react";
+import { bulkDelete, bulkUpdateStatus } from "@/app/actions/application.actions";
+import { Button } from "@/components/ui/button";
+import {
+  Dialog,
+  DialogContent,
+  DialogDescription,
+  DialogFooter,
+  DialogHeader,
+  DialogTitle,
+} from "@/components/ui/dialog";
+import {
+  Select,
+  SelectContent,
+  SelectItem,
+  SelectTrigger,
+  SelectValue,
+} from "@/components/ui/select";
+import { STATUS_CONFIG } from "@/lib/constants/status";
+import { APPLICATION_STATUSES, MAX_BULK_IDS, type ApplicationStatus } from "@/lib/zod/application.schema";
+import { useApplicationMutations } from "./ApplicationMutations";
+
+interface BulkActionsBarProps {
+  selectedIds: string[];
+  allSelected: boolean;
+  onSelectAll: () => void;
+  onClear: () => void;
+}
+
+/**
+ * Status change and delete for the cards selected in the grid. Each is one
+ * server action (one transaction, one revalidation) applied optimistically
+ * like a single edit.
+ */
+export function BulkActionsBar({ selectedIds, allSelected, onSelectAll, onClear }: BulkActionsBarProps) {
+  const { mutate } = useApplicationMutations();
+  const [confirmingDelete, setConfirmingDelete] = useState(false);
+  const subject = selectedIds.length === 1 ? "1 application" : `${selectedIds.length} applications`;
+  // The actions reject larger batches; say so before sending one.
+  const tooMany = selectedIds.length > MAX_BULK_IDS;
+
+  const changeStatus = (status: ApplicationStatus) => {
+    const ids = selectedIds;
+    mutate({ type: "bulkUpdateStatus", ids, status }, () => bulkUpdateStatus(ids, status), subject);
+    onClear();
+  };
+
+  const deleteSelected = () => {
+    const ids = selectedIds;
+    mutate({ type: "bulkDelete", ids }, () => bulkDelete(ids), subject);
+    setConfirmingDelete(false);
+    onClear();
+  };
+
+  return (
+    <div
+      role="toolbar"
+      aria-label="Selected applications"
+      className="sticky bottom-4 z-40 flex flex-wrap items-center gap-2 rounded-lg border bg-background/95 p-3 shadow-lg backdrop-blur"
+    >
+      <span className="text-sm font-medium tabular-nums mr-2">{selectedIds.length} selected</span>
+      {!allSelected && (
+        <Button variant="ghost" size="sm" onClick={onSelectAll}>
+          Select all loaded
+        </Button>
+      )}
+      <Button variant="ghost" size="sm" onClick={onClear}>
+        Clear
+      </Button>
+      {tooMany && (
+        <span className="text-sm text-destructive">Select at most {MAX_BULK_IDS} at a time</span>
+      )}
+
+      <div className="flex gap-2 ml-auto">
+        <Select value="" onValueChange={(status) => changeStatus(status as ApplicationStatus)} disabled={tooMany}>
+          <SelectTrigger className="w-[170px]" aria-label="Change status of selected">
+            <SelectValue placeholder="Change status…" />
+          </SelectTrigger>
+          <SelectContent>
+            {APPLICATION_STATUSES.map((status) => (
+              <SelectItem key={status} value={status}>
+                {STATUS_CONFIG[status].label}
+              </SelectItem>
+            ))}
+          </SelectContent>
+        </Select>
+        <Button variant="destructive" onClick={() => setConfirmingDelete(true)} disabled={tooMany}>
+          <Trash2 className="h-4 w-4" />
+          Delete
+        </Button>
+      </div>
+
+      <Dialog open={confirmingDelete} onOpenChange={setConfirmingDelete}>
+        <DialogContent>
+          <DialogHeader>
+            <DialogTitle>Delete Applications</DialogTitle>
+            <DialogDescription>
+              Are you sure you want to delete <strong>{subject}</strong>? This action cannot be undone.
+            </DialogDescription>
+          </DialogHeader>
+          <DialogFooter>
+            <Button variant="outline" onClick={() => setConfirmingDelete(false)}>
+              Cancel
+            </Button>
+            <Button variant="destructive" onClick={deleteSelected}>
+              Delete
+            </Button>
+          </DialogFooter>
+        </DialogContent>
+      </Dialog>
+    </div>
+  );
+}
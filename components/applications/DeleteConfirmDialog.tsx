@@ -1,6 +1,5 @@
 "use client";
 
-import { useTransition } from "react";
 import {
   Dialog,
   DialogContent,
@@ -11,7 +10,7 @@ import {
 } from "@/components/ui/dialog";
 import { Button } from "@/components/ui/button";
 import { deleteApplication } from "@/app/actions/application.actions";
-import { Loader2 } from "lucide-react";
+import { useApplicationMutations } from "./ApplicationMutations";
 
 interface DeleteConfirmDialogProps {
   id: string;
@@ -26,18 +25,12 @@ export function DeleteConfirmDialog({
   open,
   onOpenChange,
 }: DeleteConfirmDialogProps) {
-  const [isPending, startTransition] = useTransition();
+  const { mutate } = useApplicationMutations();
 
+  // The card disappears at once; a failed delete puts it back.
   const handleDelete = () => {
-    startTransition(async () => {
-      const result = await deleteApplication(id);
-      if (result.success) {
-        onOpenChange(false);
-      } else {
-        // In a real app, show toast here
-        console.error(result.error);
-      }
-    });
+    mutate({ type: "delete", id }, () => deleteApplication(id), companyName);
+    onOpenChange(false);
   };
 
   return (
@@ -51,19 +44,10 @@ export function DeleteConfirmDialog({
           </DialogDescription>
         </DialogHeader>
         <DialogFooter>
-          <Button
-            variant="outline"
-            onClick={() => onOpenChange(false)}
-            disabled={isPending}
-          >
+          <Button variant="outline" onClick={() => onOpenChange(false)}>
             Cancel
           </Button>
-          <Button
-            variant="destructive"
-            onClick={handleDelete}
-            disabled={isPending}
-          >
-            {isPending && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
+          <Button variant="destructive" onClick={handleDelete}>
             Delete
           </Button>
         </DialogFooter>
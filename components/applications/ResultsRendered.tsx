@@ -0,0 +1,14 @@
+"use client";
+
+import { useEffect } from "react";
+import { measureResultsRendered } from "@/lib/vitals/report";
+
+// Renders nothing; its effect runs once the list it sits next to has
+// committed, which closes the filter-to-results measurement.
+export function ResultsRendered() {
+  useEffect(() => {
+    measureResultsRendered();
+  }, []);
+
+  return null;
+}
@@ -0,0 +1,24 @@
+import { getStatusCounts } from "@/app/actions/application.actions";
+import { STATUS_CONFIG } from "@/lib/constants/status";
+import { APPLICATION_STATUSES } from "@/lib/zod/application.schema";
+import { cn } from "@/lib/utils";
+
+export async function StatusSummary() {
+  const counts = await getStatusCounts();
+  const total = APPLICATION_STATUSES.reduce((sum, status) => sum + counts[status], 0);
+
+  return (
+    <dl aria-label="Applications by status" className="grid grid-cols-3 sm:grid-cols-6 gap-3">
+      <div className="rounded-lg border bg-card/50 px-4 py-3">
+        <dt className="text-xs text-muted-foreground">Total</dt>
+        <dd className="text-2xl font-semibold tabular-nums">{total}</dd>
+      </div>
+      {APPLICATION_STATUSES.map((status) => (
+        <div key={status} className={cn("rounded-lg border px-4 py-3", STATUS_CONFIG[status].className)}>
+          <dt className="text-xs">{STATUS_CONFIG[status].label}</dt>
+          <dd className="text-2xl font-semibold tabular-nums">{counts[status]}</dd>
+        </div>
+      ))}
+    </dl>
+  );
+}
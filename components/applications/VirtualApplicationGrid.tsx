@@ -0,0 +1,77 @@
+"use client";
+
+import { useEffect, useMemo } from "react";
+import type { JobApplication } from "@prisma/client";
+import { useGridColumns } from "@/hooks/use-grid-columns";
+import { useWindowVirtualizer } from "@/hooks/use-window-virtualizer";
+import { ApplicationCard } from "./ApplicationCard";
+
+// Card height without a salary line; rows are measured once mounted.
+const ESTIMATED_ROW_HEIGHT = 200;
+// Matches the `gap-6` spacing of the static grid.
+const ROW_GAP = 24;
+
+interface VirtualApplicationGridProps {
+  items: JobApplication[];
+  // Cards with a mutation still in flight.
+  pendingIds: Set<string>;
+  selectedIds: Set<string>;
+  onToggleSelected: (id: string) => void;
+}
+
+/**
+ * Windowed version of the card grid: items are chunked into rows of the
+ * current column count and only rows near the viewport are mounted, with
+ * padding standing in for the rest so the page keeps its full scroll height.
+ */
+export function VirtualApplicationGrid({
+  items,
+  pendingIds,
+  selectedIds,
+  onToggleSelected,
+}: VirtualApplicationGridProps) {
+  const columns = useGridColumns();
+
+  const rows = useMemo(() => {
+    const result: JobApplication[][] = [];
+    for (let i = 0; i < items.length; i += columns) {
+      result.push(items.slice(i, i + columns));
+    }
+    return result;
+  }, [items, columns]);
+
+  const { containerRef, measureElement, resetMeasurements, start, end, paddingTop, paddingBottom } =
+    useWindowVirtualizer<HTMLDivElement>({
+      count: rows.length,
+      estimateSize: ESTIMATED_ROW_HEIGHT,
+      gap: ROW_GAP,
+    });
+
+  useEffect(() => {
+    resetMeasurements();
+  }, [columns, resetMeasurements]);
+
+  return (
+    <div ref={containerRef} role="list" className="flex flex-col gap-6" style={{ paddingTop, paddingBottom }}>
+      {rows.slice(start, end).map((row, i) => (
+        <div
+          key={row[0].id}
+          data-index={start + i}
+          ref={measureElement}
+          role="none"
+          className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6"
+        >
+          {row.map((app) => (
+            <ApplicationCard
+              key={app.id}
+              application={app}
+              pending={pendingIds.has(app.id)}
+              selected={selectedIds.has(app.id)}
+              onToggleSelected={onToggleSelected}
+            />
+          ))}
+        </div>
+      ))}
+    </div>
+  );
+}
@@ -0,0 +1,40 @@
+import { useCallback, useEffect, useRef } from "react";
+
+/**
+ * Returns a debounced version of `callback` plus a `cancel` function.
+ * Each call resets the timer, so only the last call in a burst runs; the
+ * latest `callback` is always used, and pending calls are dropped on unmount.
+ */
+export function useDebouncedCallback<Args extends unknown[]>(
+  callback: (...args: Args) => void,
+  delay: number
+) {
+  const callbackRef = useRef(callback);
+  const timeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+  useEffect(() => {
+    callbackRef.current = callback;
+  });
+
+  const cancel = useCallback(() => {
+    if (timeoutRef.current) {
+      clearTimeout(timeoutRef.current);
+      timeoutRef.current = null;
+    }
+  }, []);
+
+  useEffect(() => cancel, [cancel]);
+
+  const debounced = useCallback(
+    (...args: Args) => {
+      cancel();
+      timeoutRef.current = setTimeout(() => {
+        timeoutRef.current = null;
+        callbackRef.current(...args);
+      }, delay);
+    },
+    [cancel, delay]
+  );
+
+  return [debounced, cancel] as const;
+}
@@ -0,0 +1,21 @@
+import { useSyncExternalStore } from "react";
+
+// Mirrors the grid's `grid-cols-1 md:grid-cols-2 lg:grid-cols-3` breakpoints.
+const BREAKPOINTS = [
+  { query: "(min-width: 1024px)", columns: 3 },
+  { query: "(min-width: 768px)", columns: 2 },
+];
+
+function getColumns() {
+  return BREAKPOINTS.find(({ query }) => window.matchMedia(query).matches)?.columns ?? 1;
+}
+
+function subscribe(onChange: () => void) {
+  const lists = BREAKPOINTS.map(({ query }) => window.matchMedia(query));
+  lists.forEach((list) => list.addEventListener("change", onChange));
+  return () => lists.forEach((list) => list.removeEventListener("change", onChange));
+}
+
+export function useGridColumns() {
+  return useSyncExternalStore(subscribe, getColumns, () => 1);
+}
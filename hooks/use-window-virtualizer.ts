@@ -0,0 +1,126 @@
+import { useCallback, useEffect, useMemo, useRef, useState } from "react";
+
+interface WindowVirtualizerOptions {
+  count: number;
+  estimateSize: number;
+  gap: number;
+  overscan?: number;
+}
+
+// Index of the last row whose start offset is <= position.
+function findRow(offsets: number[], count: number, position: number) {
+  let low = 0;
+  let high = count - 1;
+  while (low < high) {
+    const mid = Math.ceil((low + high) / 2);
+    if (offsets[mid] <= position) low = mid;
+    else high = mid - 1;
+  }
+  return Math.max(low, 0);
+}
+
+/**
+ * Windowing for a vertical list of rows scrolled by the page itself. Rows are
+ * measured as they mount (falling back to `estimateSize`), and only the rows
+ * intersecting the viewport plus `overscan` rows on either side are returned.
+ */
+export function useWindowVirtualizer<T extends HTMLElement>({
+  count,
+  estimateSize,
+  gap,
+  overscan = 2,
+}: WindowVirtualizerOptions) {
+  const containerRef = useRef<T>(null);
+  const sizesRef = useRef(new Map<number, number>());
+  const [version, setVersion] = useState(0);
+  const [range, setRange] = useState({ start: 0, end: Math.min(count, overscan * 2 + 1) });
+
+  // offsets[i] is the start of row i; offsets[count] is the end plus one gap.
+  const offsets = useMemo(() => {
+    const result = new Array<number>(count + 1);
+    result[0] = 0;
+    for (let i = 0; i < count; i++) {
+      result[i + 1] = result[i] + (sizesRef.current.get(i) ?? estimateSize) + gap;
+    }
+    return result;
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [count, estimateSize, gap, version]);
+
+  const updateRange = useCallback(() => {
+    const container = containerRef.current;
+    if (!container || count === 0) return;
+
+    const top = -container.getBoundingClientRect().top;
+    const start = Math.max(findRow(offsets, count, top) - overscan, 0);
+    const end = Math.min(findRow(offsets, count, top + window.innerHeight) + 1 + overscan, count);
+
+    setRange((current) =>
+      current.start === start && current.end === end ? current : { start, end }
+    );
+  }, [offsets, count, overscan]);
+
+  useEffect(() => {
+    let frame = 0;
+    const onScroll = () => {
+      cancelAnimationFrame(frame);
+      frame = requestAnimationFrame(updateRange);
+    };
+
+    updateRange();
+    window.addEventListener("scroll", onScroll, { passive: true });
+    window.addEventListener("resize", onScroll);
+    return () => {
+      cancelAnimationFrame(frame);
+      window.removeEventListener("scroll", onScroll);
+      window.removeEventListener("resize", onScroll);
+    };
+  }, [updateRange]);
+
+  const observerRef = useRef<ResizeObserver | null>(null);
+
+  // Created lazily: row ref callbacks run before this hook's effects.
+  const getObserver = useCallback(() => {
+    observerRef.current ??= new ResizeObserver((entries) => {
+      let changed = false;
+      for (const entry of entries) {
+        const index = Number((entry.target as HTMLElement).dataset.index);
+        const size = entry.borderBoxSize?.[0]?.blockSize ?? entry.contentRect.height;
+        if (sizesRef.current.get(index) !== size) {
+          sizesRef.current.set(index, size);
+          changed = true;
+        }
+      }
+      if (changed) setVersion((v) => v + 1);
+    });
+    return observerRef.current;
+  }, []);
+
+  useEffect(() => () => observerRef.current?.disconnect(), []);
+
+  // Ref callback for rendered rows; each row needs a `data-index` attribute.
+  const measureElement = useCallback(
+    (node: HTMLElement | null) => {
+      if (!node) return;
+      const observer = getObserver();
+      observer.observe(node);
+      return () => observer.unobserve(node);
+    },
+    [getObserver]
+  );
+
+  // Row contents change when the column count changes; re-measure from scratch.
+  const resetMeasurements = useCallback(() => {
+    sizesRef.current.clear();
+    setVersion((v) => v + 1);
+  }, []);
+
+  return {
+    containerRef,
+    measureElement,
+    resetMeasurements,
+    start: range.start,
+    end: Math.min(range.end, count),
+    paddingTop: offsets[Math.min(range.start, count)] ?? 0,
+    paddingBottom: count > 0 ? offsets[count] - offsets[Math.min(range.end, count)] : 0,
+  };
+}
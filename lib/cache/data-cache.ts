@@ -0,0 +1,113 @@
+import type { JobApplication } from "@prisma/client";
+import { revalidateTag, unstable_cache, updateTag } from "next/cache";
+import * as repository from "@/lib/repositories/application.repository";
+import type { ApplicationPage, StatusCounts } from "@/lib/repositories/application.repository";
+import { analytics, type Analytics } from "@/lib/repositories/analytics.repository";
+import { toMatchQuery } from "@/lib/repositories/search";
+import { DEFAULT_PAGE_SIZE, type FilterInput } from "@/lib/zod/application.schema";
+import {
+  allApplicationsTag,
+  applicationTag,
+  listTags,
+  statusListTag,
+  writeTags,
+  type ApplicationWrite,
+} from "@/lib/cache/tags";
+
+// Instances built from the same .next directory share the data cache, so
+// entries are keyed by database; e2e workers each run against their own.
+const DATABASE_KEY = process.env.DATABASE_URL ?? "";
+
+// The data cache stores JSON, so dates come back as strings.
+function revive(application: JobApplication): JobApplication {
+  return {
+    ...application,
+    applicationDate: new Date(application.applicationDate),
+    createdAt: new Date(application.createdAt),
+    updatedAt: new Date(application.updatedAt),
+  };
+}
+
+// Filters that produce the same query map to the same key, e.g. "Acme " and
+// "acme" both search for "acme"*. A term that can match nothing ("--") keys
+// as "", apart from the unfiltered list.
+export function cacheKey(filters: FilterInput): string {
+  const search = filters.search?.trim() ? toMatchQuery(filters.search) ?? "" : null;
+  return JSON.stringify([
+    filters.status ?? null,
+    search,
+    filters.sortBy === "relevance" && !search ? "applicationDate" : filters.sortBy ?? "applicationDate",
+    filters.sortOrder ?? "desc",
+    filters.cursor ?? null,
+    filters.limit ?? DEFAULT_PAGE_SIZE,
+  ]);
+}
+
+// List lookups made by this instance and how many of them had to load the
+// page; the rest were served by the data cache.
+const listStats = { lookups: 0, loads: 0 };
+
+export async function cachedFindAll(filters: FilterInput): Promise<ApplicationPage> {
+  listStats.lookups++;
+  const page = await unstable_cache(
+    () => {
+      listStats.loads++;
+      return repository.findAll(filters);
+    },
+    ["applications", DATABASE_KEY, cacheKey(filters)],
+    { tags: [...listTags(filters), allApplicationsTag] }
+  )();
+  return { ...page, items: page.items.map(revive) };
+}
+
+export async function cachedFindById(id: string): Promise<JobApplication | null> {
+  const application = await unstable_cache(
+    () => repository.findById(id),
+    ["application", DATABASE_KEY, id],
+    { tags: [applicationTag(id), allApplicationsTag] }
+  )();
+  return application ? revive(application) : null;
+}
+
+// Every write that can move a count (create, delete, status change) also
+// expires the unfiltered list, so the counts share its tag.
+export async function cachedStatusCounts(): Promise<StatusCounts> {
+  return unstable_cache(
+    () => repository.statusCounts(),
+    ["status-counts", DATABASE_KEY],
+    { tags: [statusListTag(null), allApplicationsTag] }
+  )();
+}
+
+// Same writes as the counts, plus an hourly refresh so the week window moves on.
+export async function cachedAnalytics(): Promise<Analytics> {
+  return unstable_cache(
+    () => analytics(),
+    ["analytics", DATABASE_KEY],
+    { tags: [statusListTag(null), allApplicationsTag], revalidate: 3600 }
+  )();
+}
+
+export function getCacheStats() {
+  const { lookups, loads } = listStats;
+  return { hits: lookups - loads, misses: loads, hitRate: lookups === 0 ? 0 : (lookups - loads) / lookups };
+}
+
+export function invalidateWrite(write: ApplicationWrite) {
+  invalidateWrites([write]);
+}
+
+// Expires each tag once however many rows share it, so a bulk write costs
+// one revalidation of each affected list.
+export function invalidateWrites(writes: ApplicationWrite[]) {
+  new Set(writes.flatMap(writeTags)).forEach((tag) => updateTag(tag));
+}
+
+// For route handlers, where updateTag (Server Actions only) is unavailable.
+export function invalidateStatusLists(statuses: string[]) {
+  [null, ...statuses].forEach((status) => revalidateTag(statusListTag(status), { expire: 0 }));
+}
+
+export function invalidateAll() {
+  revalidateTag(allApplicationsTag, { expire: 0 });
+}
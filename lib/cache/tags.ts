@@ -0,0 +1,33 @@
+import type { FilterInput } from "@/lib/zod/application.schema";
+
+// Every cached read is tagged with the narrowest tags that a write can hit.
+// A list is tagged by its status filter ("all" when unfiltered); a single
+// application read by its id.
+
+// Carried by every cached read, for resets that replace the whole table.
+export const allApplicationsTag = "applications";
+
+export const applicationTag = (id: string) => `application:${id}`;
+
+export const statusListTag = (status?: string | null) => `applications:status:${status ?? "all"}`;
+
+export function listTags(filters: Pick<FilterInput, "status">): string[] {
+  return [statusListTag(filters.status)];
+}
+
+export interface ApplicationWrite {
+  id: string;
+  // Status of the row before and/or after the write; a row leaving or
+  // entering a status changes every list filtered on it.
+  statuses: (string | null | undefined)[];
+}
+
+export function writeTags({ id, statuses }: ApplicationWrite): string[] {
+  const tags = new Set([applicationTag(id)]);
+  const known = statuses.filter((status): status is string => !!status);
+  if (known.length > 0) {
+    tags.add(statusListTag(null));
+    known.forEach((status) => tags.add(statusListTag(status)));
+  }
+  return [...tags];
+}
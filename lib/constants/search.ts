@@ -0,0 +1,5 @@
+// Wait this long after the last keystroke before querying the server.
+export const SEARCH_DEBOUNCE_MS = 300;
+
+// Shorter terms are too broad to be worth a query; they clear the search.
+export const SEARCH_MIN_LENGTH = 2;
@@ -0,0 +1,42 @@
+type Env = Record<string, string | undefined>;
+
+export interface PoolSettings {
+  connectionLimit: number;
+  poolTimeoutS: number;
+  // Set behind a transaction-mode pooler (PgBouncer, Supavisor) so Prisma
+  // stops relying on named prepared statements.
+  pgbouncer: boolean;
+}
+
+function positiveInteger(name: string, fallback: number, env: Env): number {
+  const value = Number(env[name] ?? fallback);
+  if (!Number.isInteger(value) || value < 1) {
+    throw new Error(`${name} must be a positive integer; got "${env[name]}"`);
+  }
+  return value;
+}
+
+export function poolSettings(env: Env = process.env): PoolSettings {
+  return {
+    connectionLimit: positiveInteger("DATABASE_POOL_SIZE", 10, env),
+    poolTimeoutS: positiveInteger("DATABASE_POOL_TIMEOUT_S", 10, env),
+    pgbouncer: env.DATABASE_PGBOUNCER === "1",
+  };
+}
+
+/**
+ * Prisma sizes its connection pool from the connection string. Parameters
+ * already present in DATABASE_URL win over the settings.
+ */
+export function withPoolSettings(url: string, settings: PoolSettings): string {
+  const parsed = new URL(url);
+  const defaults: Record<string, string> = {
+    connection_limit: String(settings.connectionLimit),
+    pool_timeout: String(settings.poolTimeoutS),
+    ...(settings.pgbouncer ? { pgbouncer: "true" } : {}),
+  };
+  for (const [key, value] of Object.entries(defaults)) {
+    if (!parsed.searchParams.has(key)) parsed.searchParams.set(key, value);
+  }
+  return parsed.toString();
+}
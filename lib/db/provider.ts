@@ -0,0 +1,9 @@
+export type DatabaseProvider = "sqlite" | "postgresql";
+
+/**
+ * Which backend DATABASE_URL points at. The generated Prisma client must
+ * match: build with `pnpm build:postgres` for a postgres:// URL.
+ */
+export function databaseProvider(url: string | undefined = process.env.DATABASE_URL): DatabaseProvider {
+  return url && /^postgres(ql)?:\/\//.test(url) ? "postgresql" : "sqlite";
+}
@@ -0,0 +1,71 @@
+type Env = Record<string, string | undefined>;
+
+const JOURNAL_MODES = ["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"] as const;
+
+// Only settings that reach every pooled connection: Prisma has no
+// per-connection hook, so per-connection pragmas such as synchronous,
+// cache_size or mmap_size would only apply to whichever connection ran them.
+export interface SqliteSettings {
+  journalMode: (typeof JOURNAL_MODES)[number];
+  busyTimeoutMs: number;
+}
+
+function choice<T extends string>(name: string, allowed: readonly T[], fallback: T, env: Env): T {
+  const value = (env[name] ?? fallback).toUpperCase();
+  if (!allowed.includes(value as T)) {
+    throw new Error(`${name} must be one of ${allowed.join(", ")}; got "${env[name]}"`);
+  }
+  return value as T;
+}
+
+function integer(name: string, fallback: number, env: Env): number {
+  const value = Number(env[name] ?? fallback);
+  if (!Number.isInteger(value)) {
+    throw new Error(`${name} must be an integer; got "${env[name]}"`);
+  }
+  return value;
+}
+
+export function sqliteSettings(env: Env = process.env): SqliteSettings {
+  return {
+    journalMode: choice("SQLITE_JOURNAL_MODE", JOURNAL_MODES, "WAL", env),
+    busyTimeoutMs: integer("SQLITE_BUSY_TIMEOUT_MS", 5000, env),
+  };
+}
+
+export function isSqliteUrl(url: string | undefined): boolean {
+  return url?.startsWith("file:") ?? false;
+}
+
+/**
+ * Prisma applies the busy timeout to every pooled connection itself when it
+ * is given as socket_timeout (in seconds) on the connection string; an
+ * explicit socket_timeout in DATABASE_URL wins.
+ */
+export function withBusyTimeout(url: string, busyTimeoutMs: number): string {
+  if (/[?&]socket_timeout=/.test(url)) return url;
+  const separator = url.includes("?") ? "&" : "?";
+  return `${url}${separator}socket_timeout=${Math.max(1, Math.ceil(busyTimeoutMs / 1000))}`;
+}
+
+// The busy timeout is not here: withBusyTimeout hands it to Prisma, which
+// sets it on each connection it opens.
+export function pragmaStatements(settings: SqliteSettings): string[] {
+  return [`PRAGMA journal_mode = ${settings.journalMode}`];
+}
+
+interface RawClient {
+  $queryRawUnsafe(query: string): Promise<unknown>;
+}
+
+/**
+ * journal_mode is stored in the database file, so WAL set through any one
+ * connection holds for every connection (and for the scripts and e2e
+ * databases that open the same file).
+ */
+export async function applySqlitePragmas(client: RawClient, settings: SqliteSettings) {
+  // PRAGMA journal_mode returns a row, which $executeRaw rejects on SQLite.
+  for (const statement of pragmaStatements(settings)) {
+    await client.$queryRawUnsafe(statement);
+  }
+}
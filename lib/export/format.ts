@@ -0,0 +1,33 @@
+import type { JobApplication } from "@prisma/client";
+
+// Same column names the importer reads, so an export can be re-imported.
+export const EXPORT_COLUMNS = [
+  "id",
+  "companyName",
+  "jobTitle",
+  "status",
+  "location",
+  "salaryRange",
+  "applicationDate",
+  "notes",
+  "createdAt",
+  "updatedAt",
+] as const satisfies readonly (keyof JobApplication)[];
+
+function csvField(value: unknown): string {
+  if (value === null || value === undefined) return "";
+  const text = value instanceof Date ? value.toISOString() : String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+export function csvHeader(): string {
+  return EXPORT_COLUMNS.join(",") + "\r\n";
+}
+
+export function toCsvRow(application: JobApplication): string {
+  return EXPORT_COLUMNS.map((column) => csvField(application[column])).join(",") + "\r\n";
+}
+
+export function toNdjsonLine(application: JobApplication): string {
+  return JSON.stringify(application) + "\n";
+}
@@ -0,0 +1,117 @@
+import * as repository from "@/lib/repositories/application.repository";
+import { createApplicationSchema, type CreateApplicationInput } from "@/lib/zod/application.schema";
+import { MalformedRecord, type ParsedRecord } from "@/lib/import/parsers";
+
+export const DEFAULT_IMPORT_BATCH_SIZE = 500;
+// Bounds the rows a caller can make us hold and send in one transaction.
+export const MAX_IMPORT_BATCH_SIZE = 5000;
+// Keep the response bounded even when every row of a huge file is invalid.
+const MAX_REPORTED_ERRORS = 1000;
+
+export interface ImportRowError {
+  row: number;
+  error: string;
+  fieldErrors?: Record<string, string[]>;
+}
+
+export interface ImportSummary {
+  total: number;
+  imported: number;
+  failed: number;
+  errors: ImportRowError[];
+  statuses: string[];
+  durationMs: number;
+  rowsPerSecond: number;
+}
+
+interface PendingRow {
+  row: number;
+  data: CreateApplicationInput;
+}
+
+/**
+ * Validates each record with createApplicationSchema and inserts valid rows in
+ * batched transactions. Invalid and malformed rows are reported and skipped; if a batch
+ * insert fails, its rows are retried one by one so a single bad row can't take
+ * the rest of the batch down with it.
+ */
+export async function importApplications(
+  records: AsyncIterable<ParsedRecord>,
+  { batchSize = DEFAULT_IMPORT_BATCH_SIZE }: { batchSize?: number } = {}
+): Promise<ImportSummary> {
+  const startedAt = performance.now();
+  const errors: ImportRowError[] = [];
+  const statuses = new Set<string>();
+  let failed = 0;
+  let imported = 0;
+  let total = 0;
+  let batch: PendingRow[] = [];
+
+  const reportError = (error: ImportRowError) => {
+    failed++;
+    if (errors.length < MAX_REPORTED_ERRORS) errors.push(error);
+  };
+
+  const flush = async () => {
+    if (batch.length === 0) return;
+    const rows = batch;
+    batch = [];
+
+    try {
+      imported += await repository.createMany(rows.map(({ data }) => data));
+      rows.forEach(({ data }) => statuses.add(data.status));
+    } catch {
+      for (const { row, data } of rows) {
+        try {
+          await repository.create(data);
+          imported++;
+          statuses.add(data.status);
+        } catch (error) {
+          console.error(`Failed to import row ${row}:`, error);
+          reportError({ row, error: "Failed to save application" });
+        }
+      }
+    }
+  };
+
+  try {
+    for await (const record of records) {
+      total++;
+      if (record instanceof MalformedRecord) {
+        reportError({ row: total, error: record.error });
+        continue;
+      }
+      const result = createApplicationSchema.safeParse(record);
+      if (!result.success) {
+        reportError({
+          row: total,
+          error: "Validation failed",
+          fieldErrors: result.error.flatten().fieldErrors,
+        });
+        continue;
+      }
+
+      batch.push({ row: total, data: result.data });
+      if (batch.length >= batchSize) await flush();
+    }
+  } catch (error) {
+    // Malformed input: keep what was already parsed, report where it stopped.
+    reportError({
+      row: total + 1,
+      error: error instanceof Error ? error.message : "Failed to parse input",
+    });
+  }
+
+  await flush();
+
+  const durationMs = performance.now() - startedAt;
+  return {
+    total,
+    imported,
+    failed,
+    errors,
+    statuses: [...statuses],
+    durationMs: Math.round(durationMs),
+    rowsPerSecond: durationMs > 0 ? Math.round((imported / durationMs) * 1000) : imported,
+  };
+}
@@ -0,0 +1,171 @@
+export type RawRecord = Record<string, unknown>;
+
+/**
+ * Stands in for a record that is not valid JSON, so the importer can report
+ * it as a failed row and carry on with the next one.
+ */
+export class MalformedRecord {
+  constructor(readonly error: string) {}
+}
+
+export type ParsedRecord = RawRecord | MalformedRecord;
+
+function parseRecord(text: string, line: number): ParsedRecord {
+  try {
+    return JSON.parse(text);
+  } catch (error) {
+    const reason = error instanceof Error ? error.message : String(error);
+    return new MalformedRecord(`Invalid JSON on line ${line}: ${reason}`);
+  }
+}
+
+/**
+ * Incremental RFC 4180 CSV parser. The first row is the header; each later row
+ * is yielded as an object keyed by header name. Quoted fields may contain
+ * commas, escaped quotes ("") and newlines, and may span chunk boundaries.
+ */
+export async function* parseCsv(chunks: AsyncIterable<string>): AsyncGenerator<RawRecord> {
+  let header: string[] | null = null;
+  let row: string[] = [];
+  let field = "";
+  let inQuotes = false;
+  // A quote seen inside a quoted field may be the first half of "" escaping;
+  // we only know once the next character arrives, possibly in the next chunk.
+  let pendingQuote = false;
+  let skipLineFeed = false;
+
+  function* endRow(): Generator<RawRecord> {
+    row.push(field);
+    field = "";
+    const completed = row;
+    row = [];
+
+    if (completed.length === 1 && completed[0] === "") return; // blank line
+    if (!header) {
+      header = completed.map((name) => name.trim());
+      return;
+    }
+    yield Object.fromEntries(header.map((name, i) => [name, completed[i] ?? ""]));
+  }
+
+  for await (const chunk of chunks) {
+    for (let i = 0; i < chunk.length; i++) {
+      const char = chunk[i];
+
+      if (skipLineFeed) {
+        skipLineFeed = false;
+        if (char === "\n") continue;
+      }
+
+      if (pendingQuote) {
+        pendingQuote = false;
+        if (char === '"') {
+          field += '"';
+          continue;
+        }
+        inQuotes = false;
+      }
+
+      if (inQuotes) {
+        if (char === '"') pendingQuote = true;
+        else field += char;
+      } else if (char === '"' && field === "") {
+        inQuotes = true;
+      } else if (char === ",") {
+        row.push(field);
+        field = "";
+      } else if (char === "\n" || char === "\r") {
+        skipLineFeed = char === "\r";
+        yield* endRow();
+      } else {
+        field += char;
+      }
+    }
+  }
+
+  if (field !== "" || row.length > 0) {
+    yield* endRow();
+  }
+}
+
+/** Parses newline-delimited JSON, one object per line. */
+export async function* parseNdjson(chunks: AsyncIterable<string>): AsyncGenerator<ParsedRecord> {
+  let buffer = "";
+  let lineNumber = 0;
+  for await (const chunk of chunks) {
+    buffer += chunk;
+    let newline: number;
+    while ((newline = buffer.indexOf("\n")) >= 0) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      lineNumber++;
+      if (line) yield parseRecord(line, lineNumber);
+    }
+  }
+  if (buffer.trim()) yield parseRecord(buffer, lineNumber + 1);
+}
+
+/**
+ * Parses a top-level JSON array of objects without holding the whole document:
+ * each element is sliced out as soon as its closing brace arrives. Brackets
+ * still balance around an element that is not valid JSON (e.g. an unquoted
+ * key), so it is reported and parsing resumes at the next one.
+ */
+export async function* parseJsonArray(chunks: AsyncIterable<string>): AsyncGenerator<ParsedRecord> {
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+  let current = "";
+  let line = 1;
+  let startLine = 1;
+
+  for await (const chunk of chunks) {
+    for (const char of chunk) {
+      if (depth >= 2) current += char;
+      if (char === "\n") line++;
+
+      if (inString) {
+        if (escaped) escaped = false;
+        else if (char === "\\") escaped = true;
+        else if (char === '"') inString = false;
+        continue;
+      }
+
+      if (char === '"') {
+        inString = true;
+      } else if (char === "[" || char === "{") {
+        depth++;
+        if (depth === 2) {
+          current = char;
+          startLine = line;
+        }
+      } else if (char === "]" || char === "}") {
+        depth--;
+        if (depth === 1) {
+          yield parseRecord(current, startLine);
+          current = "";
+        }
+      }
+    }
+  }
+
+  if (depth !== 0) {
+    throw new Error("Unexpected end of JSON input");
+  }
+}
+
+export async function* decodeText(stream: ReadableStream<Uint8Array>): AsyncGenerator<string> {
+  const decoder = new TextDecoder();
+  const reader = stream.getReader();
+  try {
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      yield decoder.decode(value, { stream: true });
+    }
+    const rest = decoder.decode();
+    if (rest) yield rest;
+  } finally {
+    reader.releaseLock();
+  }
+}
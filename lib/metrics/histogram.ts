@@ -0,0 +1,77 @@
+// Upper bounds in milliseconds, from a cache hit up to a pathological scan.
+export const DEFAULT_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000];
+
+export interface HistogramSnapshot {
+  count: number;
+  sum: number;
+  min: number;
+  max: number;
+  mean: number;
+  p50: number;
+  p75: number;
+  p95: number;
+  p99: number;
+  // Cumulative counts, Prometheus style: observations <= le.
+  buckets: { le: number | "+Inf"; count: number }[];
+}
+
+// Fixed-bucket histogram: constant memory however many values are observed,
+// at the cost of percentiles being interpolated within a bucket.
+export class Histogram {
+  private readonly counts: number[];
+  private count = 0;
+  private sum = 0;
+  private min = Infinity;
+  private max = 0;
+
+  constructor(private readonly bounds: readonly number[] = DEFAULT_BUCKETS_MS) {
+    this.counts = new Array(bounds.length + 1).fill(0);
+  }
+
+  observe(value: number) {
+    let index = this.bounds.findIndex((bound) => value <= bound);
+    if (index === -1) index = this.bounds.length;
+    this.counts[index]++;
+    this.count++;
+    this.sum += value;
+    this.min = Math.min(this.min, value);
+    this.max = Math.max(this.max, value);
+  }
+
+  percentile(p: number): number {
+    if (this.count === 0) return 0;
+    const rank = p * this.count;
+    let seen = 0;
+    for (let i = 0; i < this.counts.length; i++) {
+      if (this.counts[i] === 0 || seen + this.counts[i] < rank) {
+        seen += this.counts[i];
+        continue;
+      }
+      const lower = i === 0 ? 0 : this.bounds[i - 1];
+      const upper = i < this.bounds.length ? this.bounds[i] : this.max;
+      const estimate = lower + ((upper - lower) * (rank - seen)) / this.counts[i];
+      return Math.min(Math.max(estimate, this.min), this.max);
+    }
+    return this.max;
+  }
+
+  snapshot(): HistogramSnapshot {
+    let cumulative = 0;
+    const buckets = this.counts.map((count, i) => {
+      cumulative += count;
+      return { le: i < this.bounds.length ? this.bounds[i] : ("+Inf" as const), count: cumulative };
+    });
+    return {
+      count: this.count,
+      sum: this.sum,
+      min: this.count === 0 ? 0 : this.min,
+      max: this.max,
+      mean: this.count === 0 ? 0 : this.sum / this.count,
+      p50: this.percentile(0.5),
+      p75: this.percentile(0.75),
+      p95: this.percentile(0.95),
+      p99: this.percentile(0.99),
+      buckets,
+    };
+  }
+}
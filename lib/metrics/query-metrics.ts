@@ -0,0 +1,55 @@
+import { Histogram, type HistogramSnapshot } from "@/lib/metrics/histogram";
+
+export interface QueryRecord {
+  operation: string;
+  // Low-cardinality description of the arguments, e.g. "status=OFFER sort=companyName:asc".
+  shape: string;
+  durationMs: number;
+  rows: number;
+  error?: boolean;
+}
+
+export interface QueryMetrics extends HistogramSnapshot {
+  operation: string;
+  shape: string;
+  rows: number;
+  errors: number;
+}
+
+interface Series {
+  histogram: Histogram;
+  rows: number;
+  errors: number;
+}
+
+const series = new Map<string, Series>();
+
+export function slowQueryThresholdMs() {
+  return Number(process.env.SLOW_QUERY_MS ?? 200);
+}
+
+export function recordQuery({ operation, shape, durationMs, rows, error }: QueryRecord) {
+  const key = `${operation}\u0000${shape}`;
+  let entry = series.get(key);
+  if (!entry) {
+    entry = { histogram: new Histogram(), rows: 0, errors: 0 };
+    series.set(key, entry);
+  }
+  entry.histogram.observe(durationMs);
+  entry.rows += rows;
+  if (error) entry.errors++;
+}
+
+// Sorted by total time spent, so the most expensive shapes come first.
+export function getQueryMetrics(): QueryMetrics[] {
+  return [...series.entries()]
+    .map(([key, { histogram, rows, errors }]) => {
+      const [operation, shape] = key.split("\u0000");
+      return { operation, shape, rows, errors, ...histogram.snapshot() };
+    })
+    .sort((a, b) => b.sum - a.sum);
+}
+
+export function resetQueryMetrics() {
+  series.clear();
+}
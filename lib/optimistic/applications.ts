@@ -0,0 +1,114 @@
+import type { JobApplication } from "@prisma/client";
+import type { FilterInput } from "@/lib/zod/application.schema";
+
+export type ApplicationMutation =
+  | { type: "create"; application: JobApplication }
+  | { type: "update"; application: JobApplication }
+  | { type: "delete"; id: string }
+  | { type: "bulkUpdateStatus"; ids: string[]; status: string }
+  | { type: "bulkDelete"; ids: string[] };
+
+const OPTIMISTIC_ID_PREFIX = "optimistic-";
+
+// Placeholder id for a card whose row the server has not created yet.
+export function optimisticId(): string {
+  return `${OPTIMISTIC_ID_PREFIX}${crypto.randomUUID()}`;
+}
+
+export function isOptimistic(application: Pick<JobApplication, "id">): boolean {
+  return application.id.startsWith(OPTIMISTIC_ID_PREFIX);
+}
+
+// Ids of the rows a mutation writes.
+export function mutationTargets(mutation: ApplicationMutation): string[] {
+  switch (mutation.type) {
+    case "delete":
+      return [mutation.id];
+    case "bulkUpdateStatus":
+    case "bulkDelete":
+      return mutation.ids;
+    default:
+      return [mutation.application.id];
+  }
+}
+
+function tokens(text: string | null): string[] {
+  return text?.toLowerCase().match(/[\p{L}\p{N}]+/gu) ?? [];
+}
+
+// Client-side stand-in for the server filters, good enough for the one
+// round-trip a guess has to last: status must match, and every search token
+// must prefix a word of a searched column, as in the full-text query.
+export function matchesFilters(application: JobApplication, filters: FilterInput): boolean {
+  if (filters.status && application.status !== filters.status) return false;
+  const words = [application.companyName, application.jobTitle, application.location, application.notes].flatMap(
+    tokens
+  );
+  const terms = tokens(filters.search ?? "");
+  // Like the server, a non-blank search without letters or digits matches nothing.
+  if (terms.length === 0) return !filters.search?.trim();
+  return terms.every((token) => words.some((word) => word.startsWith(token)));
+}
+
+function sortValue(application: JobApplication, sortBy: FilterInput["sortBy"]): number | string {
+  return sortBy === "companyName" ? application.companyName : new Date(application.applicationDate).getTime();
+}
+
+// Same order as the repository's findMany: sort column, then id.
+function compare(a: JobApplication, b: JobApplication, filters: FilterInput): number {
+  const sortBy = filters.sortBy ?? "applicationDate";
+  const direction = filters.sortOrder === "asc" ? 1 : -1;
+  const [left, right] = [sortValue(a, sortBy), sortValue(b, sortBy)];
+  if (left !== right) return (left < right ? -1 : 1) * direction;
+  return (a.id < b.id ? -1 : a.id > b.id ? 1 : 0) * direction;
+}
+
+interface ApplyOptions {
+  filters: FilterInput;
+  // Whether every page is loaded; if not, a row sorting after the last
+  // loaded one belongs to a page we have not fetched.
+  complete: boolean;
+}
+
+function insertSorted(items: JobApplication[], application: JobApplication, { filters, complete }: ApplyOptions) {
+  // Relevance is only known to the server; new matches go first.
+  if (filters.sortBy === "relevance") return [application, ...items];
+  const index = items.findIndex((item) => compare(application, item, filters) < 0);
+  if (index === -1) return complete ? [...items, application] : items;
+  return [...items.slice(0, index), application, ...items.slice(index)];
+}
+
+/**
+ * The list as it will look once `mutation` reaches the server: deleted
+ * rows go, edited rows change (moving if their sort key did), and rows that
+ * stop or start matching the filters leave or join in sort order.
+ */
+export function applyMutation(
+  items: JobApplication[],
+  mutation: ApplicationMutation,
+  options: ApplyOptions
+): JobApplication[] {
+  if (mutation.type === "bulkDelete" || mutation.type === "bulkUpdateStatus") {
+    const ids = new Set(mutation.ids);
+    if (mutation.type === "bulkDelete") return items.filter((item) => !ids.has(item.id));
+    // Status is never a sort key, so rows only change or leave.
+    const { status } = mutation;
+    return items
+      .map((item) => (ids.has(item.id) ? { ...item, status } : item))
+      .filter((item) => !ids.has(item.id) || matchesFilters(item, options.filters));
+  }
+
+  const id = mutation.type === "delete" ? mutation.id : mutation.application.id;
+  const rest = items.filter((item) => item.id !== id);
+  if (mutation.type === "delete") return rest;
+
+  const { application } = mutation;
+  if (!matchesFilters(application, options.filters)) return rest;
+
+  const index = items.findIndex((item) => item.id === id);
+  const sortBy = options.filters.sortBy ?? "applicationDate";
+  if (index !== -1 && (sortBy === "relevance" || sortValue(items[index], sortBy) === sortValue(application, sortBy))) {
+    return items.map((item) => (item.id === id ? application : item));
+  }
+  return insertSorted(rest, application, options);
+}
@@ -1,10 +1,62 @@
 import { PrismaClient } from "@prisma/client";
+import { recordQuery, slowQueryThresholdMs } from "@/lib/metrics/query-metrics";
+import { applySqlitePragmas, isSqliteUrl, sqliteSettings, withBusyTimeout, type SqliteSettings } from "@/lib/db/sqlite";
+import { databaseProvider } from "@/lib/db/provider";
+import { poolSettings, withPoolSettings } from "@/lib/db/postgres";
+
+// DATABASE_URL plus the connection settings Prisma only accepts as URL parameters.
+function datasourceUrl(url: string, sqlite: SqliteSettings | null): string {
+  if (sqlite) return withBusyTimeout(url, sqlite.busyTimeoutMs);
+  if (databaseProvider(url) === "postgresql") return withPoolSettings(url, poolSettings());
+  return url;
+}
+
+function createClient() {
+  const url = process.env.DATABASE_URL;
+  const sqlite = isSqliteUrl(url) ? sqliteSettings() : null;
+
+  const client = new PrismaClient({
+    log: [{ emit: "event", level: "query" }],
+    ...(url ? { datasourceUrl: datasourceUrl(url, sqlite) } : {}),
+  });
+
+  // Engine time per SQL statement, alongside the repository-level timings.
+  // Params are left out of the log: they carry user data such as notes.
+  client.$on("query", (event) => {
+    const statement = event.query.trimStart().split(/\s+/, 1)[0].toUpperCase();
+    recordQuery({ operation: "sql", shape: statement, durationMs: event.duration, rows: 0 });
+    if (event.duration >= slowQueryThresholdMs()) {
+      console.warn(`[slow-sql] ${event.duration}ms ${event.query}`);
+    }
+  });
+
+  // Switch to WAL (readers no longer wait on writers) before the first query
+  // runs; every operation waits on this, which is free once it has settled.
+  // If the pragmas fail (e.g. the file is locked), operations run on the
+  // defaults and the next one tries again.
+  let ready: Promise<void> | null = null;
+  const pragmasApplied = () =>
+    (ready ??= sqlite
+      ? applySqlitePragmas(client, sqlite).catch((error) => {
+          console.error("Failed to apply SQLite pragmas, continuing without them:", error);
+          ready = null;
+        })
+      : Promise.resolve());
+  return client.$extends({
+    query: {
+      async $allOperations({ args, query }) {
+        await pragmasApplied();
+        return query(args);
+      },
+    },
+  });
+}
 
 const globalForPrisma = globalThis as unknown as {
-  prisma: PrismaClient | undefined;
+  prisma: ReturnType<typeof createClient> | undefined;
 };
 
-const prisma = globalForPrisma.prisma ?? new PrismaClient();
+const prisma = globalForPrisma.prisma ?? createClient();
 
 if (process.env.NODE_ENV !== "production") {
   globalForPrisma.prisma = prisma;
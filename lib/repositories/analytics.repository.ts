@@ -0,0 +1,173 @@
+import { prisma } from "@/lib/prisma";
+import { statusCounts } from "@/lib/repositories/application.repository";
+import { timed } from "@/lib/repositories/instrument";
+import { DAY_MS, rollupDay } from "@/lib/repositories/rollups";
+import { conversionQuery, timeInStageQuery } from "@/lib/repositories/status-events";
+import type { ApplicationStatus } from "@/lib/zod/application.schema";
+
+export const ANALYTICS_WEEKS = 26;
+
+export interface WeeklyApplications {
+  // Monday (UTC) the week starts on, as YYYY-MM-DD.
+  weekStart: string;
+  count: number;
+}
+
+export interface FunnelStage {
+  label: string;
+  count: number;
+}
+
+export interface StageTime {
+  status: string;
+  // Entries into the stage within the window, and how many have moved on.
+  entered: number;
+  left: number;
+  medianDays: number | null;
+}
+
+export interface Conversion {
+  from: string;
+  to: string;
+  entered: number;
+  converted: number;
+  rate: number | null;
+}
+
+export interface Analytics {
+  weekly: WeeklyApplications[];
+  funnel: FunnelStage[];
+  // Share of all applications that got an answer (interview, offer or rejection).
+  responseRate: number | null;
+  medianDaysToStatusChange: number | null;
+  medianDaysByStatus: { status: string; days: number; changes: number }[];
+  // From the status history, over entries in the charted weeks.
+  timeInStage: StageTime[];
+  conversions: Conversion[];
+}
+
+// Statuses that mean the company answered, and the subsets reached further down.
+const RESPONDED: ApplicationStatus[] = ["INTERVIEW", "OFFER", "REJECTED"];
+const INTERVIEWED: ApplicationStatus[] = ["INTERVIEW", "OFFER"];
+
+// Stages an application normally leaves, and the transitions worth a rate.
+const STAGES: ApplicationStatus[] = ["APPLIED", "INTERVIEW"];
+const CONVERSIONS: [ApplicationStatus, ApplicationStatus][] = [
+  ["APPLIED", "INTERVIEW"],
+  ["INTERVIEW", "OFFER"],
+];
+
+export function weekStart(date: Date): Date {
+  const day = rollupDay(date);
+  const sinceMonday = (day.getUTCDay() + 6) % 7;
+  return new Date(day.getTime() - sinceMonday * DAY_MS);
+}
+
+// Median of a histogram given as (value, count) pairs.
+export function histogramMedian(buckets: { value: number; count: number }[]): number | null {
+  const sorted = buckets.filter((bucket) => bucket.count > 0).sort((a, b) => a.value - b.value);
+  const total = sorted.reduce((sum, bucket) => sum + bucket.count, 0);
+  if (total === 0) return null;
+  let seen = 0;
+  for (const bucket of sorted) {
+    seen += bucket.count;
+    if (seen >= total / 2) return bucket.value;
+  }
+  return sorted[sorted.length - 1].value;
+}
+
+// Raw counts come back as BigInt on some drivers.
+interface TimeInStageRow {
+  days: number | bigint | null;
+  count: number | bigint;
+}
+
+/**
+ * How long applications stayed in `status`, for entries into it between
+ * `since` and `until`, read from the status history by index range scans.
+ */
+export async function timeInStage(status: string, since: Date, until = new Date()): Promise<StageTime> {
+  const rows = await timed("timeInStage", () =>
+    prisma.$queryRaw<TimeInStageRow[]>(timeInStageQuery(status, { since, until }))
+  );
+  const stays = rows.map(({ days, count }) => ({
+    value: days === null ? null : Number(days),
+    count: Number(count),
+  }));
+  const ended = stays.filter((stay): stay is { value: number; count: number } => stay.value !== null);
+  return {
+    status,
+    entered: stays.reduce((sum, stay) => sum + stay.count, 0),
+    left: ended.reduce((sum, stay) => sum + stay.count, 0),
+    medianDays: histogramMedian(ended),
+  };
+}
+
+// Share of entries into `from` between `since` and `until` later followed by `to`.
+export async function conversion(from: string, to: string, since: Date, until = new Date()): Promise<Conversion> {
+  const [row] = await timed("conversion", () =>
+    prisma.$queryRaw<{ entered: number | bigint; converted: number | bigint }[]>(
+      conversionQuery(from, to, { since, until })
+    )
+  );
+  const entered = Number(row?.entered ?? 0);
+  const converted = Number(row?.converted ?? 0);
+  return { from, to, entered, converted, rate: entered === 0 ? null : converted / entered };
+}
+
+/**
+ * Builds the analytics page from the rollup tables and the status counters:
+ * a row per day and status for the charted weeks plus one per (status,
+ * days) pair, instead of a scan over job_applications. Time in stage and
+ * conversions come from the status history for the same weeks.
+ */
+export async function analytics(now = new Date(), weeks = ANALYTICS_WEEKS): Promise<Analytics> {
+  const firstWeek = new Date(weekStart(now).getTime() - (weeks - 1) * 7 * DAY_MS);
+
+  const [daily, changes, counts, timeInStages, conversions] = await Promise.all([
+    timed("analyticsDaily", () =>
+      prisma.applicationDailyRollup.findMany({ where: { day: { gte: firstWeek } } })
+    ),
+    timed("analyticsStatusChanges", () => prisma.statusChangeRollup.findMany()),
+    statusCounts(),
+    Promise.all(STAGES.map((status) => timeInStage(status, firstWeek, now))),
+    Promise.all(CONVERSIONS.map(([from, to]) => conversion(from, to, firstWeek, now))),
+  ]);
+
+  const weekly = Array.from({ length: weeks }, (_, index) => ({
+    weekStart: new Date(firstWeek.getTime() + index * 7 * DAY_MS).toISOString().slice(0, 10),
+    count: 0,
+  }));
+  for (const { day, count } of daily) {
+    const index = Math.floor((weekStart(day).getTime() - firstWeek.getTime()) / (7 * DAY_MS));
+    if (index >= 0 && index < weeks) weekly[index].count += count;
+  }
+
+  const sum = (statuses: ApplicationStatus[]) => statuses.reduce((total, status) => total + counts[status], 0);
+  const total = Object.values(counts).reduce((a, b) => a + b, 0);
+  const funnel = [
+    { label: "Applied", count: total },
+    { label: "Heard back", count: sum(RESPONDED) },
+    { label: "Interviewed", count: sum(INTERVIEWED) },
+    { label: "Offer", count: counts.OFFER },
+  ];
+
+  const byStatus = new Map<string, { value: number; count: number }[]>();
+  for (const { toStatus, days, count } of changes) {
+    byStatus.set(toStatus, [...(byStatus.get(toStatus) ?? []), { value: days, count }]);
+  }
+
+  return {
+    weekly,
+    funnel,
+    responseRate: total === 0 ? null : sum(RESPONDED) / total,
+    medianDaysToStatusChange: histogramMedian(changes.map(({ days, count }) => ({ value: days, count }))),
+    medianDaysByStatus: [...byStatus.entries()].flatMap(([status, buckets]) => {
+      const days = histogramMedian(buckets);
+      const changeCount = buckets.reduce((a, b) => a + b.count, 0);
+      return days === null ? [] : [{ status, days, changes: changeCount }];
+    }),
+    timeInStage: timeInStages,
+    conversions,
+  };
+}
@@ -1,47 +1,277 @@
+import type { JobApplication, Prisma } from "@prisma/client";
 import { prisma } from "@/lib/prisma";
-import type {
-  CreateApplicationInput,
-  UpdateApplicationInput,
-  FilterInput,
+import { cursorFor, decodeCursor, keysetCondition } from "@/lib/repositories/cursor";
+import { filterShape, timed } from "@/lib/repositories/instrument";
+import { searchPageQuery, toMatchQuery } from "@/lib/repositories/search";
+import { recordChange, recordChanges, recordCreated } from "@/lib/repositories/rollups";
+import { createdEvent, recordStatusEvents } from "@/lib/repositories/status-events";
+import {
+  APPLICATION_STATUSES,
+  DEFAULT_PAGE_SIZE,
+  type ApplicationStatus,
+  type CreateApplicationInput,
+  type UpdateApplicationInput,
+  type FilterInput,
 } from "@/lib/zod/application.schema";
 
-export async function findAll(filters: FilterInput) {
-  const where: Record<string, unknown> = {};
+export interface ApplicationPage {
+  items: JobApplication[];
+  nextCursor: string | null;
+}
+
+export type StatusCounts = Record<ApplicationStatus, number>;
+
+export async function findAll(filters: FilterInput): Promise<ApplicationPage> {
+  return timed("findAll", () => findPage(filters), {
+    shape: filterShape(filters),
+    rows: (page) => page.items.length,
+  });
+}
+
+async function findPage(filters: FilterInput): Promise<ApplicationPage> {
+  const search = filters.search?.trim();
+  const match = search ? toMatchQuery(search) : null;
+  // A term with no letters or digits (e.g. "--") can match nothing; it must
+  // not fall through to the unfiltered list.
+  if (search && !match) return { items: [], nextCursor: null };
+  // Relevance only means something when there is a search term.
+  const sortBy =
+    filters.sortBy === "relevance" && !match ? "applicationDate" : filters.sortBy ?? "applicationDate";
+  const sortOrder = filters.sortOrder ?? "desc";
+  const limit = filters.limit ?? DEFAULT_PAGE_SIZE;
+  const cursor = filters.cursor ? decodeCursor(filters.cursor, sortBy) : null;
+
+  if (match) {
+    return findAllBySearch({ match, status: filters.status, sortBy, sortOrder, cursor, take: limit + 1 });
+  }
+
+  const conditions: Record<string, unknown>[] = [];
 
   if (filters.status) {
-    where.status = filters.status;
+    conditions.push({ status: filters.status });
   }
 
-  if (filters.search) {
-    where.OR = [
-      { companyName: { contains: filters.search } },
-      { jobTitle: { contains: filters.search } },
-    ];
+  if (cursor) {
+    conditions.push(keysetCondition(cursor, sortOrder));
   }
 
-  return prisma.jobApplication.findMany({
-    where,
-    orderBy: {
-      [filters.sortBy ?? "applicationDate"]: filters.sortOrder ?? "desc",
-    },
+  // Fetch one extra row to learn whether another page exists.
+  const rows = await prisma.jobApplication.findMany({
+    where: conditions.length > 0 ? { AND: conditions } : {},
+    orderBy: [{ [sortBy]: sortOrder }, { id: sortOrder }],
+    take: limit + 1,
   });
+
+  return toPage(rows, limit, sortBy);
+}
+
+async function findAllBySearch(
+  options: Parameters<typeof searchPageQuery>[0]
+): Promise<ApplicationPage> {
+  const matches = await prisma.$queryRaw<{ id: string; rank: number }[]>(
+    searchPageQuery(options)
+  );
+  const rows = await prisma.jobApplication.findMany({
+    where: { id: { in: matches.map((match) => match.id) } },
+  });
+
+  // Restore the FTS ordering and carry the rank along for relevance cursors.
+  const byId = new Map(rows.map((row) => [row.id, row]));
+  const ordered = matches.flatMap((match) => {
+    const row = byId.get(match.id);
+    return row ? [{ ...row, rank: match.rank }] : [];
+  });
+
+  return toPage(ordered, options.take - 1, options.sortBy);
+}
+
+function toPage(
+  rows: (JobApplication & { rank?: number })[],
+  limit: number,
+  sortBy: NonNullable<FilterInput["sortBy"]>
+): ApplicationPage {
+  const page = rows.slice(0, limit);
+  const nextCursor = rows.length > limit ? cursorFor(page[page.length - 1], sortBy) : null;
+  const items = page.map(({ rank: _rank, ...row }) => row);
+
+  return { items, nextCursor };
+}
+
+// Per-status totals from the trigger-maintained counters table: one primary
+// key row per status, however large job_applications grows.
+export async function statusCounts(): Promise<StatusCounts> {
+  const rows = await timed("statusCounts", () => prisma.applicationStatusCount.findMany());
+  const counts = Object.fromEntries(APPLICATION_STATUSES.map((status) => [status, 0])) as StatusCounts;
+  for (const { status, count } of rows) {
+    if (status in counts) counts[status as ApplicationStatus] = count;
+  }
+  return counts;
 }
 
 export async function findById(id: string) {
-  return prisma.jobApplication.findUnique({ where: { id } });
+  return timed("findById", () => prisma.jobApplication.findUnique({ where: { id } }));
 }
 
 export async function create(data: CreateApplicationInput) {
-  return prisma.jobApplication.create({ data });
+  return timed("create", () =>
+    prisma.$transaction(async (tx) => {
+      const application = await tx.jobApplication.create({ data });
+      await recordChange(tx, null, application);
+      await recordStatusEvents(tx, [createdEvent(application)]);
+      return application;
+    })
+  );
 }
 
-export async function update(id: string, data: Omit<UpdateApplicationInput, "id">) {
-  return prisma.jobApplication.update({
-    where: { id },
-    data,
-  });
+// Inserts all rows in a single statement, so the batch commits or fails as a
+// whole, together with its rollups and status events.
+export async function createMany(data: CreateApplicationInput[]) {
+  return timed("createMany", () =>
+    prisma.$transaction(async (tx) => {
+      const rows = await tx.jobApplication.createManyAndReturn({
+        data,
+        select: { id: true, status: true, applicationDate: true, createdAt: true },
+      });
+      await recordCreated(tx, rows);
+      await recordStatusEvents(tx, rows.map(createdEvent));
+      return rows.length;
+    })
+  );
+}
+
+const UPDATE_ATTEMPTS = 3;
+
+export interface UpdateResult {
+  application: JobApplication;
+  // The status the write replaced, read inside the same compare-and-retry,
+  // so callers can tell which status lists the row left.
+  previousStatus: string;
 }
 
+export async function update(id: string, data: Omit<UpdateApplicationInput, "id">): Promise<UpdateResult> {
+  return timed("update", () => updateWithRollups(id, data));
+}
+
+// Optimistic: the write only applies if status and date are still the ones
+// read, so the rollup deltas and status event always describe the change
+// actually made; a concurrent edit in between makes it re-read and retry.
+// Opening the transaction with the write (rather than the read) also spares
+// SQLite a read-to-write lock upgrade, which fails instead of waiting.
+async function updateWithRollups(id: string, data: Omit<UpdateApplicationInput, "id">): Promise<UpdateResult> {
+  for (let attempt = 1; ; attempt++) {
+    const previous = await prisma.jobApplication.findUniqueOrThrow({ where: { id } });
+    const application = await prisma.$transaction(async (tx) => {
+      const { count } = await tx.jobApplication.updateMany({
+        where: { id, status: previous.status, applicationDate: previous.applicationDate },
+        data,
+      });
+      if (count === 0) return null;
+      const updated = await tx.jobApplication.findUniqueOrThrow({ where: { id } });
+      await recordChange(tx, previous, updated);
+      if (updated.status !== previous.status) {
+        await recordStatusEvents(tx, [
+          { applicationId: id, fromStatus: previous.status, toStatus: updated.status, at: updated.updatedAt },
+        ]);
+      }
+      return updated;
+    });
+    if (application) return { application, previousStatus: previous.status };
+    if (attempt >= UPDATE_ATTEMPTS) {
+      throw new Error(`Application ${id} changed concurrently ${UPDATE_ATTEMPTS} times; giving up`);
+    }
+  }
+}
+
+// The application's status events stay: history is append-only.
 export async function remove(id: string) {
-  return prisma.jobApplication.delete({ where: { id } });
+  return timed("remove", () =>
+    prisma.$transaction(async (tx) => {
+      const removed = await tx.jobApplication.delete({ where: { id } });
+      await recordChange(tx, removed, null);
+      return removed;
+    })
+  );
 }
+
+// The columns the rollups are keyed on, plus the id: what a bulk write
+// checks is unchanged since it read the rows.
+type BulkRow = Pick<JobApplication, "id" | "status" | "applicationDate">;
+
+class RowsChangedError extends Error {}
+
+/**
+ * The bulk counterpart of updateWithRollups. Reads the matching rows, then
+ * in one transaction runs `write`, which must touch exactly those rows as
+ * read (matched on id, status and applicationDate), and `record`. If a
+ * concurrent write changed some of them, the whole batch rolls back and is
+ * read again. Returns the rows as they were before the write.
+ */
+async function bulkWriteWithRollups(
+  operation: string,
+  where: Prisma.JobApplicationWhereInput,
+  write: (tx: Prisma.TransactionClient, unchanged: Prisma.JobApplicationWhereInput) => Promise<{ count: number }>,
+  record: (tx: Prisma.TransactionClient, rows: BulkRow[]) => Promise<void>
+): Promise<BulkRow[]> {
+  for (let attempt = 1; ; attempt++) {
+    const rows = await prisma.jobApplication.findMany({
+      where,
+      select: { id: true, status: true, applicationDate: true },
+      orderBy: { id: "asc" },
+    });
+    if (rows.length === 0) return rows;
+
+    const unchanged = { OR: rows.map(({ id, status, applicationDate }) => ({ id, status, applicationDate })) };
+    try {
+      await prisma.$transaction(async (tx) => {
+        const { count } = await write(tx, unchanged);
+        if (count !== rows.length) throw new RowsChangedError();
+        await record(tx, rows);
+      });
+      return rows;
+    } catch (error) {
+      if (!(error instanceof RowsChangedError)) throw error;
+      if (attempt >= UPDATE_ATTEMPTS) {
+        throw new Error(`${operation}: applications changed concurrently ${UPDATE_ATTEMPTS} times; giving up`);
+      }
+    }
+  }
+}
+
+// Sets the status of every listed application in a single UPDATE. Rows
+// already in that status are left alone; the rest are returned with the
+// status they had.
+export async function bulkUpdateStatus(ids: string[], status: ApplicationStatus) {
+  return timed(
+    "bulkUpdateStatus",
+    () =>
+      bulkWriteWithRollups(
+        "bulkUpdateStatus",
+        { id: { in: ids }, status: { not: status } },
+        (tx, unchanged) => tx.jobApplication.updateMany({ where: unchanged, data: { status } }),
+        async (tx, rows) => {
+          const now = new Date();
+          await recordChanges(tx, rows.map((row): [BulkRow, BulkRow] => [row, { ...row, status }]), now);
+          await recordStatusEvents(
+            tx,
+            rows.map((row) => ({ applicationId: row.id, fromStatus: row.status, toStatus: status, at: now }))
+          );
+        }
+      )
+  );
+}
+
+// Deletes every listed application in a single DELETE and returns the rows
+// removed. Ids that no longer exist are skipped.
+export async function bulkRemove(ids: string[]) {
+  return timed(
+    "bulkRemove",
+    () =>
+      bulkWriteWithRollups(
+        "bulkRemove",
+        { id: { in: ids } },
+        (tx, unchanged) => tx.jobApplication.deleteMany({ where: unchanged }),
+        (tx, rows) => recordChanges(tx, rows.map((row): [BulkRow, null] => [row, null]))
+      )
+  );
+}
+
@@ -0,0 +1,64 @@
+import type { FilterInput } from "@/lib/zod/application.schema";
+
+type SortBy = NonNullable<FilterInput["sortBy"]>;
+
+export interface ApplicationCursor {
+  sortBy: SortBy;
+  value: string;
+  id: string;
+}
+
+// Cursors are opaque to the client: base64url-encoded JSON of the last row's
+// sort key plus its id (the tiebreaker that keeps the ordering total).
+export function encodeCursor(cursor: ApplicationCursor): string {
+  return Buffer.from(JSON.stringify(cursor)).toString("base64url");
+}
+
+export function decodeCursor(raw: string, sortBy: SortBy): ApplicationCursor | null {
+  try {
+    const parsed = JSON.parse(Buffer.from(raw, "base64url").toString("utf8"));
+    if (
+      parsed?.sortBy !== sortBy ||
+      typeof parsed.value !== "string" ||
+      typeof parsed.id !== "string"
+    ) {
+      return null;
+    }
+    return parsed as ApplicationCursor;
+  } catch {
+    return null;
+  }
+}
+
+export function cursorFor(
+  row: { id: string; applicationDate: Date; companyName: string; rank?: number },
+  sortBy: SortBy
+): string {
+  let value: string;
+  if (sortBy === "relevance") {
+    value = String(row.rank ?? 0);
+  } else if (sortBy === "companyName") {
+    value = row.companyName;
+  } else {
+    value = new Date(row.applicationDate).toISOString();
+  }
+  return encodeCursor({ sortBy, value, id: row.id });
+}
+
+// Builds the keyset predicate "rows strictly after the cursor" for the active
+// sort column, using id to break ties between equal sort values. Relevance
+// cursors are only produced by the full-text path and never reach Prisma.
+export function keysetCondition(
+  cursor: ApplicationCursor,
+  sortOrder: NonNullable<FilterInput["sortOrder"]>
+) {
+  const op = sortOrder === "asc" ? "gt" : "lt";
+  const value = cursor.sortBy === "applicationDate" ? new Date(cursor.value) : cursor.value;
+
+  return {
+    OR: [
+      { [cursor.sortBy]: { [op]: value } },
+      { [cursor.sortBy]: value, id: { [op]: cursor.id } },
+    ],
+  };
+}
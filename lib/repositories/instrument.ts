@@ -0,0 +1,51 @@
+import { recordQuery, slowQueryThresholdMs } from "@/lib/metrics/query-metrics";
+import type { FilterInput } from "@/lib/zod/application.schema";
+
+// Describes which query plan a findAll call takes without recording the
+// values themselves (search terms and cursors would explode the series).
+export function filterShape(filters: FilterInput): string {
+  const parts = [
+    `status=${filters.status ?? "*"}`,
+    `sort=${filters.sortBy ?? "applicationDate"}:${filters.sortOrder ?? "desc"}`,
+  ];
+  if (filters.search?.trim()) parts.push("search");
+  if (filters.cursor) parts.push("cursor");
+  return parts.join(" ");
+}
+
+function countRows(result: unknown): number {
+  if (Array.isArray(result)) return result.length;
+  if (typeof result === "number") return result;
+  return result ? 1 : 0;
+}
+
+interface TimedOptions<T> {
+  shape?: string;
+  rows?: (result: T) => number;
+}
+
+/**
+ * Runs a repository call, records its duration and row count, and logs it if
+ * it exceeds SLOW_QUERY_MS. The SQL behind a slow call is logged separately
+ * by the Prisma query listener in lib/prisma.ts.
+ */
+export async function timed<T>(
+  operation: string,
+  run: () => Promise<T>,
+  { shape = "-", rows = countRows }: TimedOptions<T> = {}
+): Promise<T> {
+  const started = performance.now();
+  try {
+    const result = await run();
+    const durationMs = performance.now() - started;
+    const count = rows(result);
+    recordQuery({ operation, shape, durationMs, rows: count });
+    if (durationMs >= slowQueryThresholdMs()) {
+      console.warn(`[slow-query] ${operation} (${shape}) took ${durationMs.toFixed(1)}ms, ${count} rows`);
+    }
+    return result;
+  } catch (error) {
+    recordQuery({ operation, shape, durationMs: performance.now() - started, rows: 0, error: true });
+    throw error;
+  }
+}
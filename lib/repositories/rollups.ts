@@ -0,0 +1,100 @@
+import type { JobApplication, Prisma } from "@prisma/client";
+
+export const DAY_MS = 86_400_000;
+
+type RollupRow = Pick<JobApplication, "status" | "applicationDate">;
+
+interface DailyDelta {
+  day: Date;
+  status: string;
+  delta: number;
+}
+
+// UTC midnight of the day, matching the migration's backfill.
+export function rollupDay(date: Date): Date {
+  return new Date(Math.floor(date.getTime() / DAY_MS) * DAY_MS);
+}
+
+export function daysBetween(from: Date, to: Date): number {
+  return Math.max(0, Math.floor((to.getTime() - from.getTime()) / DAY_MS));
+}
+
+// Net change per (day, status). Zero deltas are dropped, so an edit that
+// keeps both status and date writes nothing. Sorted so concurrent writers
+// lock rollup rows in the same order.
+export function dailyDeltas(changes: [RollupRow, number][]): DailyDelta[] {
+  const deltas = new Map<string, DailyDelta>();
+  for (const [row, delta] of changes) {
+    const day = rollupDay(row.applicationDate);
+    const key = `${day.toISOString()} ${row.status}`;
+    const entry = deltas.get(key) ?? { day, status: row.status, delta: 0 };
+    entry.delta += delta;
+    deltas.set(key, entry);
+  }
+  return [...deltas.entries()]
+    .filter(([, entry]) => entry.delta !== 0)
+    .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0))
+    .map(([, entry]) => entry);
+}
+
+async function applyDailyDeltas(tx: Prisma.TransactionClient, deltas: DailyDelta[]) {
+  for (const { day, status, delta } of deltas) {
+    await tx.applicationDailyRollup.upsert({
+      where: { day_status: { day, status } },
+      create: { day, status, count: delta },
+      update: { count: { increment: delta } },
+    });
+  }
+}
+
+/**
+ * Applies one application's create (`before` null), update or delete
+ * (`after` null) to the rollups. Runs inside the write's transaction.
+ */
+export async function recordChange(
+  tx: Prisma.TransactionClient,
+  before: RollupRow | null,
+  after: RollupRow | null,
+  now = new Date()
+) {
+  await recordChanges(tx, [[before, after]], now);
+}
+
+// recordChange for a batch of rows written by one statement: one upsert per
+// distinct rollup row, in a fixed order.
+export async function recordChanges(
+  tx: Prisma.TransactionClient,
+  changes: [RollupRow | null, RollupRow | null][],
+  now = new Date()
+) {
+  const deltas: [RollupRow, number][] = [];
+  const statusChanges = new Map<string, { toStatus: string; days: number; count: number }>();
+  for (const [before, after] of changes) {
+    if (before) deltas.push([before, -1]);
+    if (after) deltas.push([after, 1]);
+    if (before && after && before.status !== after.status) {
+      const days = daysBetween(after.applicationDate, now);
+      const key = `${after.status} ${days}`;
+      const entry = statusChanges.get(key) ?? { toStatus: after.status, days, count: 0 };
+      entry.count += 1;
+      statusChanges.set(key, entry);
+    }
+  }
+  await applyDailyDeltas(tx, dailyDeltas(deltas));
+
+  const sorted = [...statusChanges.values()].sort((a, b) =>
+    a.toStatus === b.toStatus ? a.days - b.days : a.toStatus < b.toStatus ? -1 : 1
+  );
+  for (const { toStatus, days, count } of sorted) {
+    await tx.statusChangeRollup.upsert({
+      where: { toStatus_days: { toStatus, days } },
+      create: { toStatus, days, count },
+      update: { count: { increment: count } },
+    });
+  }
+}
+
+// One upsert per distinct (day, status) however many rows were inserted.
+export async function recordCreated(tx: Prisma.TransactionClient, rows: RollupRow[]) {
+  await applyDailyDeltas(tx, dailyDeltas(rows.map((row) => [row, 1])));
+}
@@ -0,0 +1,98 @@
+import { Prisma } from "@prisma/client";
+import { databaseProvider, type DatabaseProvider } from "@/lib/db/provider";
+import type { ApplicationCursor } from "@/lib/repositories/cursor";
+import type { FilterInput } from "@/lib/zod/application.schema";
+
+// bm25 column weights for companyName, jobTitle, location, notes.
+const BM25_WEIGHTS = Prisma.raw("10.0, 5.0, 2.0, 1.0");
+// ts_rank weights for the D (notes), C, B, A (companyName) labels of the
+// Postgres search_vector: the same proportions as BM25_WEIGHTS.
+const TS_RANK_WEIGHTS = Prisma.raw("'{0.1, 0.2, 0.5, 1.0}'");
+
+// Turns free text into a full-text query: every token must match as a prefix.
+// For FTS5 tokens are quoted so user input can never inject operators; for
+// Postgres to_tsquery they are letters and digits only, which is just as safe.
+export function toMatchQuery(search: string, provider: DatabaseProvider = databaseProvider()): string | null {
+  const tokens = search.toLowerCase().match(/[\p{L}\p{N}]+/gu);
+  if (!tokens) return null;
+  if (provider === "postgresql") return tokens.map((token) => `${token}:*`).join(" & ");
+  return tokens.map((token) => `"${token}"*`).join(" ");
+}
+
+interface SearchPageOptions {
+  match: string;
+  status?: FilterInput["status"];
+  sortBy: NonNullable<FilterInput["sortBy"]>;
+  sortOrder: NonNullable<FilterInput["sortOrder"]>;
+  cursor: ApplicationCursor | null;
+  take: number;
+  provider?: DatabaseProvider;
+}
+
+// Matching ids with a "rank" where lower is better, as bm25 reports it.
+function matchesQuery(provider: DatabaseProvider, match: string, status: FilterInput["status"]) {
+  const statusFilter = status ? Prisma.sql`AND j."status" = ${status}` : Prisma.empty;
+  if (provider === "postgresql") {
+    // Negated so relevance sorts ascending on both backends; float8 so the
+    // rank survives the round-trip through a cursor exactly.
+    return Prisma.sql`
+      SELECT j."id", j."companyName", j."applicationDate",
+             (-ts_rank(${TS_RANK_WEIGHTS}, j."search_vector", to_tsquery('simple', ${match})))::float8 AS "rank"
+      FROM "job_applications" j
+      WHERE j."search_vector" @@ to_tsquery('simple', ${match})
+      ${statusFilter}
+    `;
+  }
+  return Prisma.sql`
+      SELECT j."id", j."companyName", j."applicationDate",
+             bm25("job_applications_fts", ${BM25_WEIGHTS}) AS "rank"
+      FROM "job_applications_fts"
+      JOIN "job_applications" j ON j."rowid" = "job_applications_fts"."rowid"
+      WHERE "job_applications_fts" MATCH ${match}
+      ${statusFilter}
+  `;
+}
+
+// Returns the ids (and bm25 ranks) of one page of full-text matches, filtered
+// and ordered the same way as the Prisma path so cursors stay interchangeable.
+export function searchPageQuery({
+  match,
+  status,
+  sortBy,
+  sortOrder,
+  cursor,
+  take,
+  provider = databaseProvider(),
+}: SearchPageOptions) {
+  const column =
+    sortBy === "relevance"
+      ? Prisma.raw(`"rank"`)
+      : Prisma.raw(`"${sortBy === "companyName" ? "companyName" : "applicationDate"}"`);
+  // Lower bm25 is better, so relevance always reads ascending.
+  const ascending = sortBy === "relevance" || sortOrder === "asc";
+  const direction = Prisma.raw(ascending ? "ASC" : "DESC");
+  const op = Prisma.raw(ascending ? ">" : "<");
+
+  let seek = Prisma.empty;
+  if (cursor) {
+    // applicationDate is stored as epoch milliseconds in SQLite.
+    const value =
+      sortBy === "applicationDate"
+        ? provider === "postgresql"
+          ? new Date(cursor.value)
+          : new Date(cursor.value).getTime()
+        : sortBy === "relevance"
+          ? Number(cursor.value)
+          : cursor.value;
+    seek = Prisma.sql`WHERE ${column} ${op} ${value} OR (${column} = ${value} AND "id" ${op} ${cursor.id})`;
+  }
+
+  return Prisma.sql`
+    SELECT "id", "rank" FROM (
+      ${matchesQuery(provider, match, status)}
+    ) AS "matches"
+    ${seek}
+    ORDER BY ${column} ${direction}, "id" ${direction}
+    LIMIT ${take}
+  `;
+}
@@ -0,0 +1,90 @@
+import { Prisma, type JobApplication } from "@prisma/client";
+import { databaseProvider, type DatabaseProvider } from "@/lib/db/provider";
+
+export interface StatusEvent {
+  applicationId: string;
+  fromStatus: string | null;
+  toStatus: string;
+  at: Date;
+}
+
+// The first event of an application's history.
+export function createdEvent(row: Pick<JobApplication, "id" | "status" | "createdAt">): StatusEvent {
+  return { applicationId: row.id, fromStatus: null, toStatus: row.status, at: row.createdAt };
+}
+
+// Appends to the history. Runs inside the write's transaction, so an event
+// exists exactly when its status change committed.
+export async function recordStatusEvents(tx: Prisma.TransactionClient, events: StatusEvent[]) {
+  if (events.length === 0) return;
+  await tx.applicationStatusEvent.createMany({ data: events });
+}
+
+// DateTime is stored as epoch milliseconds in SQLite.
+function timestamp(date: Date, provider: DatabaseProvider) {
+  return provider === "postgresql" ? date : date.getTime();
+}
+
+// Whole days between two event timestamps; NULL when `later` is.
+function daysBetween(earlier: Prisma.Sql, later: Prisma.Sql, provider: DatabaseProvider) {
+  if (provider === "postgresql") {
+    return Prisma.sql`floor(extract(epoch FROM (${later} - ${earlier})) / 86400)::int`;
+  }
+  return Prisma.sql`((${later}) - ${earlier}) / 86400000`;
+}
+
+// Event `n` comes after event `e` of the same application. Ids break ties
+// between events recorded in the same millisecond.
+const FOLLOWS = Prisma.sql`n."applicationId" = e."applicationId" AND n."at" >= e."at" AND n."id" > e."id"`;
+
+interface WindowOptions {
+  since: Date;
+  until: Date;
+  provider?: DatabaseProvider;
+}
+
+/**
+ * Histogram of how long stays in `status` lasted, for entries into it
+ * within the window: (days, count) rows, with days NULL for stays that
+ * have not ended. Each entry is a range scan on (toStatus, at) and finds
+ * the event that ended it with one seek on (applicationId, at).
+ */
+export function timeInStageQuery(
+  status: string,
+  { since, until, provider = databaseProvider() }: WindowOptions
+) {
+  const left = Prisma.sql`(
+    SELECT n."at" FROM "application_status_events" n
+    WHERE ${FOLLOWS}
+    ORDER BY n."at", n."id"
+    LIMIT 1
+  )`;
+  return Prisma.sql`
+    SELECT "days", CAST(COUNT(*) AS INTEGER) AS "count" FROM (
+      SELECT ${daysBetween(Prisma.sql`e."at"`, left, provider)} AS "days"
+      FROM "application_status_events" e
+      WHERE e."toStatus" = ${status}
+        AND e."at" >= ${timestamp(since, provider)} AND e."at" < ${timestamp(until, provider)}
+    ) AS "stays"
+    GROUP BY "days"
+  `;
+}
+
+// Entries into `fromStatus` within the window, and how many of them were
+// later followed by `toStatus`; same index paths as timeInStageQuery.
+export function conversionQuery(
+  fromStatus: string,
+  toStatus: string,
+  { since, until, provider = databaseProvider() }: WindowOptions
+) {
+  return Prisma.sql`
+    SELECT CAST(COUNT(*) AS INTEGER) AS "entered",
+           CAST(COALESCE(SUM(CASE WHEN EXISTS (
+             SELECT 1 FROM "application_status_events" n
+             WHERE ${FOLLOWS} AND n."toStatus" = ${toStatus}
+           ) THEN 1 ELSE 0 END), 0) AS INTEGER) AS "converted"
+    FROM "application_status_events" e
+    WHERE e."toStatus" = ${fromStatus}
+      AND e."at" >= ${timestamp(since, provider)} AND e."at" < ${timestamp(until, provider)}
+  `;
+}
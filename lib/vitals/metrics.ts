@@ -0,0 +1,31 @@
+import { z } from "zod";
+
+// Core Web Vitals reported by next/web-vitals, plus our own render timings:
+//   filter-to-results  filter/sort/search change until the new list commits
+//   results-hydrated   navigation start until the first list has hydrated
+export const VITAL_NAMES = [
+  "LCP",
+  "INP",
+  "CLS",
+  "FCP",
+  "TTFB",
+  "filter-to-results",
+  "results-hydrated",
+] as const;
+
+export type VitalName = (typeof VITAL_NAMES)[number];
+
+export const VITAL_RATINGS = ["good", "needs-improvement", "poor"] as const;
+
+export const vitalReportSchema = z.object({
+  name: z.enum(VITAL_NAMES),
+  value: z.number().finite().nonnegative(),
+  rating: z.enum(VITAL_RATINGS).optional(),
+  page: z.string().max(200).optional(),
+});
+
+export const vitalReportsSchema = z.array(vitalReportSchema).max(50);
+
+export type VitalReport = z.infer<typeof vitalReportSchema>;
+
+export const VITALS_ENDPOINT = "/api/vitals";
@@ -0,0 +1,66 @@
+import { VITALS_ENDPOINT, type VitalReport } from "@/lib/vitals/metrics";
+
+const FLUSH_DELAY_MS = 5000;
+const MAX_QUEUE = 10;
+
+const queue: VitalReport[] = [];
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+let listening = false;
+
+function flush() {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  if (queue.length === 0) return;
+
+  const body = JSON.stringify(queue.splice(0));
+  // sendBeacon survives the page being unloaded; fall back to a keepalive fetch.
+  if (navigator.sendBeacon?.(VITALS_ENDPOINT, body)) return;
+  fetch(VITALS_ENDPOINT, { method: "POST", body, keepalive: true }).catch(() => {});
+}
+
+/** Queues a measurement; batches are sent every few seconds and when the tab is hidden. */
+export function reportVital(report: Omit<VitalReport, "page">) {
+  if (typeof window === "undefined") return;
+
+  if (!listening) {
+    listening = true;
+    document.addEventListener("visibilitychange", () => {
+      if (document.visibilityState === "hidden") flush();
+    });
+  }
+
+  queue.push({ ...report, page: window.location.pathname });
+  if (queue.length >= MAX_QUEUE) {
+    flush();
+  } else if (!flushTimer) {
+    flushTimer = setTimeout(flush, FLUSH_DELAY_MS);
+  }
+}
+
+let pendingFilterChange: number | null = null;
+let hydrationReported = false;
+
+/** Called when ApplicationFilters starts a filter, sort or search transition. */
+export function markFilterChange() {
+  pendingFilterChange = performance.now();
+  performance.mark?.("filters:change");
+}
+
+/**
+ * Called once the list for the current filters has committed. Reports the
+ * time since the last filter change, or on first load the time from
+ * navigation start until the list hydrated.
+ */
+export function measureResultsRendered() {
+  const now = performance.now();
+  if (pendingFilterChange !== null) {
+    reportVital({ name: "filter-to-results", value: now - pendingFilterChange });
+    performance.mark?.("filters:results");
+    pendingFilterChange = null;
+  } else if (!hydrationReported) {
+    reportVital({ name: "results-hydrated", value: now });
+  }
+  hydrationReported = true;
+}
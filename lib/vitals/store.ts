@@ -0,0 +1,45 @@
+import { Histogram, type HistogramSnapshot } from "@/lib/metrics/histogram";
+import { VITAL_RATINGS, type VitalName, type VitalReport } from "@/lib/vitals/metrics";
+
+// CLS is a unitless layout-shift score; everything else is in milliseconds.
+const CLS_BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.15, 0.25, 0.5, 1];
+const MS_BUCKETS = [25, 50, 100, 200, 300, 500, 800, 1000, 1800, 2500, 4000, 6000, 10000];
+
+export interface VitalSummary extends HistogramSnapshot {
+  name: VitalName;
+  ratings: Record<(typeof VITAL_RATINGS)[number], number>;
+}
+
+interface Series {
+  histogram: Histogram;
+  ratings: VitalSummary["ratings"];
+}
+
+const series = new Map<VitalName, Series>();
+
+export function recordVitals(reports: VitalReport[]) {
+  for (const report of reports) {
+    let entry = series.get(report.name);
+    if (!entry) {
+      entry = {
+        histogram: new Histogram(report.name === "CLS" ? CLS_BUCKETS : MS_BUCKETS),
+        ratings: { good: 0, "needs-improvement": 0, poor: 0 },
+      };
+      series.set(report.name, entry);
+    }
+    entry.histogram.observe(report.value);
+    if (report.rating) entry.ratings[report.rating]++;
+  }
+}
+
+export function getVitalsSummary(): VitalSummary[] {
+  return [...series.entries()].map(([name, { histogram, ratings }]) => ({
+    name,
+    ratings: { ...ratings },
+    ...histogram.snapshot(),
+  }));
+}
+
+export function resetVitals() {
+  series.clear();
+}
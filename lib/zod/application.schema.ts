@@ -45,13 +45,41 @@ export const updateApplicationSchema = createApplicationSchema.partial().extend(
   id: z.string().uuid("Invalid application ID"),
 });
 
+export const MAX_BULK_IDS = 500;
+
+// Ids for a bulk action, validated like the id of a single update.
+const applicationIdsSchema = z
+  .array(updateApplicationSchema.shape.id)
+  .min(1, "Select at least one application")
+  .max(MAX_BULK_IDS, `Select at most ${MAX_BULK_IDS} applications`)
+  .transform((ids) => [...new Set(ids)]);
+
+export const bulkUpdateStatusSchema = z.object({
+  ids: applicationIdsSchema,
+  status: applicationStatusSchema,
+});
+
+export const bulkDeleteSchema = z.object({
+  ids: applicationIdsSchema,
+});
+
+export const DEFAULT_PAGE_SIZE = 24;
+export const MAX_PAGE_SIZE = 100;
+
 export const filterSchema = z.object({
   status: applicationStatusSchema.optional(),
   search: z.string().optional(),
-  sortBy: z.enum(["applicationDate", "companyName"]).optional().default("applicationDate"),
+  sortBy: z
+    .enum(["applicationDate", "companyName", "relevance"])
+    .optional()
+    .default("applicationDate"),
   sortOrder: z.enum(["asc", "desc"]).optional().default("desc"),
+  cursor: z.string().optional(),
+  limit: z.coerce.number().int().min(1).max(MAX_PAGE_SIZE).optional(),
 });
 
 export type CreateApplicationInput = z.infer<typeof createApplicationSchema>;
 export type UpdateApplicationInput = z.infer<typeof updateApplicationSchema>;
 export type FilterInput = z.infer<typeof filterSchema>;
+export type BulkUpdateStatusInput = z.infer<typeof bulkUpdateStatusSchema>;
+export type BulkDeleteInput = z.infer<typeof bulkDeleteSchema>;
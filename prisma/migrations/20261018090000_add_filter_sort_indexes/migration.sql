@@ -0,0 +1,11 @@
+-- CreateIndex
+CREATE INDEX "job_applications_status_applicationDate_id_idx" ON "job_applications"("status", "applicationDate", "id");
+
+-- CreateIndex
+CREATE INDEX "job_applications_status_companyName_id_idx" ON "job_applications"("status", "companyName", "id");
+
+-- CreateIndex
+CREATE INDEX "job_applications_applicationDate_id_idx" ON "job_applications"("applicationDate", "id");
+
+-- CreateIndex
+CREATE INDEX "job_applications_companyName_id_idx" ON "job_applications"("companyName", "id");
@@ -0,0 +1,35 @@
+-- Full-text index over the searchable columns. External-content FTS5 table
+-- keyed on job_applications.rowid, kept in sync by the triggers below.
+CREATE VIRTUAL TABLE "job_applications_fts" USING fts5(
+    "companyName",
+    "jobTitle",
+    "location",
+    "notes",
+    content='job_applications',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+-- CreateTrigger
+CREATE TRIGGER "job_applications_fts_insert" AFTER INSERT ON "job_applications" BEGIN
+    INSERT INTO "job_applications_fts"("rowid", "companyName", "jobTitle", "location", "notes")
+    VALUES (new."rowid", new."companyName", new."jobTitle", new."location", new."notes");
+END;
+
+-- CreateTrigger
+CREATE TRIGGER "job_applications_fts_delete" AFTER DELETE ON "job_applications" BEGIN
+    INSERT INTO "job_applications_fts"("job_applications_fts", "rowid", "companyName", "jobTitle", "location", "notes")
+    VALUES ('delete', old."rowid", old."companyName", old."jobTitle", old."location", old."notes");
+END;
+
+-- CreateTrigger
+CREATE TRIGGER "job_applications_fts_update" AFTER UPDATE OF "companyName", "jobTitle", "location", "notes" ON "job_applications" BEGIN
+    INSERT INTO "job_applications_fts"("job_applications_fts", "rowid", "companyName", "jobTitle", "location", "notes")
+    VALUES ('delete', old."rowid", old."companyName", old."jobTitle", old."location", old."notes");
+    INSERT INTO "job_applications_fts"("rowid", "companyName", "jobTitle", "location", "notes")
+    VALUES (new."rowid", new."companyName", new."jobTitle", new."location", new."notes");
+END;
+
+-- Index rows that existed before this migration
+INSERT INTO "job_applications_fts"("job_applications_fts") VALUES ('rebuild');
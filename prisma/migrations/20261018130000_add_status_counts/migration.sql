@@ -0,0 +1,32 @@
+-- Rows per status, kept exact by the triggers below so the summary bar reads
+-- a handful of rows instead of scanning job_applications. The triggers run in
+-- the writing statement's transaction, and SQLite has a single writer, so
+-- concurrent mutations cannot interleave between a row change and its count.
+-- CreateTable
+CREATE TABLE "application_status_counts" (
+    "status" TEXT NOT NULL PRIMARY KEY,
+    "count" INTEGER NOT NULL DEFAULT 0
+);
+
+-- CreateTrigger
+CREATE TRIGGER "application_status_counts_insert" AFTER INSERT ON "job_applications" BEGIN
+    INSERT INTO "application_status_counts" ("status", "count") VALUES (new."status", 1)
+    ON CONFLICT ("status") DO UPDATE SET "count" = "count" + 1;
+END;
+
+-- CreateTrigger
+CREATE TRIGGER "application_status_counts_delete" AFTER DELETE ON "job_applications" BEGIN
+    UPDATE "application_status_counts" SET "count" = "count" - 1 WHERE "status" = old."status";
+END;
+
+-- CreateTrigger
+CREATE TRIGGER "application_status_counts_update" AFTER UPDATE OF "status" ON "job_applications"
+WHEN old."status" IS NOT new."status" BEGIN
+    UPDATE "application_status_counts" SET "count" = "count" - 1 WHERE "status" = old."status";
+    INSERT INTO "application_status_counts" ("status", "count") VALUES (new."status", 1)
+    ON CONFLICT ("status") DO UPDATE SET "count" = "count" + 1;
+END;
+
+-- Count rows that existed before this migration
+INSERT INTO "application_status_counts" ("status", "count")
+SELECT "status", COUNT(*) FROM "job_applications" GROUP BY "status";
@@ -0,0 +1,28 @@
+-- Rollups behind /analytics, updated by the repository in the same
+-- transaction as each write (see lib/repositories/rollups.ts).
+
+-- Applications per UTC day of applicationDate and current status.
+-- CreateTable
+CREATE TABLE "application_daily_rollups" (
+    "day" DATETIME NOT NULL,
+    "status" TEXT NOT NULL,
+    "count" INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY ("day", "status")
+);
+
+-- Status changes by new status and whole days since applicationDate.
+-- CreateTable
+CREATE TABLE "status_change_rollups" (
+    "toStatus" TEXT NOT NULL,
+    "days" INTEGER NOT NULL,
+    "count" INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY ("toStatus", "days")
+);
+
+-- Roll up rows that existed before this migration (DateTime is epoch ms)
+INSERT INTO "application_daily_rollups" ("day", "status", "count")
+SELECT ("applicationDate" / 86400000) * 86400000, "status", COUNT(*)
+FROM "job_applications"
+GROUP BY 1, 2;
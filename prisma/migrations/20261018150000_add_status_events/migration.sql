@@ -0,0 +1,40 @@
+-- Append-only history of status changes, written by the repository in the
+-- same transaction as the change (see lib/repositories/status-events.ts).
+-- Rows are never updated or deleted, not even with their application.
+-- CreateTable
+CREATE TABLE "application_status_events" (
+    "id" INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+    "applicationId" TEXT NOT NULL,
+    "fromStatus" TEXT,
+    "toStatus" TEXT NOT NULL,
+    "at" DATETIME NOT NULL
+);
+
+-- An application's history in order (and the next event after any one).
+-- CreateIndex
+CREATE INDEX "application_status_events_applicationId_at_idx" ON "application_status_events"("applicationId", "at");
+
+-- Entries into a status within a time window.
+-- CreateIndex
+CREATE INDEX "application_status_events_toStatus_at_idx" ON "application_status_events"("toStatus", "at");
+
+-- CreateTrigger
+CREATE TRIGGER "application_status_events_no_update"
+BEFORE UPDATE ON "application_status_events"
+BEGIN
+    SELECT RAISE(ABORT, 'application_status_events is append-only');
+END;
+
+-- CreateTrigger
+CREATE TRIGGER "application_status_events_no_delete"
+BEFORE DELETE ON "application_status_events"
+BEGIN
+    SELECT RAISE(ABORT, 'application_status_events is append-only');
+END;
+
+-- Earlier transitions were never recorded, so existing rows start their
+-- history with their current status at createdAt (DateTime is epoch ms)
+INSERT INTO "application_status_events" ("applicationId", "fromStatus", "toStatus", "at")
+SELECT "id", NULL, "status", "createdAt"
+FROM "job_applications"
+ORDER BY "createdAt", "id";
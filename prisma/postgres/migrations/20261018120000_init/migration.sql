@@ -0,0 +1,41 @@
+-- CreateTable
+CREATE TABLE "job_applications" (
+    "id" TEXT NOT NULL,
+    "companyName" TEXT NOT NULL,
+    "jobTitle" TEXT NOT NULL,
+    "status" TEXT NOT NULL DEFAULT 'APPLIED',
+    "location" TEXT NOT NULL,
+    "salaryRange" TEXT,
+    "applicationDate" TIMESTAMP(3) NOT NULL,
+    "notes" TEXT NOT NULL DEFAULT '',
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "job_applications_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "job_applications_status_applicationDate_id_idx" ON "job_applications"("status", "applicationDate", "id");
+
+-- CreateIndex
+CREATE INDEX "job_applications_status_companyName_id_idx" ON "job_applications"("status", "companyName", "id");
+
+-- CreateIndex
+CREATE INDEX "job_applications_applicationDate_id_idx" ON "job_applications"("applicationDate", "id");
+
+-- CreateIndex
+CREATE INDEX "job_applications_companyName_id_idx" ON "job_applications"("companyName", "id");
+
+-- Full-text search, the counterpart of the SQLite FTS5 table: a weighted
+-- tsvector kept up to date by Postgres itself. The 'simple' configuration
+-- lowercases without stemming, like FTS5's unicode61 tokenizer. Weights
+-- A-D rank companyName > jobTitle > location > notes.
+ALTER TABLE "job_applications" ADD COLUMN "search_vector" tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', "companyName"), 'A') ||
+    setweight(to_tsvector('simple', "jobTitle"), 'B') ||
+    setweight(to_tsvector('simple', "location"), 'C') ||
+    setweight(to_tsvector('simple', "notes"), 'D')
+) STORED;
+
+-- CreateIndex
+CREATE INDEX "job_applications_search_idx" ON "job_applications" USING GIN ("search_vector");
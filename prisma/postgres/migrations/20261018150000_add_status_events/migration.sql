@@ -0,0 +1,40 @@
+-- Append-only history of status changes, written by the repository in the
+-- same transaction as the change (see lib/repositories/status-events.ts).
+-- Rows are never updated or deleted, not even with their application.
+-- CreateTable
+CREATE TABLE "application_status_events" (
+    "id" SERIAL NOT NULL,
+    "applicationId" TEXT NOT NULL,
+    "fromStatus" TEXT,
+    "toStatus" TEXT NOT NULL,
+    "at" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "application_status_events_pkey" PRIMARY KEY ("id")
+);
+
+-- An application's history in order (and the next event after any one).
+-- CreateIndex
+CREATE INDEX "application_status_events_applicationId_at_idx" ON "application_status_events"("applicationId", "at");
+
+-- Entries into a status within a time window.
+-- CreateIndex
+CREATE INDEX "application_status_events_toStatus_at_idx" ON "application_status_events"("toStatus", "at");
+
+-- CreateFunction
+CREATE FUNCTION "application_status_events_append_only"() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    RAISE EXCEPTION 'application_status_events is append-only';
+END;
+$$;
+
+-- CreateTrigger
+CREATE TRIGGER "application_status_events_append_only"
+BEFORE UPDATE OR DELETE ON "application_status_events"
+FOR EACH STATEMENT EXECUTE FUNCTION "application_status_events_append_only"();
+
+-- Earlier transitions were never recorded, so existing rows start their
+-- history with their current status at createdAt
+INSERT INTO "application_status_events" ("applicationId", "fromStatus", "toStatus", "at")
+SELECT "id", NULL, "status", "createdAt"
+FROM "job_applications"
+ORDER BY "createdAt", "id";
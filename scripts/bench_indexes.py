@@ -0,0 +1,128 @@
+"""Benchmark the findAll query shapes with and without the filter/sort indexes.
+
+Builds two scratch SQLite databases from prisma/migrations -- one with only the
+initial migration, one with every migration -- seeds both with the same rows,
+then prints EXPLAIN QUERY PLAN and latency for each sort option offered by
+ApplicationFilters, with and without a status filter.
+
+Usage: python scripts/bench_indexes.py [--rows 100000] [--repeat 20]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "prisma" / "migrations"
+
+STATUSES = ["APPLIED", "INTERVIEW", "OFFER", "REJECTED", "GHOSTED"]
+
+# (label, sortBy, sortOrder) -- mirrors the sort <Select> in ApplicationFilters.
+SORT_OPTIONS = [
+    ("Newest First", "applicationDate", "DESC"),
+    ("Oldest First", "applicationDate", "ASC"),
+    ("Company (A-Z)", "companyName", "ASC"),
+    ("Company (Z-A)", "companyName", "DESC"),
+]
+
+PAGE_SIZE = 24
+
+
+def migration_files(include_all):
+    files = sorted(MIGRATIONS_DIR.glob("*/migration.sql"))
+    return files if include_all else files[:1]
+
+
+def build_database(path, include_all):
+    conn = sqlite3.connect(path)
+    for migration in migration_files(include_all):
+        conn.executescript(migration.read_text())
+    return conn
+
+
+def generate_rows(count, seed=42):
+    rng = random.Random(seed)
+    companies = [f"Company {i:05d}" for i in range(max(count // 20, 1))]
+    start_ms = 1_672_531_200_000  # 2023-01-01
+    span_ms = 3 * 365 * 86_400_000
+    now_ms = int(time.time() * 1000)
+    for _ in range(count):
+        yield (
+            str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            rng.choice(companies),
+            "Software Engineer",
+            rng.choice(STATUSES),
+            "Remote",
+            None,
+            start_ms + rng.randrange(span_ms),
+            "",
+            now_ms,
+            now_ms,
+        )
+
+
+def seed(conn, count):
+    conn.executemany(
+        'INSERT INTO "job_applications" ("id", "companyName", "jobTitle", "status", '
+        '"location", "salaryRange", "applicationDate", "notes", "createdAt", "updatedAt") '
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        generate_rows(count),
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+
+
+def query_for(sort_by, sort_order, with_status):
+    where = 'WHERE "status" = ? ' if with_status else ""
+    return (
+        f'SELECT * FROM "job_applications" {where}'
+        f'ORDER BY "{sort_by}" {sort_order}, "id" {sort_order} LIMIT {PAGE_SIZE + 1}'
+    )
+
+
+def time_query(conn, sql, params, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        databases = {}
+        for label, include_all in (("baseline", False), ("indexed", True)):
+            conn = build_database(os.path.join(tmp, f"{label}.db"), include_all)
+            seed(conn, args.rows)
+            databases[label] = conn
+
+        print(f"Seeded {args.rows:,} rows; median of {args.repeat} runs per query.\n")
+        for sort_label, sort_by, sort_order in SORT_OPTIONS:
+            for with_status in (False, True):
+                sql = query_for(sort_by, sort_order, with_status)
+                params = ("INTERVIEW",) if with_status else ()
+                title = f"{sort_label}{' + status=INTERVIEW' if with_status else ''}"
+                print(f"== {title}")
+                for label, conn in databases.items():
+                    plan = "; ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+                    latency = time_query(conn, sql, params, args.repeat)
+                    print(f"  {label:<9} {latency:8.2f} ms  {plan}")
+                print()
+
+        for conn in databases.values():
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
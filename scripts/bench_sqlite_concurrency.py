@@ -0,0 +1,144 @@
+"""Benchmark concurrent reads and writes under SQLite's default and tuned pragmas.
+
+Seeds a scratch database from prisma/migrations, then runs reader and writer
+processes against it for a fixed time, once per pragma profile. Readers run
+the first-page findAll query (alternating with a status filter); writers
+insert one application per statement, like createApplication. Each process
+holds its own connection, as the pooled connections of the app server do.
+
+The "tuned" profile is what lib/db/sqlite.ts ships: WAL, which is stored in
+the database file and so reaches every pooled connection. Both profiles use
+the same busy timeout, which the app passes to Prisma for each connection.
+
+Usage: python scripts/bench_sqlite_concurrency.py [--rows 50000] [--readers 4] [--writers 2] [--seconds 10]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+
+from bench_indexes import build_database, query_for, seed
+
+PROFILES = {
+    "default": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+    },
+    "tuned": {
+        "journal_mode": "WAL",
+    },
+}
+
+INSERT = (
+    'INSERT INTO "job_applications" ("id", "companyName", "jobTitle", "status", '
+    '"location", "salaryRange", "applicationDate", "notes", "createdAt", "updatedAt") '
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def connect(path, pragmas, busy_timeout_ms):
+    conn = sqlite3.connect(path, isolation_level=None, timeout=busy_timeout_ms / 1000)
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+
+def percentile(samples, p):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def run_worker(role, path, pragmas, busy_timeout_ms, deadline, seed_value):
+    rng = random.Random(seed_value)
+    conn = connect(path, pragmas, busy_timeout_ms)
+    latencies, errors = [], 0
+    reads = [
+        (query_for("applicationDate", "DESC", False), ()),
+        (query_for("applicationDate", "DESC", True), ("INTERVIEW",)),
+    ]
+    while time.time() < deadline:
+        started = time.perf_counter()
+        try:
+            if role == "read":
+                sql, params = rng.choice(reads)
+                conn.execute(sql, params).fetchall()
+            else:
+                now_ms = int(time.time() * 1000)
+                conn.execute(
+                    INSERT,
+                    (str(uuid.uuid4()), f"Bench {rng.randrange(1000)}", "Engineer", "APPLIED",
+                     "Remote", None, now_ms, "", now_ms, now_ms),
+                )
+        except sqlite3.OperationalError as error:
+            if "locked" not in str(error) and "busy" not in str(error):
+                raise
+            errors += 1
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+    conn.close()
+    return role, latencies, errors
+
+
+def run_profile(name, path, args):
+    # Switching journal_mode needs the database to ourselves, so do it up front.
+    setup = connect(path, PROFILES[name], args.busy_timeout)
+    setup.close()
+
+    deadline = time.time() + args.seconds
+    jobs = [("read", i) for i in range(args.readers)] + [("write", i) for i in range(args.writers)]
+    with multiprocessing.Pool(len(jobs)) as pool:
+        results = pool.starmap(
+            run_worker,
+            [(role, path, PROFILES[name], args.busy_timeout, deadline, index) for role, index in jobs],
+        )
+
+    summary = {}
+    for role in ("read", "write"):
+        latencies = [ms for r, samples, _ in results if r == role for ms in samples]
+        summary[role] = {
+            "ops": len(latencies) / args.seconds,
+            "p50": statistics.median(latencies) if latencies else 0.0,
+            "p95": percentile(latencies, 0.95),
+            "errors": sum(errors for r, _, errors in results if r == role),
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--busy-timeout", type=int, default=5000, help="busy_timeout in ms for both profiles")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(
+            f"{args.rows:,} seeded rows, {args.readers} readers, {args.writers} writers, "
+            f"{args.seconds:g}s per profile, busy_timeout {args.busy_timeout} ms\n"
+        )
+        print(f"{'profile':<8} {'role':<5} {'ops/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'locked':>7}")
+        for name in PROFILES:
+            path = os.path.join(tmp, f"{name}.db")
+            conn = build_database(path, include_all=True)
+            seed(conn, args.rows)
+            conn.close()
+
+            for role, stats in run_profile(name, path, args).items():
+                print(
+                    f"{name:<8} {role:<5} {stats['ops']:>9.0f} {stats['p50']:>8.2f} "
+                    f"{stats['p95']:>8.2f} {stats['errors']:>7}"
+                )
+
+
+if __name__ == "__main__":
+    main()
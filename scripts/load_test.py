@@ -0,0 +1,355 @@
+"""Replay realistic traffic against a running server and report latency.
+
+Each virtual user holds one keep-alive connection and loops over a weighted
+mix of operations until the run ends:
+
+  page       GET /applications with random search/status/sortBy params
+  load_more  getApplications server action (the infinite-scroll fetch),
+             passing the nextCursor of this user's last page load or
+             load_more so each call fetches the following page; once a
+             list runs out it loads a fresh page instead
+  create     createApplication server action with a synthetic record
+  update     updateApplication server action, changing the status of a
+             record this user created
+  delete     deleteApplication server action on a record this user created
+
+Updates and deletes only touch records created during the run, so existing
+data survives. Server actions are called the way the browser calls them,
+with a POST carrying a Next-Action header. Their ids come from the build's
+server-reference manifest, so run against `pnpm build && pnpm start`. If the
+manifest is missing, only page loads are sent.
+
+Prints throughput, error rate and p50/p95/p99 latency per operation. Pass
+--json to save the summary, and --compare with an earlier summary to print
+the change.
+
+Usage:
+    python scripts/load_test.py [--url http://localhost:3000] [--users 20]
+                                [--duration 30] [--ramp-up 5] [--think-ms 0]
+                                [--json PATH] [--compare BASELINE.json]
+                                [--max-error-rate 0.01]
+"""
+
+import argparse
+import http.client
+import json
+import random
+import re
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+from generate_applications import COMPANY_PREFIXES, LOCATIONS, ROLES, ApplicationFactory, load_statuses
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = REPO_DIR / ".next" / "server" / "server-reference-manifest.json"
+ACTION_NAMES = ["getApplications", "createApplication", "updateApplication", "deleteApplication"]
+ACTION_PAGE = "/applications"
+
+OPERATION_WEIGHTS = {"page": 60, "load_more": 15, "create": 10, "update": 10, "delete": 5}
+SORT_OPTIONS = [
+    {},
+    {"sortBy": "applicationDate", "sortOrder": "asc"},
+    {"sortBy": "companyName", "sortOrder": "asc"},
+    {"sortBy": "companyName", "sortOrder": "desc"},
+]
+
+# Created records come back in the action's RSC payload as {"success":true,"data":{"id":...
+CREATED_ID = re.compile(rb'"success":true,"data":\{"id":"([0-9a-f-]{36})"')
+ACTION_FAILED = re.compile(rb'"success":false')
+# In a page's HTML the RSC payload sits inside a JS string, so quotes are escaped.
+NEXT_CURSOR = re.compile(rb'"nextCursor\\?":\\?"([A-Za-z0-9_-]+)')
+
+
+def load_action_ids(manifest_path=MANIFEST_PATH):
+    """Map exported action names to their ids from the Next.js build manifest."""
+    if not manifest_path.exists():
+        return {}
+    manifest = json.loads(manifest_path.read_text())
+    ids = {}
+    for action_id, entry in manifest.get("node", {}).items():
+        names = {entry.get("exportedName")}
+        names.update(worker.get("exportedName") for worker in entry.get("workers", {}).values() if isinstance(worker, dict))
+        for name in names & set(ACTION_NAMES):
+            ids[name] = action_id
+    return ids
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection, reopened after errors."""
+
+    def __init__(self, base_url, timeout):
+        parts = urlsplit(base_url)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self._factory = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._netloc = parts.netloc
+        self._timeout = timeout
+        self._conn = None
+
+    def request(self, method, path, body=None, headers=None):
+        try:
+            if self._conn is None:
+                self._conn = self._factory(self._netloc, timeout=self._timeout)
+                self._conn.connect()
+                # http.client writes headers and body separately; without this,
+                # Nagle plus delayed ACKs add ~40 ms to every POST.
+                self._conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._conn.request(method, path, body=body, headers=headers or {})
+            response = self._conn.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+@dataclass
+class Samples:
+    latencies: dict = field(default_factory=dict)  # operation -> [ms]
+    errors: dict = field(default_factory=dict)  # operation -> count
+
+    def add(self, operation, latency_ms, ok):
+        self.latencies.setdefault(operation, []).append(latency_ms)
+        if not ok:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+
+    def merge(self, other):
+        for operation, values in other.latencies.items():
+            self.latencies.setdefault(operation, []).extend(values)
+        for operation, count in other.errors.items():
+            self.errors[operation] = self.errors.get(operation, 0) + count
+
+
+class VirtualUser:
+    def __init__(self, index, args, action_ids, statuses):
+        self.rng = random.Random(args.seed + index)
+        self.connection = Connection(args.url, args.timeout)
+        self.action_ids = action_ids
+        self.statuses = statuses
+        self.factory = ApplicationFactory(statuses, seed=args.seed + index)
+        self.records = self.factory.rows(sys.maxsize)
+        self.created = []
+        self.scroll = None  # (filters, nextCursor) of the list being scrolled
+        self.samples = Samples()
+
+        weights = {op: w for op, w in OPERATION_WEIGHTS.items() if op == "page" or action_ids}
+        self.operations = list(weights)
+        self.weights = list(weights.values())
+
+    # Operations return (ok, response body).
+
+    def _random_filters(self):
+        filters = dict(self.rng.choice(SORT_OPTIONS))
+        if self.rng.random() < 0.3:
+            filters["status"] = self.rng.choice(self.statuses)
+        if self.rng.random() < 0.3:
+            filters["search"] = self.rng.choice(
+                [*COMPANY_PREFIXES, *(role.split()[0] for role in ROLES), *(loc.split(",")[0] for loc, _ in LOCATIONS)]
+            )
+        return filters
+
+    def _action(self, name, *args):
+        status, body = self.connection.request(
+            "POST",
+            ACTION_PAGE,
+            body=json.dumps(args),
+            headers={
+                "Next-Action": self.action_ids[name],
+                "Accept": "text/x-component",
+                "Content-Type": "text/plain;charset=UTF-8",
+                "Origin": self.connection.origin,
+            },
+        )
+        return status < 400 and not ACTION_FAILED.search(body), body
+
+    def _follow(self, filters, body):
+        match = NEXT_CURSOR.search(body)
+        self.scroll = (filters, match.group(1).decode()) if match else None
+
+    def page(self):
+        filters = self._random_filters()
+        status, body = self.connection.request("GET", f"{ACTION_PAGE}?{urlencode(filters)}")
+        self._follow(filters, body if status == 200 else b"")
+        return status == 200, body
+
+    def load_more(self):
+        if self.scroll is None:
+            return self.page()
+        filters, cursor = self.scroll
+        ok, body = self._action("getApplications", {**filters, "cursor": cursor})
+        self._follow(filters, body if ok else b"")
+        return ok, body
+
+    def create(self):
+        row = next(self.records)
+        record = {
+            "companyName": row[1],
+            "jobTitle": row[2],
+            "status": row[3],
+            "location": row[4],
+            "salaryRange": row[5] or "",
+            "applicationDate": datetime.fromtimestamp(row[6] / 1000, timezone.utc).isoformat(),
+            "notes": row[7],
+        }
+        ok, body = self._action("createApplication", record)
+        match = CREATED_ID.search(body)
+        if match:
+            self.created.append(match.group(1).decode())
+        return ok, body
+
+    def update(self):
+        if not self.created:
+            return self.create()
+        target = self.rng.choice(self.created)
+        return self._action("updateApplication", {"id": target, "status": self.rng.choice(self.statuses)})
+
+    def delete(self):
+        if not self.created:
+            return self.create()
+        target = self.created.pop(self.rng.randrange(len(self.created)))
+        return self._action("deleteApplication", target)
+
+    def run(self, start_at, stop_at, think_ms, stop_event):
+        time.sleep(max(0.0, start_at - time.monotonic()))
+        while time.monotonic() < stop_at and not stop_event.is_set():
+            operation = self.rng.choices(self.operations, self.weights)[0]
+            started = time.perf_counter()
+            try:
+                ok, _body = getattr(self, operation)()
+            except (OSError, http.client.HTTPException):
+                ok = False
+            self.samples.add(operation, (time.perf_counter() - started) * 1000, ok)
+            if think_ms:
+                time.sleep(self.rng.expovariate(1000 / think_ms))
+        self.connection.close()
+        return self.samples
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples, elapsed):
+    def stats(latencies, errors):
+        ordered = sorted(latencies)
+        return {
+            "requests": len(ordered),
+            "errors": errors,
+            "error_rate": errors / len(ordered) if ordered else 0.0,
+            "throughput": len(ordered) / elapsed,
+            "p50": percentile(ordered, 0.50),
+            "p95": percentile(ordered, 0.95),
+            "p99": percentile(ordered, 0.99),
+            "max": ordered[-1] if ordered else 0.0,
+        }
+
+    operations = {
+        op: stats(samples.latencies[op], samples.errors.get(op, 0)) for op in OPERATION_WEIGHTS if op in samples.latencies
+    }
+    every = [value for values in samples.latencies.values() for value in values]
+    return {
+        "duration": round(elapsed, 3),
+        "total": stats(every, sum(samples.errors.values())),
+        "operations": operations,
+    }
+
+
+def print_summary(summary):
+    print(f"\n{'operation':<10} {'requests':>9} {'req/s':>8} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    rows = [*summary["operations"].items(), ("total", summary["total"])]
+    for name, s in rows:
+        print(
+            f"{name:<10} {s['requests']:>9,} {s['throughput']:8.1f} {s['error_rate']:7.2%} "
+            f"{s['p50']:8.1f} {s['p95']:8.1f} {s['p99']:8.1f} {s['max']:8.1f}"
+        )
+
+
+def print_comparison(baseline_path, summary):
+    baseline = json.loads(Path(baseline_path).read_text())
+    before = {**baseline["operations"], "total": baseline["total"]}
+    print(f"\n{'operation':<10} {'metric':<8} {'before':>9} {'after':>9} {'change':>8}")
+    for name, after in [*summary["operations"].items(), ("total", summary["total"])]:
+        previous = before.get(name)
+        if previous is None:
+            continue
+        for metric in ("throughput", "p50", "p95", "p99"):
+            old, new = previous[metric], after[metric]
+            change = f"{(new - old) / old:+8.1%}" if old else f"{'-':>8}"
+            print(f"{name:<10} {metric:<8} {old:9.1f} {new:9.1f} {change}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:3000")
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run after ramp-up starts")
+    parser.add_argument("--ramp-up", type=float, default=5, help="seconds over which users are started")
+    parser.add_argument("--think-ms", type=float, default=0, help="mean pause between a user's requests")
+    parser.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH)
+    parser.add_argument("--json", dest="json_path", type=Path, help="write the summary here")
+    parser.add_argument("--compare", dest="baseline_path", help="summary JSON of an earlier run")
+    parser.add_argument("--max-error-rate", type=float, help="exit 1 if the overall error rate is higher")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    action_ids = load_action_ids(args.manifest)
+    missing = [name for name in ACTION_NAMES if name not in action_ids]
+    if missing:
+        print(f"No action ids for {', '.join(missing)} in {args.manifest}; sending page loads only.", file=sys.stderr)
+        action_ids = {}
+
+    statuses = load_statuses()
+    users = [VirtualUser(i, args, action_ids, statuses) for i in range(args.users)]
+    stop_event = threading.Event()
+    started = time.monotonic()
+    stop_at = started + args.duration
+    print(f"Running {args.users} users against {args.url} for {args.duration:.0f}s", flush=True)
+
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        futures = [
+            pool.submit(user.run, started + args.ramp_up * i / max(args.users, 1), stop_at, args.think_ms, stop_event)
+            for i, user in enumerate(users)
+        ]
+        try:
+            results = [future.result() for future in futures]
+        except KeyboardInterrupt:
+            stop_event.set()
+            results = [future.result() for future in futures]
+
+    samples = Samples()
+    for result in results:
+        samples.merge(result)
+    summary = summarize(samples, time.monotonic() - started)
+    print_summary(summary)
+
+    if args.json_path:
+        args.json_path.parent.mkdir(parents=True, exist_ok=True)
+        args.json_path.write_text(json.dumps(summary, indent=2))
+    if args.baseline_path:
+        print_comparison(args.baseline_path, summary)
+
+    if args.max_error_rate is not None and summary["total"]["error_rate"] > args.max_error_rate:
+        print(f"\nError rate {summary['total']['error_rate']:.2%} exceeds {args.max_error_rate:.2%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
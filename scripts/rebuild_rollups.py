@@ -0,0 +1,77 @@
+"""Rebuild the daily analytics rollups from job_applications.
+
+The app updates application_daily_rollups and appends to
+application_status_events on every write it makes (see
+lib/repositories/rollups.ts and status-events.ts). Rows written around it,
+by the synthetic data generator, the e2e fixtures or hand-written SQL, need
+this rebuild, which also starts the history of every application that has
+none, as the add_status_events migration did for existing rows.
+status_change_rollups and existing events record history that
+job_applications no longer holds, so they are left alone.
+
+Usage:
+    python scripts/rebuild_rollups.py [--database URL]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+
+from reconcile_status_counts import connect
+
+DAILY_ROLLUPS_TABLE = "application_daily_rollups"
+STATUS_CHANGE_ROLLUPS_TABLE = "status_change_rollups"
+STATUS_EVENTS_TABLE = "application_status_events"
+
+# UTC day of applicationDate; Prisma stores SQLite DateTime as epoch ms.
+DAY_EXPRESSIONS = {
+    "sqlite": '("applicationDate" / 86400000) * 86400000',
+    "postgresql": "date_trunc('day', \"applicationDate\")",
+}
+
+
+def rebuild_statements(dialect):
+    return [
+        f'DELETE FROM "{DAILY_ROLLUPS_TABLE}"',
+        f'INSERT INTO "{DAILY_ROLLUPS_TABLE}" ("day", "status", "count") '
+        f'SELECT {DAY_EXPRESSIONS[dialect]}, "status", COUNT(*) FROM "job_applications" GROUP BY 1, 2',
+    ]
+
+
+# One (id, NULL, status, createdAt) event per application without history.
+HISTORY_BACKFILL = (
+    f'INSERT INTO "{STATUS_EVENTS_TABLE}" ("applicationId", "fromStatus", "toStatus", "at") '
+    'SELECT j."id", NULL, j."status", j."createdAt" FROM "job_applications" j '
+    f'WHERE NOT EXISTS (SELECT 1 FROM "{STATUS_EVENTS_TABLE}" e WHERE e."applicationId" = j."id") '
+    'ORDER BY j."createdAt", j."id"'
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database",
+        default=os.environ.get("DATABASE_URL", "file:./dev.db"),
+        help="DATABASE_URL to rebuild (default: DATABASE_URL, else file:./dev.db)",
+    )
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    dialect = "sqlite" if isinstance(conn, sqlite3.Connection) else "postgresql"
+    try:
+        cursor = conn.cursor()
+        for statement in rebuild_statements(dialect):
+            cursor.execute(statement)
+        cursor.execute(HISTORY_BACKFILL)
+        started = cursor.rowcount
+        conn.commit()
+        cursor.execute(f'SELECT COUNT(*) FROM "{DAILY_ROLLUPS_TABLE}"')
+        print(f"Rebuilt {cursor.fetchone()[0]:,} daily rollup rows; started the history of {started:,} applications.")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Rebuild the full-text search index from job_applications.
+
+On SQLite, job_applications_fts is an external-content FTS5 table keyed on
+rowid and kept in sync by triggers. A VACUUM can renumber rowids, and rows
+written with the triggers disabled are missing from it; the FTS5 'rebuild'
+command re-reads every row, then 'optimize' merges the index. On PostgreSQL
+the search_vector column is generated, so only its GIN index is rebuilt,
+e.g. after heavy churn has bloated it.
+
+Usage:
+    python scripts/rebuild_search_index.py [--database URL]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+
+from reconcile_status_counts import connect
+
+FTS_TABLE = "job_applications_fts"
+
+REBUILD_STATEMENTS = {
+    "sqlite": [
+        f'INSERT INTO "{FTS_TABLE}"("{FTS_TABLE}") VALUES (\'rebuild\')',
+        f'INSERT INTO "{FTS_TABLE}"("{FTS_TABLE}") VALUES (\'optimize\')',
+    ],
+    "postgresql": ['REINDEX INDEX "job_applications_search_idx"'],
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database",
+        default=os.environ.get("DATABASE_URL", "file:./dev.db"),
+        help="DATABASE_URL to rebuild (default: DATABASE_URL, else file:./dev.db)",
+    )
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    dialect = "sqlite" if isinstance(conn, sqlite3.Connection) else "postgresql"
+    try:
+        cursor = conn.cursor()
+        for statement in REBUILD_STATEMENTS[dialect]:
+            cursor.execute(statement)
+        conn.commit()
+        cursor.execute('SELECT COUNT(*) FROM "job_applications"')
+        print(f"Rebuilt the search index over {cursor.fetchone()[0]:,} applications.")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Rebuild the per-status counters from job_applications.
+
+application_status_counts is kept exact by triggers on job_applications (see
+the add_status_counts migrations), so it only drifts if rows were written
+with those triggers disabled or the table was edited by hand. This prints
+any drift and then replaces the counters with a fresh GROUP BY, in one
+transaction. With --check it only reports, exiting 1 if anything drifted.
+
+Works on SQLite and, with psycopg 3 installed, on PostgreSQL.
+
+Usage:
+    python scripts/reconcile_status_counts.py [--database URL] [--check]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+COUNTS_TABLE = "application_status_counts"
+
+DRIFT_SQL = f"""
+    SELECT s."status", COALESCE(c."count", 0), COALESCE(a."count", 0)
+    FROM (
+        SELECT "status" FROM "{COUNTS_TABLE}"
+        UNION
+        SELECT DISTINCT "status" FROM "job_applications"
+    ) AS s
+    LEFT JOIN "{COUNTS_TABLE}" AS c ON c."status" = s."status"
+    LEFT JOIN (
+        SELECT "status", COUNT(*) AS "count" FROM "job_applications" GROUP BY "status"
+    ) AS a ON a."status" = s."status"
+    WHERE COALESCE(c."count", 0) <> COALESCE(a."count", 0)
+    ORDER BY s."status"
+"""
+
+# Also run by generate_applications.py, which loads rows with the triggers dropped.
+RECONCILE_STATEMENTS = [
+    f'DELETE FROM "{COUNTS_TABLE}"',
+    f'INSERT INTO "{COUNTS_TABLE}" ("status", "count") '
+    'SELECT "status", COUNT(*) FROM "job_applications" GROUP BY "status"',
+]
+
+
+def connect(url):
+    """Open DATABASE_URL: a Prisma ``file:`` URL (relative to prisma/) or ``postgresql://``."""
+    if url.startswith(("postgresql://", "postgres://")):
+        try:
+            import psycopg
+        except ImportError:
+            raise SystemExit("PostgreSQL needs psycopg 3: pip install 'psycopg[binary]'") from None
+        # psycopg rejects Prisma-only parameters such as ?schema=.
+        return psycopg.connect(url.split("?", 1)[0])
+    path = url.removeprefix("file:")
+    path = Path(path) if os.path.isabs(path) else (REPO_DIR / "prisma" / path).resolve()
+    if not path.exists():
+        raise SystemExit(f"{path} does not exist; run `pnpm db:migrate` first.")
+    return sqlite3.connect(path, timeout=10)
+
+
+def drift(conn):
+    """(status, counted, actual) for every status whose counter is wrong."""
+    cursor = conn.cursor()
+    cursor.execute(DRIFT_SQL)
+    return cursor.fetchall()
+
+
+def reconcile(conn):
+    cursor = conn.cursor()
+    try:
+        for statement in RECONCILE_STATEMENTS:
+            cursor.execute(statement)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database",
+        default=os.environ.get("DATABASE_URL", "file:./dev.db"),
+        help="DATABASE_URL to reconcile (default: DATABASE_URL, else file:./dev.db)",
+    )
+    parser.add_argument("--check", action="store_true", help="report drift without fixing it")
+    args = parser.parse_args(argv)
+
+    conn = connect(args.database)
+    try:
+        drifted = drift(conn)
+        for status, counted, actual in drifted:
+            print(f"  {status:<12} counted {counted:>9,}  actual {actual:>9,}")
+        if args.check:
+            print("Counters are exact." if not drifted else f"{len(drifted)} status counter(s) drifted.")
+            return 1 if drifted else 0
+        reconcile(conn)
+        print(f"Rebuilt status counters ({len(drifted)} had drifted).")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+// @vitest-environment node
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import type { JobApplication } from '@prisma/client';
+import { prisma } from '@/lib/prisma';
+import { bulkUpdateStatus, update } from '@/lib/repositories/application.repository';
+import {
+  analytics,
+  conversion,
+  histogramMedian,
+  timeInStage,
+  weekStart,
+} from '@/lib/repositories/analytics.repository';
+import { dailyDeltas, recordChange } from '@/lib/repositories/rollups';
+import { timeInStageQuery } from '@/lib/repositories/status-events';
+
+const tx = {
+  jobApplication: {
+    updateMany: vi.fn(),
+    findUniqueOrThrow: vi.fn(),
+  },
+  applicationDailyRollup: { upsert: vi.fn() },
+  statusChangeRollup: { upsert: vi.fn() },
+  applicationStatusEvent: { createMany: vi.fn() },
+};
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $transaction: vi.fn(),
+    $queryRaw: vi.fn(),
+    jobApplication: { findUniqueOrThrow: vi.fn(), findMany: vi.fn() },
+    applicationDailyRollup: { findMany: vi.fn() },
+    statusChangeRollup: { findMany: vi.fn() },
+    applicationStatusCount: { findMany: vi.fn() },
+  },
+}));
+
+const day = (iso: string) => new Date(`${iso}T00:00:00.000Z`);
+
+describe('Analytics rollups', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.mocked(prisma.$transaction).mockImplementation(((run: (client: typeof tx) => unknown) => run(tx)) as never);
+  });
+
+  it('should net changes per day and status and skip no-ops', () => {
+    const applied = { status: 'APPLIED', applicationDate: new Date('2026-03-02T15:00:00Z') };
+    expect(dailyDeltas([[applied, -1], [applied, 1]])).toEqual([]);
+    expect(dailyDeltas([[applied, -1], [{ ...applied, status: 'OFFER' }, 1]])).toEqual([
+      { day: day('2026-03-02'), status: 'APPLIED', delta: -1 },
+      { day: day('2026-03-02'), status: 'OFFER', delta: 1 },
+    ]);
+  });
+
+  it('should record a status change with the days since applying', async () => {
+    const before = { status: 'APPLIED', applicationDate: day('2026-03-02') };
+    const after = { status: 'INTERVIEW', applicationDate: day('2026-03-02') };
+
+    await recordChange(tx as never, before, after, new Date('2026-03-12T09:00:00Z'));
+
+    expect(tx.applicationDailyRollup.upsert).toHaveBeenCalledTimes(2);
+    expect(tx.statusChangeRollup.upsert).toHaveBeenCalledWith(
+      expect.objectContaining({ create: { toStatus: 'INTERVIEW', days: 10, count: 1 } })
+    );
+  });
+
+  it('should retry an update whose row changed after it was read', async () => {
+    const row = { id: 'a', status: 'APPLIED', applicationDate: day('2026-03-02') } as JobApplication;
+    vi.mocked(prisma.jobApplication.findUniqueOrThrow)
+      .mockResolvedValueOnce(row)
+      .mockResolvedValueOnce({ ...row, status: 'GHOSTED' });
+    tx.jobApplication.updateMany.mockResolvedValueOnce({ count: 0 }).mockResolvedValueOnce({ count: 1 });
+    tx.jobApplication.findUniqueOrThrow.mockResolvedValue({ ...row, status: 'OFFER', updatedAt: day('2026-03-12') });
+
+    const { application, previousStatus } = await update('a', { status: 'OFFER' });
+
+    expect(application.status).toBe('OFFER');
+    // The status actually replaced, not the one first read
+    expect(previousStatus).toBe('GHOSTED');
+    expect(tx.jobApplication.updateMany).toHaveBeenLastCalledWith({
+      where: { id: 'a', status: 'GHOSTED', applicationDate: row.applicationDate },
+      data: { status: 'OFFER' },
+    });
+    expect(tx.statusChangeRollup.upsert).toHaveBeenCalledTimes(1);
+    expect(tx.applicationStatusEvent.createMany).toHaveBeenCalledWith({
+      data: [{ applicationId: 'a', fromStatus: 'GHOSTED', toStatus: 'OFFER', at: day('2026-03-12') }],
+    });
+  });
+
+  it('should retry a bulk status change when any row changed after it was read', async () => {
+    const rows = [
+      { id: 'a', status: 'APPLIED', applicationDate: day('2026-03-02') },
+      { id: 'b', status: 'INTERVIEW', applicationDate: day('2026-03-02') },
+    ];
+    vi.mocked(prisma.jobApplication.findMany)
+      .mockResolvedValueOnce(rows as JobApplication[])
+      .mockResolvedValueOnce(rows.slice(0, 1) as JobApplication[]);
+    tx.jobApplication.updateMany.mockResolvedValueOnce({ count: 1 }).mockResolvedValueOnce({ count: 1 });
+
+    const changed = await bulkUpdateStatus(['a', 'b'], 'GHOSTED');
+
+    expect(changed).toEqual(rows.slice(0, 1));
+    expect(tx.jobApplication.updateMany).toHaveBeenLastCalledWith({
+      where: { OR: [{ id: 'a', status: 'APPLIED', applicationDate: day('2026-03-02') }] },
+      data: { status: 'GHOSTED' },
+    });
+    // Only the successful attempt recorded anything.
+    expect(tx.applicationStatusEvent.createMany).toHaveBeenCalledTimes(1);
+    expect(tx.applicationDailyRollup.upsert).toHaveBeenCalledTimes(2);
+  });
+
+  it('should build the page from rollup rows and counters', async () => {
+    vi.mocked(prisma.$queryRaw).mockResolvedValue([]);
+    vi.mocked(prisma.applicationDailyRollup.findMany).mockResolvedValue([
+      { day: day('2026-03-02'), status: 'APPLIED', count: 3 },
+      { day: day('2026-03-08'), status: 'OFFER', count: 1 },
+      { day: day('2026-03-09'), status: 'REJECTED', count: 2 },
+    ]);
+    vi.mocked(prisma.statusChangeRollup.findMany).mockResolvedValue([
+      { toStatus: 'INTERVIEW', days: 5, count: 2 },
+      { toStatus: 'INTERVIEW', days: 9, count: 1 },
+      { toStatus: 'REJECTED', days: 30, count: 1 },
+    ]);
+    vi.mocked(prisma.applicationStatusCount.findMany).mockResolvedValue([
+      { status: 'APPLIED', count: 6 },
+      { status: 'INTERVIEW', count: 1 },
+      { status: 'OFFER', count: 1 },
+      { status: 'REJECTED', count: 2 },
+    ]);
+
+    const result = await analytics(new Date('2026-03-11T12:00:00Z'), 2);
+
+    expect(result.weekly).toEqual([
+      { weekStart: '2026-03-02', count: 4 },
+      { weekStart: '2026-03-09', count: 2 },
+    ]);
+    expect(result.funnel.map((stage) => stage.count)).toEqual([10, 4, 2, 1]);
+    expect(result.responseRate).toBe(0.4);
+    expect(result.medianDaysToStatusChange).toBe(5);
+    expect(result.medianDaysByStatus).toEqual([
+      { status: 'INTERVIEW', days: 5, changes: 3 },
+      { status: 'REJECTED', days: 30, changes: 1 },
+    ]);
+  });
+
+  it('should summarize time in stage from the status history', async () => {
+    vi.mocked(prisma.$queryRaw).mockResolvedValue([
+      { days: null, count: 4n },
+      { days: 2, count: 3n },
+      { days: 9, count: 1n },
+    ]);
+
+    const stage = await timeInStage('APPLIED', day('2026-01-01'), day('2026-03-01'));
+
+    expect(stage).toEqual({ status: 'APPLIED', entered: 8, left: 4, medianDays: 2 });
+  });
+
+  it('should compute conversion rates and handle empty windows', async () => {
+    vi.mocked(prisma.$queryRaw).mockResolvedValueOnce([{ entered: 8n, converted: 2n }]);
+    expect(await conversion('APPLIED', 'INTERVIEW', day('2026-01-01'))).toMatchObject({ rate: 0.25 });
+
+    vi.mocked(prisma.$queryRaw).mockResolvedValueOnce([{ entered: 0, converted: 0 }]);
+    expect(await conversion('INTERVIEW', 'OFFER', day('2026-01-01'))).toMatchObject({ rate: null });
+  });
+
+  it('should bind history windows in the storage format of each backend', () => {
+    const since = day('2026-01-01');
+    const until = day('2026-03-01');
+
+    expect(timeInStageQuery('APPLIED', { since, until, provider: 'sqlite' }).values).toEqual([
+      'APPLIED',
+      since.getTime(),
+      until.getTime(),
+    ]);
+    expect(timeInStageQuery('APPLIED', { since, until, provider: 'postgresql' }).sql).toContain('extract(epoch');
+  });
+
+  it('should start weeks on Monday and find histogram medians', () => {
+    expect(weekStart(new Date('2026-03-08T23:00:00Z'))).toEqual(day('2026-03-02'));
+    expect(histogramMedian([])).toBeNull();
+    expect(histogramMedian([{ value: 1, count: 1 }, { value: 7, count: 3 }])).toBe(7);
+  });
+});
@@ -3,6 +3,7 @@ import { JobApplication } from '@prisma/client';
 import { createApplicationSchema, filterSchema } from '@/lib/zod/application.schema';
 import * as repository from '@/lib/repositories/application.repository';
 import * as actions from '@/app/actions/application.actions';
+import { updateTag } from 'next/cache';
 
 // Mock repository
 vi.mock('@/lib/repositories/application.repository', () => ({
@@ -11,6 +12,9 @@ vi.mock('@/lib/repositories/application.repository', () => ({
   remove: vi.fn(),
   findAll: vi.fn(),
   findById: vi.fn(),
+  statusCounts: vi.fn(),
+  bulkUpdateStatus: vi.fn(),
+  bulkRemove: vi.fn(),
 }));
 
 describe('Job Application Tracker', () => {
@@ -96,4 +100,80 @@ describe('Job Application Tracker', () => {
       expect(repository.remove).toHaveBeenCalledWith('123');
     });
   });
+
+  describe('Status Counts', () => {
+    it('should read the counters table instead of scanning applications', async () => {
+      const counts = { APPLIED: 4, INTERVIEW: 2, OFFER: 1, REJECTED: 0, GHOSTED: 3 };
+      vi.mocked(repository.statusCounts).mockResolvedValue(counts);
+
+      await expect(actions.getStatusCounts()).resolves.toEqual(counts);
+      expect(repository.findAll).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('Tag Invalidation', () => {
+    it('updateApplication should expire the record and the lists it leaves and enters', async () => {
+      const id = '7c9e6679-7425-40de-944b-e07fc1f90ae7';
+      vi.mocked(repository.update).mockResolvedValue({
+        application: { id, status: 'OFFER' } as JobApplication,
+        previousStatus: 'APPLIED',
+      });
+
+      const result = await actions.updateApplication({ id, status: 'OFFER' });
+
+      expect(result.success).toBe(true);
+      expect(vi.mocked(updateTag).mock.calls.map(([tag]) => tag).sort()).toEqual([
+        `application:${id}`,
+        'applications:status:APPLIED',
+        'applications:status:OFFER',
+        'applications:status:all',
+      ]);
+    });
+  });
+
+  describe('Bulk Actions', () => {
+    const ids = ['7c9e6679-7425-40de-944b-e07fc1f90ae7', '9b2b8f5e-3b1a-4c55-8f0e-2d7a5d7c1e11'];
+    const rowsBefore = [
+      { id: ids[0], status: 'APPLIED', applicationDate: new Date() },
+      { id: ids[1], status: 'INTERVIEW', applicationDate: new Date() },
+    ];
+
+    it('should reject invalid ids and statuses before touching the database', async () => {
+      const badId = await actions.bulkUpdateStatus(['not-a-uuid'], 'GHOSTED');
+      const badStatus = await actions.bulkUpdateStatus(ids, 'ARCHIVED' as never);
+      const empty = await actions.bulkDelete([]);
+
+      expect([badId.success, badStatus.success, empty.success]).toEqual([false, false, false]);
+      expect(repository.bulkUpdateStatus).not.toHaveBeenCalled();
+      expect(repository.bulkRemove).not.toHaveBeenCalled();
+    });
+
+    it('bulkUpdateStatus should write once and expire each affected tag once', async () => {
+      vi.mocked(repository.bulkUpdateStatus).mockResolvedValue(rowsBefore);
+
+      const result = await actions.bulkUpdateStatus([...ids, ids[0]], 'GHOSTED');
+
+      expect(result).toEqual({ success: true, data: { count: 2 } });
+      expect(repository.bulkUpdateStatus).toHaveBeenCalledTimes(1);
+      expect(repository.bulkUpdateStatus).toHaveBeenCalledWith(ids, 'GHOSTED');
+      expect(vi.mocked(updateTag).mock.calls.map(([tag]) => tag).sort()).toEqual([
+        `application:${ids[0]}`,
+        `application:${ids[1]}`,
+        'applications:status:APPLIED',
+        'applications:status:GHOSTED',
+        'applications:status:INTERVIEW',
+        'applications:status:all',
+      ]);
+    });
+
+    it('bulkDelete should remove in one call and skip invalidation when nothing matched', async () => {
+      vi.mocked(repository.bulkRemove).mockResolvedValue([]);
+
+      const result = await actions.bulkDelete(ids);
+
+      expect(result).toEqual({ success: true, data: { count: 0 } });
+      expect(repository.bulkRemove).toHaveBeenCalledWith(ids);
+      expect(updateTag).not.toHaveBeenCalled();
+    });
+  });
 });
@@ -0,0 +1,79 @@
+// @vitest-environment node
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import type { JobApplication } from '@prisma/client';
+import * as repository from '@/lib/repositories/application.repository';
+import { getApplications, updateApplication } from '@/app/actions/application.actions';
+import { cachedFindAll, getCacheStats } from '@/lib/cache/data-cache';
+import { APPLICATION_STATUSES, type FilterInput } from '@/lib/zod/application.schema';
+
+// A data cache that keeps entries until one of their tags is expired, in
+// place of the pass-through mock from setup.ts.
+const dataCache = vi.hoisted(() => {
+  const entries = new Map<string, { tags: string[]; value: unknown }>();
+  const expire = (tag: string) => {
+    for (const [key, entry] of entries) if (entry.tags.includes(tag)) entries.delete(key);
+  };
+  return { entries, expire };
+});
+
+vi.mock('next/cache', () => ({
+  unstable_cache:
+    (load: () => Promise<unknown>, keyParts: string[], { tags }: { tags: string[] }) =>
+    async () => {
+      const key = JSON.stringify(keyParts);
+      if (!dataCache.entries.has(key)) dataCache.entries.set(key, { tags, value: await load() });
+      return dataCache.entries.get(key)!.value;
+    },
+  updateTag: vi.fn(dataCache.expire),
+  revalidateTag: vi.fn(dataCache.expire),
+  revalidatePath: vi.fn(),
+}));
+
+vi.mock('@/lib/repositories/application.repository', () => ({
+  findAll: vi.fn(async () => ({ items: [], nextCursor: null })),
+  update: vi.fn(),
+}));
+
+describe('Data cache', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    dataCache.entries.clear();
+  });
+
+  it('should serve filters that build the same query from one entry', async () => {
+    const before = getCacheStats();
+
+    await getApplications({ search: 'Acme', sortBy: 'companyName', sortOrder: 'asc' });
+    await getApplications({ search: 'acme ', sortBy: 'companyName', sortOrder: 'asc' });
+
+    expect(repository.findAll).toHaveBeenCalledTimes(1);
+    expect(getCacheStats()).toMatchObject({ hits: before.hits + 1, misses: before.misses + 1 });
+  });
+
+  it('should reload only the lists a status change touches', async () => {
+    // Every status filter (plus unfiltered) in both sort columns
+    const filters: FilterInput[] = [undefined, ...APPLICATION_STATUSES].flatMap((status) =>
+      (['applicationDate', 'companyName'] as const).map((sortBy) => ({ status, sortBy }))
+    );
+    const loadLists = () => Promise.all(filters.map((f) => cachedFindAll(f)));
+    const id = '7c9e6679-7425-40de-944b-e07fc1f90ae7';
+    vi.mocked(repository.update).mockResolvedValue({
+      application: { id, status: 'OFFER' } as JobApplication,
+      previousStatus: 'APPLIED',
+    });
+
+    await loadLists();
+    await loadLists();
+    expect(repository.findAll).toHaveBeenCalledTimes(filters.length);
+
+    vi.mocked(repository.findAll).mockClear();
+    expect((await updateApplication({ id, status: 'OFFER' })).success).toBe(true);
+    await loadLists();
+
+    // revalidatePath('/') reloaded all of them; the tags only the unfiltered
+    // lists and the two statuses the row moved between
+    const reloaded = vi.mocked(repository.findAll).mock.calls.map(([f]) => f.status ?? 'all');
+    expect(reloaded.sort()).toEqual(['APPLIED', 'APPLIED', 'OFFER', 'OFFER', 'all', 'all']);
+    expect(reloaded.length).toBeLessThan(filters.length);
+  });
+});
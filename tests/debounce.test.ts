@@ -0,0 +1,41 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { renderHook } from '@testing-library/react';
+import { useDebouncedCallback } from '@/hooks/use-debounced-callback';
+
+describe('useDebouncedCallback', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('should only run the last call in a burst', () => {
+    const callback = vi.fn();
+    const { result } = renderHook(() => useDebouncedCallback(callback, 300));
+    const [debounced] = result.current;
+
+    'Acme Corporation'.split('').forEach((_, i, chars) => debounced(chars.slice(0, i + 1).join('')));
+    vi.advanceTimersByTime(299);
+    expect(callback).not.toHaveBeenCalled();
+
+    vi.advanceTimersByTime(1);
+    expect(callback).toHaveBeenCalledTimes(1);
+    expect(callback).toHaveBeenCalledWith('Acme Corporation');
+  });
+
+  it('should drop pending calls when cancelled or unmounted', () => {
+    const callback = vi.fn();
+    const { result, unmount } = renderHook(() => useDebouncedCallback(callback, 300));
+    const [debounced, cancel] = result.current;
+
+    debounced('Acme');
+    cancel();
+    debounced('Globex');
+    unmount();
+    vi.advanceTimersByTime(1000);
+
+    expect(callback).not.toHaveBeenCalled();
+  });
+});
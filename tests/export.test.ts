@@ -0,0 +1,70 @@
+// @vitest-environment node
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { JobApplication } from '@prisma/client';
+import * as repository from '@/lib/repositories/application.repository';
+import { GET } from '@/app/api/applications/export/route';
+
+vi.mock('@/lib/repositories/application.repository', () => ({
+  findAll: vi.fn(),
+}));
+
+const makeRow = (id: string, companyName: string, notes = ''): JobApplication => ({
+  id,
+  companyName,
+  jobTitle: 'Engineer',
+  status: 'OFFER',
+  location: 'Remote',
+  salaryRange: null,
+  applicationDate: new Date('2026-01-15T00:00:00.000Z'),
+  notes,
+  createdAt: new Date('2026-01-16T00:00:00.000Z'),
+  updatedAt: new Date('2026-01-16T00:00:00.000Z'),
+});
+
+describe('Export route', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('should stream every page of the filtered result as CSV', async () => {
+    vi.mocked(repository.findAll)
+      .mockResolvedValueOnce({ items: [makeRow('a', 'Acme, Inc.', 'said "hi"')], nextCursor: 'next' })
+      .mockResolvedValueOnce({ items: [makeRow('b', 'Globex')], nextCursor: null });
+
+    const response = await GET(new Request('http://localhost/api/applications/export?status=OFFER&sortBy=companyName'));
+    const lines = (await response.text()).trimEnd().split('\r\n');
+
+    expect(response.headers.get('Content-Type')).toContain('text/csv');
+    expect(lines[0]).toBe('id,companyName,jobTitle,status,location,salaryRange,applicationDate,notes,createdAt,updatedAt');
+    expect(lines[1]).toBe('a,"Acme, Inc.",Engineer,OFFER,Remote,,2026-01-15T00:00:00.000Z,"said ""hi""",2026-01-16T00:00:00.000Z,2026-01-16T00:00:00.000Z');
+    expect(lines[2].startsWith('b,Globex,')).toBe(true);
+    expect(repository.findAll).toHaveBeenNthCalledWith(2, expect.objectContaining({
+      status: 'OFFER',
+      sortBy: 'companyName',
+      cursor: 'next',
+    }));
+  });
+
+  it('should abort the download when a page fails to load', async () => {
+    const consoleError = vi.spyOn(console, 'error').mockImplementation(() => {});
+    vi.mocked(repository.findAll)
+      .mockResolvedValueOnce({ items: [makeRow('a', 'Acme')], nextCursor: 'next' })
+      .mockRejectedValueOnce(new Error('database is locked'));
+
+    const response = await GET(new Request('http://localhost/api/applications/export'));
+
+    await expect(response.text()).rejects.toThrow('Failed to export applications');
+    expect(consoleError).toHaveBeenCalledWith('Failed to export applications:', expect.any(Error));
+    consoleError.mockRestore();
+  });
+
+  it('should stream NDJSON and reject invalid filters', async () => {
+    vi.mocked(repository.findAll).mockResolvedValueOnce({ items: [makeRow('a', 'Acme')], nextCursor: null });
+
+    const response = await GET(new Request('http://localhost/api/applications/export?format=ndjson'));
+    expect(JSON.parse(await response.text())).toMatchObject({ id: 'a', companyName: 'Acme' });
+
+    const invalid = await GET(new Request('http://localhost/api/applications/export?status=NOPE'));
+    expect(invalid.status).toBe(400);
+  });
+});
@@ -0,0 +1,103 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import * as repository from '@/lib/repositories/application.repository';
+import { importApplications } from '@/lib/import/importer';
+import { MalformedRecord, parseCsv, parseJsonArray, parseNdjson } from '@/lib/import/parsers';
+
+vi.mock('@/lib/repositories/application.repository', () => ({
+  create: vi.fn(),
+  createMany: vi.fn(),
+}));
+
+async function* chunked(text: string, size: number) {
+  for (let i = 0; i < text.length; i += size) yield text.slice(i, i + size);
+}
+
+async function* fromArray<T>(items: T[]) {
+  yield* items;
+}
+
+async function collect<T>(source: AsyncIterable<T>) {
+  const items: T[] = [];
+  for await (const item of source) items.push(item);
+  return items;
+}
+
+const validRow = (companyName: string) => ({
+  companyName,
+  jobTitle: 'Engineer',
+  status: 'APPLIED',
+  location: 'Remote',
+  applicationDate: '2026-01-15',
+});
+
+describe('Bulk import', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  describe('Parsers', () => {
+    it('should parse quoted CSV fields split across chunk boundaries', async () => {
+      const csv = 'companyName,notes\r\n"Acme, Inc.","said ""hi""\nthen left"\r\nGlobex,\n';
+
+      // One-character chunks exercise every boundary
+      const rows = await collect(parseCsv(chunked(csv, 1)));
+
+      expect(rows).toEqual([
+        { companyName: 'Acme, Inc.', notes: 'said "hi"\nthen left' },
+        { companyName: 'Globex', notes: '' },
+      ]);
+    });
+
+    it('should stream objects out of NDJSON and JSON arrays', async () => {
+      const objects = [{ a: 'x } ]' }, { b: { c: [1, 2] } }];
+
+      expect(await collect(parseNdjson(chunked(objects.map((o) => JSON.stringify(o)).join('\n'), 3)))).toEqual(objects);
+      expect(await collect(parseJsonArray(chunked(JSON.stringify(objects, null, 2), 3)))).toEqual(objects);
+    });
+
+    it('should report malformed JSON records with their line and keep going', async () => {
+      const ndjson = await collect(parseNdjson(chunked('{"a":1}\n\n{"a":\n{"a":3}\n', 4)));
+      expect(ndjson).toEqual([{ a: 1 }, expect.any(MalformedRecord), { a: 3 }]);
+      expect((ndjson[1] as MalformedRecord).error).toMatch(/^Invalid JSON on line 3: /);
+
+      const array = await collect(parseJsonArray(chunked('[\n  {"a": 1},\n  {a: 2},\n  {"a": 3}\n]', 4)));
+      expect(array).toEqual([{ a: 1 }, expect.any(MalformedRecord), { a: 3 }]);
+      expect((array[1] as MalformedRecord).error).toMatch(/^Invalid JSON on line 3: /);
+    });
+  });
+
+  describe('importApplications', () => {
+    it('should batch valid rows and report invalid ones without aborting', async () => {
+      vi.mocked(repository.createMany).mockImplementation(async (rows) => rows.length);
+      const records = [validRow('Acme'), { ...validRow('Bad'), status: 'NOPE' }, validRow('Globex'), validRow('Initech')];
+
+      const summary = await importApplications(fromArray(records), { batchSize: 2 });
+
+      expect(repository.createMany).toHaveBeenCalledTimes(2);
+      expect(summary).toMatchObject({ total: 4, imported: 3, failed: 1, statuses: ['APPLIED'] });
+      expect(summary.errors).toEqual([expect.objectContaining({ row: 2, error: 'Validation failed' })]);
+    });
+
+    it('should report a malformed record as a failed row', async () => {
+      vi.mocked(repository.createMany).mockImplementation(async (rows) => rows.length);
+      const records = [validRow('Acme'), new MalformedRecord('Invalid JSON on line 2: bad'), validRow('Globex')];
+
+      const summary = await importApplications(fromArray(records));
+
+      expect(summary).toMatchObject({ total: 3, imported: 2, failed: 1 });
+      expect(summary.errors).toEqual([{ row: 2, error: 'Invalid JSON on line 2: bad' }]);
+    });
+
+    it('should isolate the failing row when a batch insert fails', async () => {
+      vi.mocked(repository.createMany).mockRejectedValue(new Error('constraint failed'));
+      vi.mocked(repository.create)
+        .mockResolvedValueOnce({} as never)
+        .mockRejectedValueOnce(new Error('constraint failed'));
+
+      const summary = await importApplications(fromArray([validRow('Acme'), validRow('Globex')]));
+
+      expect(summary).toMatchObject({ imported: 1, failed: 1 });
+      expect(summary.errors[0].row).toBe(2);
+    });
+  });
+});
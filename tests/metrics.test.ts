@@ -0,0 +1,88 @@
+// @vitest-environment node
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { prisma } from '@/lib/prisma';
+import { findAll, findById } from '@/lib/repositories/application.repository';
+import { Histogram } from '@/lib/metrics/histogram';
+import { getQueryMetrics, resetQueryMetrics } from '@/lib/metrics/query-metrics';
+import { GET } from '@/app/api/metrics/route';
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    jobApplication: {
+      findMany: vi.fn(),
+      findUnique: vi.fn(),
+    },
+  },
+}));
+
+describe('Query metrics', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    resetQueryMetrics();
+  });
+
+  afterEach(() => {
+    delete process.env.SLOW_QUERY_MS;
+  });
+
+  it('should estimate percentiles from histogram buckets', () => {
+    const histogram = new Histogram([10, 100, 1000]);
+    for (let i = 0; i < 90; i++) histogram.observe(5);
+    for (let i = 0; i < 10; i++) histogram.observe(500);
+
+    const snapshot = histogram.snapshot();
+    expect(snapshot.count).toBe(100);
+    expect(snapshot.p50).toBeLessThanOrEqual(10);
+    expect(snapshot.p99).toBeGreaterThan(100);
+    expect(snapshot.p99).toBeLessThanOrEqual(500);
+    expect(snapshot.buckets).toEqual([
+      { le: 10, count: 90 },
+      { le: 100, count: 90 },
+      { le: 1000, count: 100 },
+      { le: '+Inf', count: 100 },
+    ]);
+  });
+
+  it('should record repository calls by operation and filter shape', async () => {
+    vi.mocked(prisma.jobApplication.findMany).mockResolvedValue([]);
+    vi.mocked(prisma.jobApplication.findUnique).mockResolvedValue(null);
+
+    await findAll({ status: 'OFFER', sortBy: 'companyName', sortOrder: 'asc' });
+    await findAll({ status: 'OFFER', sortBy: 'companyName', sortOrder: 'asc' });
+    await findById('missing');
+
+    const metrics = getQueryMetrics();
+    expect(metrics.find((m) => m.operation === 'findAll')).toMatchObject({
+      shape: 'status=OFFER sort=companyName:asc',
+      count: 2,
+      errors: 0,
+    });
+    expect(metrics.find((m) => m.operation === 'findById')).toMatchObject({ shape: '-', count: 1, rows: 0 });
+  });
+
+  it('should count failures and log calls over the slow threshold', async () => {
+    process.env.SLOW_QUERY_MS = '0';
+    const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+    vi.mocked(prisma.jobApplication.findUnique).mockResolvedValueOnce(null);
+    vi.mocked(prisma.jobApplication.findUnique).mockRejectedValueOnce(new Error('locked'));
+
+    await findById('a');
+    await expect(findById('b')).rejects.toThrow('locked');
+
+    expect(warn).toHaveBeenCalledWith(expect.stringMatching(/^\[slow-query\] findById/));
+    expect(getQueryMetrics()[0]).toMatchObject({ operation: 'findById', count: 2, errors: 1 });
+    warn.mockRestore();
+  });
+
+  it('should expose histograms on the metrics endpoint', async () => {
+    vi.mocked(prisma.jobApplication.findMany).mockResolvedValue([]);
+    await findAll({});
+
+    const body = await (await GET()).json();
+
+    expect(body.cache).toBeDefined();
+    expect(body.slowQueryThresholdMs).toBe(200);
+    expect(body.queries[0]).toHaveProperty('buckets');
+    expect(body.queries.map((q: { shape: string }) => q.shape)).toContain('status=* sort=applicationDate:desc');
+  });
+});
@@ -0,0 +1,100 @@
+import { describe, it, expect, vi } from 'vitest';
+import { act, render, screen } from '@testing-library/react';
+import { createElement } from 'react';
+import type { JobApplication } from '@prisma/client';
+import { applyMutation, isOptimistic, matchesFilters, optimisticId } from '@/lib/optimistic/applications';
+import {
+  ApplicationMutationsProvider,
+  useApplicationMutations,
+} from '@/components/applications/ApplicationMutations';
+import type { FilterInput } from '@/lib/zod/application.schema';
+
+const makeApp = (id: string, companyName: string, day: number, status = 'APPLIED'): JobApplication => ({
+  id,
+  companyName,
+  jobTitle: 'Engineer',
+  status,
+  location: 'Remote',
+  salaryRange: null,
+  applicationDate: new Date(Date.UTC(2026, 1, day)),
+  notes: null,
+  createdAt: new Date(),
+  updatedAt: new Date(),
+});
+
+const newest: FilterInput = { sortBy: 'applicationDate', sortOrder: 'desc' };
+const items = [makeApp('c', 'Initech', 20), makeApp('b', 'Globex', 10), makeApp('a', 'Acme', 5)];
+const ids = (list: JobApplication[]) => list.map((app) => app.id);
+
+describe('Optimistic application mutations', () => {
+  it('should insert a created card in sort order', () => {
+    const created = makeApp(optimisticId(), 'Hooli', 12);
+    expect(isOptimistic(created)).toBe(true);
+    expect(ids(applyMutation(items, { type: 'create', application: created }, { filters: newest, complete: true }))).toEqual(
+      ['c', created.id, 'b', 'a']
+    );
+  });
+
+  it('should leave a card that sorts past the loaded pages for the server', () => {
+    const created = makeApp(optimisticId(), 'Hooli', 1);
+    const options = { filters: newest, complete: false };
+    expect(ids(applyMutation(items, { type: 'create', application: created }, options))).toEqual(['c', 'b', 'a']);
+  });
+
+  it('should edit in place, move on a new sort key and drop rows leaving the filter', () => {
+    const options = { filters: { ...newest, status: 'APPLIED' as const }, complete: true };
+    const renamed = { ...items[1], companyName: 'Globex Corp' };
+    expect(applyMutation(items, { type: 'update', application: renamed }, options)[1].companyName).toBe('Globex Corp');
+
+    const redated = { ...items[2], applicationDate: new Date(Date.UTC(2026, 1, 25)) };
+    expect(ids(applyMutation(items, { type: 'update', application: redated }, options))).toEqual(['a', 'c', 'b']);
+
+    const moved = { ...items[0], status: 'OFFER' };
+    expect(ids(applyMutation(items, { type: 'update', application: moved }, options))).toEqual(['b', 'a']);
+  });
+
+  it('should remove a deleted card', () => {
+    expect(ids(applyMutation(items, { type: 'delete', id: 'b' }, { filters: newest, complete: true }))).toEqual([
+      'c',
+      'a',
+    ]);
+  });
+
+  it('should apply bulk status changes and deletes', () => {
+    const ghosted = { type: 'bulkUpdateStatus' as const, ids: ['a', 'b'], status: 'GHOSTED' };
+    const all = { filters: newest, complete: true };
+    const applied = { filters: { ...newest, status: 'APPLIED' as const }, complete: true };
+
+    expect(applyMutation(items, ghosted, all).map((app) => app.status)).toEqual(['APPLIED', 'GHOSTED', 'GHOSTED']);
+    expect(ids(applyMutation(items, ghosted, applied))).toEqual(['c']);
+    expect(ids(applyMutation(items, { type: 'bulkDelete', ids: ['a', 'c'] }, all))).toEqual(['b']);
+  });
+
+  it('should match search terms as word prefixes like the full-text query', () => {
+    expect(matchesFilters(items[0], { search: 'init eng' })).toBe(true);
+    expect(matchesFilters(items[0], { search: 'nitech' })).toBe(false);
+    expect(matchesFilters(items[0], { status: 'OFFER' })).toBe(false);
+    expect(matchesFilters(items[0], { search: '--' })).toBe(false);
+  });
+
+  it('should roll back and report a mutation the server rejects', async () => {
+    let resolve: (result: { success: boolean; error?: string }) => void = () => {};
+    const action = vi.fn(() => new Promise<{ success: boolean; error?: string }>((done) => (resolve = done)));
+    let context: ReturnType<typeof useApplicationMutations> | null = null;
+
+    function Probe() {
+      context = useApplicationMutations();
+      return createElement('span', { 'data-testid': 'pending' }, context.pending.length);
+    }
+    render(createElement(ApplicationMutationsProvider, null, createElement(Probe)));
+
+    const onFailure = vi.fn();
+    act(() => context!.mutate({ type: 'delete', id: 'a' }, action, 'Acme', onFailure));
+    expect(screen.getByTestId('pending')).toHaveTextContent('1');
+
+    await act(async () => resolve({ success: false, error: 'Failed to delete application' }));
+    expect(screen.getByTestId('pending')).toHaveTextContent('0');
+    expect(screen.getByRole('alert')).toHaveTextContent('Failed to delete application (Acme). Your change was undone.');
+    expect(onFailure).toHaveBeenCalledWith({ success: false, error: 'Failed to delete application' });
+  });
+});
@@ -0,0 +1,84 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { prisma } from '@/lib/prisma';
+import { findAll } from '@/lib/repositories/application.repository';
+import { cursorFor, decodeCursor, encodeCursor } from '@/lib/repositories/cursor';
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    jobApplication: {
+      findMany: vi.fn(),
+    },
+  },
+}));
+
+const makeRow = (id: string, companyName: string, day: number) => ({
+  id,
+  companyName,
+  jobTitle: 'Engineer',
+  status: 'APPLIED',
+  location: 'Remote',
+  salaryRange: null,
+  applicationDate: new Date(Date.UTC(2026, 0, day)),
+  notes: '',
+  createdAt: new Date(),
+  updatedAt: new Date(),
+});
+
+describe('Cursor pagination', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('should round-trip a cursor for the active sort column', () => {
+    const raw = cursorFor(makeRow('a', 'Acme', 3), 'applicationDate');
+    const cursor = decodeCursor(raw, 'applicationDate');
+
+    expect(cursor).toEqual({ sortBy: 'applicationDate', value: '2026-01-03T00:00:00.000Z', id: 'a' });
+  });
+
+  it('should reject cursors minted for a different sort column or garbage input', () => {
+    const raw = encodeCursor({ sortBy: 'companyName', value: 'Acme', id: 'a' });
+
+    expect(decodeCursor(raw, 'applicationDate')).toBeNull();
+    expect(decodeCursor('not-a-cursor', 'companyName')).toBeNull();
+  });
+
+  it('should return a page and a cursor when more rows exist', async () => {
+    vi.mocked(prisma.jobApplication.findMany).mockResolvedValue([
+      makeRow('a', 'Acme', 3),
+      makeRow('b', 'Globex', 2),
+      makeRow('c', 'Initech', 1),
+    ]);
+
+    const page = await findAll({ sortBy: 'applicationDate', sortOrder: 'desc', limit: 2 });
+
+    expect(page.items.map((app) => app.id)).toEqual(['a', 'b']);
+    expect(decodeCursor(page.nextCursor!, 'applicationDate')?.id).toBe('b');
+    expect(prisma.jobApplication.findMany).toHaveBeenCalledWith(expect.objectContaining({
+      orderBy: [{ applicationDate: 'desc' }, { id: 'desc' }],
+      take: 3,
+    }));
+  });
+
+  it('should seek past the cursor using the sort value and id tiebreaker', async () => {
+    vi.mocked(prisma.jobApplication.findMany).mockResolvedValue([makeRow('c', 'Initech', 1)]);
+    const cursor = encodeCursor({ sortBy: 'companyName', value: 'Globex', id: 'b' });
+
+    const page = await findAll({ sortBy: 'companyName', sortOrder: 'asc', status: 'APPLIED', cursor });
+
+    expect(page.nextCursor).toBeNull();
+    expect(prisma.jobApplication.findMany).toHaveBeenCalledWith(expect.objectContaining({
+      where: {
+        AND: [
+          { status: 'APPLIED' },
+          {
+            OR: [
+              { companyName: { gt: 'Globex' } },
+              { companyName: 'Globex', id: { gt: 'b' } },
+            ],
+          },
+        ],
+      },
+    }));
+  });
+});
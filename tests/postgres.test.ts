@@ -0,0 +1,56 @@
+// @vitest-environment node
+import { describe, it, expect } from 'vitest';
+import { databaseProvider } from '@/lib/db/provider';
+import { poolSettings, withPoolSettings } from '@/lib/db/postgres';
+import { searchPageQuery, toMatchQuery } from '@/lib/repositories/search';
+
+describe('PostgreSQL backend', () => {
+  it('should pick the provider from DATABASE_URL', () => {
+    expect(databaseProvider('postgresql://localhost/jobs')).toBe('postgresql');
+    expect(databaseProvider('postgres://localhost/jobs')).toBe('postgresql');
+    expect(databaseProvider('file:./dev.db')).toBe('sqlite');
+    expect(databaseProvider(undefined)).toBe('sqlite');
+  });
+
+  it('should size the Prisma pool unless the URL already does', () => {
+    const settings = poolSettings({ DATABASE_POOL_SIZE: '20', DATABASE_PGBOUNCER: '1' });
+    expect(withPoolSettings('postgresql://u:p@localhost:5432/jobs?schema=public', settings)).toBe(
+      'postgresql://u:p@localhost:5432/jobs?schema=public&connection_limit=20&pool_timeout=10&pgbouncer=true'
+    );
+    expect(withPoolSettings('postgresql://localhost/jobs?connection_limit=3', poolSettings({}))).toBe(
+      'postgresql://localhost/jobs?connection_limit=3&pool_timeout=10'
+    );
+    expect(() => poolSettings({ DATABASE_POOL_SIZE: '0' })).toThrow(/DATABASE_POOL_SIZE/);
+  });
+
+  it('should build a prefix tsquery from free text', () => {
+    expect(toMatchQuery('Acme Corp', 'postgresql')).toBe('acme:* & corp:*');
+    expect(toMatchQuery("c++ 'OR' | !dev", 'postgresql')).toBe('c:* & or:* & dev:*');
+    expect(toMatchQuery('   ', 'postgresql')).toBeNull();
+  });
+
+  it('should search the tsvector column with the same cursor semantics', () => {
+    const query = searchPageQuery({
+      match: 'acme:*',
+      status: 'OFFER',
+      sortBy: 'applicationDate',
+      sortOrder: 'desc',
+      cursor: { sortBy: 'applicationDate', value: '2026-01-01T00:00:00.000Z', id: 'b' },
+      take: 25,
+      provider: 'postgresql',
+    });
+
+    expect(query.text).toContain(`"search_vector" @@ to_tsquery('simple', $2)`);
+    expect(query.text).toContain('"applicationDate" < $4 OR ("applicationDate" = $5 AND "id" < $6)');
+    expect(query.text).not.toContain('job_applications_fts');
+    expect(query.values).toEqual([
+      'acme:*',
+      'acme:*',
+      'OFFER',
+      new Date('2026-01-01T00:00:00.000Z'),
+      new Date('2026-01-01T00:00:00.000Z'),
+      'b',
+      25,
+    ]);
+  });
+});
@@ -0,0 +1,79 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { prisma } from '@/lib/prisma';
+import { findAll } from '@/lib/repositories/application.repository';
+import { decodeCursor } from '@/lib/repositories/cursor';
+import { searchPageQuery, toMatchQuery } from '@/lib/repositories/search';
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+    jobApplication: {
+      findMany: vi.fn(),
+    },
+  },
+}));
+
+const makeRow = (id: string, companyName: string) => ({
+  id,
+  companyName,
+  jobTitle: 'Engineer',
+  status: 'APPLIED',
+  location: 'Remote',
+  salaryRange: null,
+  applicationDate: new Date(Date.UTC(2026, 0, 1)),
+  notes: '',
+  createdAt: new Date(),
+  updatedAt: new Date(),
+});
+
+describe('Full-text search', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('should build a quoted prefix query from free text', () => {
+    expect(toMatchQuery('Acme Corp')).toBe('"acme"* "corp"*');
+    expect(toMatchQuery('c++ "OR" dev')).toBe('"c"* "or"* "dev"*');
+    expect(toMatchQuery('   ')).toBeNull();
+  });
+
+  it('should bind the match, status and cursor as parameters', () => {
+    const query = searchPageQuery({
+      match: '"acme"*',
+      status: 'OFFER',
+      sortBy: 'companyName',
+      sortOrder: 'desc',
+      cursor: { sortBy: 'companyName', value: 'Globex', id: 'b' },
+      take: 25,
+    });
+
+    expect(query.sql).toContain('MATCH ?');
+    expect(query.sql).toContain('"companyName" < ? OR ("companyName" = ? AND "id" < ?)');
+    expect(query.sql).toContain('ORDER BY "companyName" DESC, "id" DESC');
+    expect(query.values).toEqual(['"acme"*', 'OFFER', 'Globex', 'Globex', 'b', 25]);
+  });
+
+  it('should route search through FTS and keep the ranked order', async () => {
+    vi.mocked(prisma.$queryRaw).mockResolvedValue([
+      { id: 'b', rank: -2.5 },
+      { id: 'a', rank: -1.5 },
+    ]);
+    vi.mocked(prisma.jobApplication.findMany).mockResolvedValue([
+      makeRow('a', 'Acme'),
+      makeRow('b', 'Acme Labs'),
+    ]);
+
+    const page = await findAll({ search: 'acme', sortBy: 'relevance', sortOrder: 'desc', limit: 1 });
+
+    expect(page.items.map((app) => app.id)).toEqual(['b']);
+    expect(page.items[0]).not.toHaveProperty('rank');
+    expect(decodeCursor(page.nextCursor!, 'relevance')).toEqual({ sortBy: 'relevance', value: '-2.5', id: 'b' });
+  });
+
+  it('should return no results for a term without letters or digits', async () => {
+    const page = await findAll({ search: '--', sortBy: 'relevance' });
+
+    expect(page).toEqual({ items: [], nextCursor: null });
+    expect(prisma.jobApplication.findMany).not.toHaveBeenCalled();
+  });
+});
@@ -13,7 +13,10 @@ vi.mock('next/navigation', () => ({
   redirect: vi.fn(),
 }));
 
-// Mock server actions (revalidatePath)
+// Mock Next.js data cache: run loaders directly, record tag invalidations
 vi.mock('next/cache', () => ({
   revalidatePath: vi.fn(),
+  unstable_cache: (fn: (...args: unknown[]) => unknown) => fn,
+  updateTag: vi.fn(),
+  revalidateTag: vi.fn(),
 }));
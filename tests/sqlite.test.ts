@@ -0,0 +1,35 @@
+// @vitest-environment node
+import { describe, it, expect, vi } from 'vitest';
+import { applySqlitePragmas, isSqliteUrl, sqliteSettings, withBusyTimeout } from '@/lib/db/sqlite';
+
+describe('SQLite connection tuning', () => {
+  it('should default to WAL with a 5 second busy timeout', () => {
+    expect(sqliteSettings({})).toEqual({ journalMode: 'WAL', busyTimeoutMs: 5000 });
+  });
+
+  it('should read overrides and reject invalid values', () => {
+    const settings = sqliteSettings({ SQLITE_JOURNAL_MODE: 'delete', SQLITE_BUSY_TIMEOUT_MS: '0' });
+    expect(settings.journalMode).toBe('DELETE');
+    expect(settings.busyTimeoutMs).toBe(0);
+
+    expect(() => sqliteSettings({ SQLITE_JOURNAL_MODE: 'FAST' })).toThrow(/SQLITE_JOURNAL_MODE/);
+    expect(() => sqliteSettings({ SQLITE_BUSY_TIMEOUT_MS: '1; DROP TABLE x' })).toThrow(/SQLITE_BUSY_TIMEOUT_MS/);
+  });
+
+  it('should pass the busy timeout to Prisma unless the URL sets one', () => {
+    expect(isSqliteUrl('file:./dev.db')).toBe(true);
+    expect(isSqliteUrl('postgresql://localhost/db')).toBe(false);
+    expect(withBusyTimeout('file:./dev.db', 5000)).toBe('file:./dev.db?socket_timeout=5');
+    expect(withBusyTimeout('file:./dev.db?connection_limit=1', 1500)).toBe(
+      'file:./dev.db?connection_limit=1&socket_timeout=2'
+    );
+    expect(withBusyTimeout('file:./dev.db?socket_timeout=30', 5000)).toBe('file:./dev.db?socket_timeout=30');
+  });
+
+  it('should only run pragmas that hold for every connection', async () => {
+    const client = { $queryRawUnsafe: vi.fn().mockResolvedValue([]) };
+    await applySqlitePragmas(client, sqliteSettings({}));
+
+    expect(client.$queryRawUnsafe.mock.calls.map(([sql]) => sql)).toEqual(['PRAGMA journal_mode = WAL']);
+  });
+});
@@ -0,0 +1,53 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { act, renderHook } from '@testing-library/react';
+import { useWindowVirtualizer } from '@/hooks/use-window-virtualizer';
+
+describe('useWindowVirtualizer', () => {
+  beforeEach(() => {
+    vi.stubGlobal('requestAnimationFrame', (callback: FrameRequestCallback) => {
+      callback(0);
+      return 0;
+    });
+    vi.stubGlobal('cancelAnimationFrame', () => {});
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  const scrollTo = (container: HTMLDivElement, top: number) => {
+    container.getBoundingClientRect = () => ({ top: -top } as DOMRect);
+    act(() => {
+      window.dispatchEvent(new Event('scroll'));
+    });
+  };
+
+  it('should only expose rows near the viewport and pad for the rest', () => {
+    const { result } = renderHook(() =>
+      useWindowVirtualizer<HTMLDivElement>({ count: 1000, estimateSize: 200, gap: 24, overscan: 2 })
+    );
+    const container = document.createElement('div');
+    result.current.containerRef.current = container;
+
+    // Row 10 starts at 10 * 224px; a 768px viewport reaches into row 13
+    scrollTo(container, 2240);
+
+    expect(result.current.start).toBe(8);
+    expect(result.current.end).toBe(16);
+    expect(result.current.paddingTop).toBe(8 * 224);
+    expect(result.current.paddingBottom).toBe((1000 - 16) * 224);
+  });
+
+  it('should clamp the window at the end of the list', () => {
+    const { result } = renderHook(() =>
+      useWindowVirtualizer<HTMLDivElement>({ count: 12, estimateSize: 200, gap: 24 })
+    );
+    const container = document.createElement('div');
+    result.current.containerRef.current = container;
+
+    scrollTo(container, 12 * 224);
+
+    expect(result.current.end).toBe(12);
+    expect(result.current.paddingBottom).toBe(0);
+  });
+});
@@ -0,0 +1,46 @@
+// @vitest-environment node
+import { describe, it, expect, beforeEach } from 'vitest';
+import { GET, POST } from '@/app/api/vitals/route';
+import { getVitalsSummary, recordVitals, resetVitals } from '@/lib/vitals/store';
+
+function post(body: string) {
+  return POST(new Request('http://localhost/api/vitals', { method: 'POST', body }));
+}
+
+describe('Web Vitals collection', () => {
+  beforeEach(() => {
+    resetVitals();
+  });
+
+  it('should record a batch and summarise it per metric', async () => {
+    const response = await post(
+      JSON.stringify([
+        { name: 'LCP', value: 1200, rating: 'good', page: '/applications' },
+        { name: 'LCP', value: 3000, rating: 'needs-improvement', page: '/applications' },
+        { name: 'filter-to-results', value: 180 },
+      ])
+    );
+    expect(response.status).toBe(204);
+
+    const body = await (await GET()).json();
+    const lcp = body.vitals.find((v: { name: string }) => v.name === 'LCP');
+    expect(lcp.count).toBe(2);
+    expect(lcp.ratings).toEqual({ good: 1, 'needs-improvement': 1, poor: 0 });
+    expect(lcp.max).toBe(3000);
+    expect(body.vitals.find((v: { name: string }) => v.name === 'filter-to-results').count).toBe(1);
+  });
+
+  it('should use unitless buckets for CLS', () => {
+    recordVitals([{ name: 'CLS', value: 0.02 }, { name: 'CLS', value: 0.3 }]);
+    const [cls] = getVitalsSummary();
+    expect(cls.buckets[0]).toEqual({ le: 0.01, count: 0 });
+    expect(cls.p50).toBeLessThan(1);
+  });
+
+  it('should reject malformed or unknown reports', async () => {
+    expect((await post('not json')).status).toBe(400);
+    expect((await post(JSON.stringify([{ name: 'FID', value: 10 }]))).status).toBe(400);
+    expect((await post(JSON.stringify([{ name: 'LCP', value: -1 }]))).status).toBe(400);
+    expect(getVitalsSummary()).toEqual([]);
+  });
+});
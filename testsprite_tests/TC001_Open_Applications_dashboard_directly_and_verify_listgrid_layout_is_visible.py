@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle
+from dashboard import base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,17 +49,15 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
-        ```
         try:
             await expect(frame.locator('text=Applications').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: Expected the Applications dashboard to load and display the 'Applications' heading (showing the applications list/grid). The 'Applications' text was not visible — the page may not have navigated to /applications or the dashboard failed to render.")
-        ```
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,7 @@
 import asyncio
 from playwright import async_api
+from waits import wait_for_idle
+from dashboard import base_url
 
 async def run_test():
     pw = None
@@ -29,7 +31,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,25 +48,23 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         from playwright.async_api import expect
-        await page.goto("http://localhost:3000/applications", wait_until="commit", timeout=10000)
+        await page.goto(f"{base_url()}/applications", wait_until="commit", timeout=10000)
         # Verify the page title/text 'Applications' is visible
         await expect(page.get_by_text("Applications")).to_be_visible()
         # Scroll to the bottom of the page
         await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await page.wait_for_timeout(500)
         # Verify 'Add Application' element is visible after scrolling
         await expect(page.get_by_text("Add Application")).to_be_visible()
         # Scroll back to the top of the page
         await page.evaluate("window.scrollTo(0, 0)")
-        await page.wait_for_timeout(500)
         # Verify the 'Applications' text is still visible after scrolling back to top
         await expect(page.get_by_text("Applications")).to_be_visible()
-        await asyncio.sleep(5)
 
     finally:
         if context:
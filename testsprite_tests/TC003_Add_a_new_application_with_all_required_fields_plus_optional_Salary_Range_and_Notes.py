@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,70 +49,70 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the 'New Application' (New Application) button to open the create-application form.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Fill the application form with provided values and submit (Create Application). After submit, the page will change and next step will verify success and that the new item appears in the list.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Acme Corp')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Acme Corp')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Frontend Engineer')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('Frontend Engineer')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[4]/form/div[2]/div[1]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).field("Status")
+        await elem.click(timeout=5000)
         
         # -> Fill Location, Salary, and Notes fields, then click 'Create Application' (submit).
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('New York, NY')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('New York, NY')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('$120k-$140k')
+        elem = ApplicationsDashboard(frame).field("Salary (Optional)")
+        await elem.fill('$120k-$140k')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[4]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Reached out to recruiter on LinkedIn.')
+        elem = ApplicationsDashboard(frame).field("Notes")
+        await elem.fill('Reached out to recruiter on LinkedIn.')
         
         # -> Click the 'Create Application' (submit) button to submit the form so the application is created and the list can be verified.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Fill the Location field correctly (index 386) and click 'Create Application' (index 396) to submit the form.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('New York, NY')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('New York, NY')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         try:
             await expect(frame.locator('text=Acme Corp').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: The test attempted to verify that the newly created application 'Acme Corp' appears on the Applications dashboard after submitting the form, but the expected entry was not visible — indicating the creation or display of the application failed.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
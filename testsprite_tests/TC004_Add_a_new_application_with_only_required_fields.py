@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,48 +49,48 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the 'New Application' button to open the application creation form/modal.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Fill Company Name='Globex', Job Title='QA Engineer', select Status='Interview', set Application Date='2026-02-01', set Location='Austin, TX' (leave Salary and Notes empty), click 'Create Application', then verify 'Success' and 'Globex' are visible on the page.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Globex')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Globex')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('QA Engineer')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('QA Engineer')
         
         # -> Set Date to 2026-02-01, fill Location 'Austin, TX', submit the form by clicking 'Create Application'.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2026-02-01')
+        elem = ApplicationsDashboard(frame).field("Date Applied")
+        await elem.fill('2026-02-01')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Austin, TX')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('Austin, TX')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         try:
             await expect(frame.locator('text=Success').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: The test attempted to verify that creating a new job application for 'Globex' succeeded by showing a 'Success' confirmation, but the success message did not appear — the application may not have been created or the confirmation text changed.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
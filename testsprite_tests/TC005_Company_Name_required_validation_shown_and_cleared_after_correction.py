@@ -1,5 +1,7 @@
 import asyncio
 from playwright import async_api
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +31,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,87 +48,87 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click 'New Application' (Add Application) button to open the form
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Ensure the application form is visible. Click the 'New Application' button again to open the form so its input fields become available, then fill the 'Job Title' field with 'Product Manager'.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Clear the Company Name field to simulate missing company, fill Job Title='Product Manager', Application Date='2026-02-10', Location='Remote', then click 'Create Application' to trigger the validation error 'Company Name is required'. After that, check for the validation message.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Product Manager')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('Product Manager')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2026-02-10')
+        elem = ApplicationsDashboard(frame).field("Date Applied")
+        await elem.fill('2026-02-10')
         
         # -> Ensure Company Name is empty, click 'Create Application' to trigger validation, then check for the 'Company Name is required' validation message.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Clear the Company Name input, click Create Application to trigger validation and confirm the 'Company name is required' message is visible; then fill Company Name with 'Initech' and Location with 'Remote', submit the form, and verify the application was created (verify 'Initech' is visible).
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Fill Company Name with 'Initech' and Location with 'Remote', click 'Create Application' to submit the form so the page can be checked for success and the new entry.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Initech')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Initech')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Remote')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('Remote')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         frame = context.pages[-1]
-        await frame.wait_for_timeout(1000)
+        await wait_for_idle(frame)
         assert await frame.locator("text=Company Name is required").is_visible(), "Expected validation message 'Company Name is required' to be visible"
         
         # After fixing the error and submitting, verify success and the new entry
-        await frame.wait_for_timeout(1000)
+        await wait_for_idle(frame)
         await frame.wait_for_selector("text=Success", timeout=5000)
         assert await frame.locator("text=Success").is_visible(), "Expected 'Success' message after submission"
         await frame.wait_for_selector("text=Initech", timeout=5000)
         assert await frame.locator("text=Initech").is_visible(), "Expected 'Initech' to appear in the applications list"
-        await asyncio.sleep(5)
 
     finally:
         if context:
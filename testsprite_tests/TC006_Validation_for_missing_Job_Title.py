@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +30,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,58 +47,57 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Open the New Application form by clicking the 'New Application' button.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Fill Company Name with 'Hooli', clear Job Title (leave empty), set Date to '2026-02-12', set Location to 'San Francisco, CA', then click 'Create Application' to trigger the validation error.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Hooli')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Hooli')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2026-02-12')
+        elem = ApplicationsDashboard(frame).field("Date Applied")
+        await elem.fill('2026-02-12')
         
         # -> Clear the Job Title field (ensure it's empty) and submit the form to trigger the validation error ('Job Title is required'). Then verify the validation message appears.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Fill Job Title with 'Backend Engineer' and Location with 'San Francisco, CA', then submit the form to complete the application submission step (click 'Create Application').
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Backend Engineer')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('Backend Engineer')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('San Francisco, CA')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('San Francisco, CA')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
-        await asyncio.sleep(5)
 
     finally:
         if context:
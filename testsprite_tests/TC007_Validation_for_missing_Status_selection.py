@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,134 +49,134 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the 'New Application' button to open the new application form.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Ensure the new application form is open by clicking the 'New Application' button (again if necessary) so the form input fields become available.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Type 'Stark Industries' into the Company Name field (use input index 355). Then fill Job Title (index 357) with 'Mobile Developer', Location (index 392) with 'Los Angeles, CA', Date Applied (index 388) with '2026-02-11', then click the Create Application / Submit button (index 402) without selecting Status to trigger validation.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Stark Industries')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Stark Industries')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mobile Developer')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('Mobile Developer')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Los Angeles, CA')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('Los Angeles, CA')
         
         # -> Click the 'Create Application' / Submit button (index 402) to attempt submission without selecting Status and observe whether a 'Status is required' validation appears.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Close the New Application dialog to reset the form state, then re-open a fresh New Application form so the Status field can be tested (attempt to submit with Status unselected).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).close_button
+        await elem.click(timeout=5000)
         
         # -> Open the New Application form, fill Company Name, Job Title, Location and Application Date, then click Create/Submit to trigger validation (expect 'Status is required').
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Fill the current New Application form fields (Company Name, Job Title, Location, Application Date) using the visible inputs, then click Create Application to attempt submission without changing the Status field.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Stark Industries')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Stark Industries')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mobile Developer')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('Mobile Developer')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Los Angeles, CA')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('Los Angeles, CA')
         
         # -> Click the 'Create Application' submit button (index 802) to submit the form (Status is already 'Applied'), then verify the UI shows success and that 'Stark Industries' appears in the list.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Submit the current form by clicking the Create Application button to complete the flow (status currently set to 'Applied'), then verify the results.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).close_button
+        await elem.click(timeout=5000)
         
         # -> Open a fresh New Application form so inputs are available (click 'New Application' button).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Fill the current New Application form with the requested values, then submit the form (Status is already 'Applied') so the flow completes and the results can be verified.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Stark Industries')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Stark Industries')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Mobile Developer')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('Mobile Developer')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2026-02-11')
+        elem = ApplicationsDashboard(frame).field("Date Applied")
+        await elem.fill('2026-02-11')
         
         # -> Click the Create Application button to submit the current form (Status already 'Applied'), then verify success and that 'Stark Industries' appears in the list.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Open the Status combobox to attempt to clear/unset the Status (so the validation for missing Status can be tested). If the dropdown exposes a blank/default option it can be selected; otherwise inspect options after opening.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[2]/div[1]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).field("Status")
+        await elem.click(timeout=5000)
         
         # -> Fill Location input (index 1282) with 'Los Angeles, CA', click Create Application (index 1292) to submit, then extract page content to verify 'Success' message and that 'Stark Industries' is visible in the applications list.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Los Angeles, CA')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('Los Angeles, CA')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         try:
             await expect(frame.locator('text=Success').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: Expected a 'Success' confirmation after selecting a Status and submitting the application, but the success message did not appear. The submission likely did not complete or the new 'Stark Industries' entry was not created/displayed.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,7 @@
 import asyncio
 from playwright import async_api
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +31,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,48 +48,49 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the 'New Application' (Add Application) button to open the new application form.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Type 'Wayne Enterprises' into the Company Name field and continue filling the form through the first submit to trigger the validation error for missing Location.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Wayne Enterprises')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Wayne Enterprises')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Data Analyst')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('Data Analyst')
         
         # -> Fill the Application Date with 2026-02-09 and click 'Create Application' to trigger validation for missing Location.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2026-02-09')
+        elem = ApplicationsDashboard(frame).field("Date Applied")
+        await elem.fill('2026-02-09')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Fill the Location field with 'Gotham City' (input index 387) and submit the form by clicking 'Create Application' (button index 397).
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gotham City')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('Gotham City')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         # -> Assert validation error is shown for missing Location after first submit
         frame = context.pages[-1]
@@ -100,7 +103,6 @@ async def run_test():
         assert await frame.locator("text=Success").is_visible(), "Expected 'Success' message to be visible after submission"
         await frame.wait_for_selector("text=Wayne Enterprises", timeout=5000)
         assert await frame.locator("text=Wayne Enterprises").is_visible(), "Expected 'Wayne Enterprises' to be visible in the applications list"
-        await asyncio.sleep(5)
 
     finally:
         if context:
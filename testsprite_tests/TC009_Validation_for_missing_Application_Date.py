@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,65 +49,65 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the 'New Application' button to open the application form.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Fill 'Company Name' with 'Umbrella Corp'.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Umbrella Corp')
+        elem = ApplicationsDashboard(frame).field("Company Name")
+        await elem.fill('Umbrella Corp')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[1]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('DevOps Engineer')
+        elem = ApplicationsDashboard(frame).field("Job Title")
+        await elem.fill('DevOps Engineer')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[3]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Raccoon City')
+        elem = ApplicationsDashboard(frame).field("Location")
+        await elem.fill('Raccoon City')
         
         # -> Clear the 'Date Applied' field and submit the form to assert the 'Application Date is required' validation message appears.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[3]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).field("Date Applied")
+        await elem.fill('')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # -> Open the 'New Application' form so the Application Date can be set and the form re-submitted.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/header/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).new_application_button
+        await elem.click(timeout=5000)
         
         # -> Fill the 'Date Applied' field with '2026-02-08' and submit the form (click 'Create Application'). Then check for success and the new entry (done after page updates).
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/div[4]/form/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2026-02-08')
+        elem = ApplicationsDashboard(frame).field("Date Applied")
+        await elem.fill('2026-02-08')
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[4]/form/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).submit_button
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         try:
             await expect(frame.locator('text=Umbrella Corp').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: Expected the newly created application 'Umbrella Corp' to be visible after submitting the form with a valid Application Date, but the entry did not appear on the applications list")
-        await asyncio.sleep(5)
 
     finally:
         if context:
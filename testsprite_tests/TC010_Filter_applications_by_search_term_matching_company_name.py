@@ -1,5 +1,7 @@
 import asyncio
 from playwright import async_api
+from waits import wait_for_idle, wait_for_search_applied
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +31,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,77 +48,85 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Check that the text 'Applications' is visible on the page, then type 'Acme' into the search input to filter the list.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Acme')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('Acme')
+        await wait_for_search_applied(page, 'Acme')
         
         # -> Clear the search input (index 6) so the full list should be restored, then verify the input is empty and the two application cards reappear.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Navigate to the applications page without the search query to reset filters, wait for the page to load, then extract page text to verify whether the search input is empty and whether application cards are displayed (or 'No applications found').
-        await page.goto("http://localhost:3000/applications", wait_until="commit", timeout=10000)
+        await page.goto(f"{base_url()}/applications", wait_until="commit", timeout=10000)
         
         # -> Type 'Acme' into the search input (index 419), wait for the page to update, then extract visible text to determine whether the list is filtered. If filtered result is observed, then clear the input and verify full list is restored (will be next step after extraction).
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Acme')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('Acme')
+        await wait_for_search_applied(page, 'Acme')
         
         # -> Clear the search input (index 419) to remove the search query and restore the full application list, then verify the input is empty and application cards appear.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (element index 419) to remove the search query, wait for the page to update, then extract visible page text to confirm the header, the input value/placeholder, and whether application cards are displayed or 'No applications found' remains.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Navigate to /applications (no query) to reset filters, wait for the page to load, then extract visible page text to verify header presence, search input state (empty/placeholder), and whether application cards are displayed (or 'No applications found').
-        await page.goto("http://localhost:3000/applications", wait_until="commit", timeout=10000)
+        await page.goto(f"{base_url()}/applications", wait_until="commit", timeout=10000)
         
         # -> Type 'Acme' into the visible search input (index 782), wait for UI update, extract visible page text to confirm which application cards are shown. Then clear the input (index 782), wait, and extract page text to confirm the full list is restored.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Acme')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('Acme')
+        await wait_for_search_applied(page, 'Acme')
         
         # -> Clear the search input (index 782), wait for the page to update, then extract visible page text to confirm the input is empty (or placeholder visible) and the full list of applications is shown (or provide 'No applications found' if that remains).
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Focus the visible search input (index 782), clear its contents using keyboard select+delete, wait for the UI to update, then extract page text to verify whether the header is present, the search input is empty (or shows placeholder), and whether the full list of application cards is visible (or 'No applications found').
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.click(timeout=5000)
         
         # -> Clear the visible search input (index 782), wait for the UI to update, then extract visible page text to verify header presence, the search input value/placeholder, and whether the full list of application cards is visible (or 'No applications found'). If full list is present and input empty, finish with success.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         # Assertions: verify header, filtered result, and cleared input
         assert await page.locator("text=Applications").count() > 0, "Expected to find 'Applications' text on the page"
         assert await page.locator("text=Acme").count() > 0, "Expected to find 'Acme' visible after typing into the search input"
-        input_el = page.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
+        input_el = ApplicationsDashboard(page).search_input
         input_value = await input_el.input_value()
         assert input_value == "", f"Expected search input to be empty after clearing, got: '{input_value}'"
-        await asyncio.sleep(5)
 
     finally:
         if context:
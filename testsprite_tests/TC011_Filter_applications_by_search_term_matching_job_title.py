@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle, wait_for_search_applied
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,27 +49,29 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Type 'Engineer' into the search input to filter the list and observe results.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Engineer')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('Engineer')
+        await wait_for_search_applied(page, 'Engineer')
         
         # -> Clear the search bar (set the search input to an empty string) to restore the full applications list.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         try:
             await expect(frame.locator('text=Engineer').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: Expected the applications list to show rows matching the job title 'Engineer' after typing 'Engineer' into the search bar, but the text 'Engineer' was not visible — the filter did not display matching job titles.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,7 @@
 import asyncio
 from playwright import async_api
+from waits import wait_for_idle, wait_for_search_applied
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +31,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,41 +48,45 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Type 'NonexistentCo' into the search input (index 6) to trigger a no-results state.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('NonexistentCo')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('NonexistentCo')
+        await wait_for_search_applied(page, 'NonexistentCo')
         
         # -> Clear the search input to restore the applications list, then verify the applications are visible again.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Trigger a search submission/update after clearing the input so the applications list refreshes (click the search input (index 6) and press Enter).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.click(timeout=5000)
         
         # -> Clear the search input (index 6) and submit the search (press Enter) so the applications list refreshes and verify the application cards reappear.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Navigate to the applications page without the search query (http://localhost:3000/applications) to force the list to refresh, then verify application cards are visible.
-        await page.goto("http://localhost:3000/applications", wait_until="commit", timeout=10000)
+        await page.goto(f"{base_url()}/applications", wait_until="commit", timeout=10000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         # -> Final assertions according to the test plan
         frame = context.pages[-1]
         # Give the UI a moment to settle
-        await page.wait_for_timeout(1000)
+        await wait_for_idle(page)
         # 1) Verify the applications list is visible by checking for a known job item
         apps_item = frame.locator("text=Mobile Developer").nth(0)
         assert await apps_item.is_visible(), "Applications list is not visible: 'Mobile Developer' not found"
@@ -88,16 +94,15 @@ async def run_test():
         # 2) Verify the no-results/empty state is shown for the non-matching search term
         # (look for the exact text 'No results')
         no_results = frame.locator("text=No results")
-        await page.wait_for_timeout(500)
+        await wait_for_idle(page)
         assert await no_results.is_visible(), "Expected 'No results' message for non-matching search term"
         
         # 3) Verify clearing the search restores the applications list (check for another known job item)
         # Ensure final navigation/update has completed
-        await page.wait_for_timeout(1000)
+        await wait_for_idle(page)
         frame = context.pages[-1]
         restored_item = frame.locator("text=Frontend Engineer").nth(0)
         assert await restored_item.is_visible(), "Applications list did not restore after clearing search: 'Frontend Engineer' not found"
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +30,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,110 +47,109 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the 'All Statuses' status filter dropdown to open the status options.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Select the 'Interview' option from the open status dropdown to apply the filter (click option index 363).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("Interview")
+        await elem.click(timeout=5000)
         
         # -> 1) Extract visible application cards to verify currently visible cards and their statuses (confirm whether filter narrowed results). 2) Open status filter dropdown and select 'All Statuses' to clear filter. 3) Extract visible application cards again to verify the full list is restored. Then report results and stop.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Extract the currently visible application cards to confirm the filtered results (company/role, location, status), then click the 'All Statuses' option (index 542) to clear the filter, then extract the application cards again to verify the full list is restored.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("All Statuses")
+        await elem.click(timeout=5000)
         
         # -> Extract the currently visible application cards to confirm whether the full list (mixed statuses) is visible now, then open the 'All Statuses' dropdown.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> 1) Click the 'Interview' option (index 881) to apply the filter. 2) Extract visible application cards to verify only Interview items are shown. 3) Click 'All Statuses' (index 879) to clear the filter. 4) Extract visible cards again to verify the full list is restored.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("Interview")
+        await elem.click(timeout=5000)
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("All Statuses")
+        await elem.click(timeout=5000)
         
         # -> Open the status filter dropdown so the 'All Statuses' option can be selected to clear the filter.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Click 'All Statuses' to clear the status filter so the full applications list is restored (click option index 1014). After that, extract the visible application cards to verify the full list and then finish.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("All Statuses")
+        await elem.click(timeout=5000)
         
         # -> Extract the currently visible application cards to confirm whether the page is still filtered to INTERVIEW, then open the status filter dropdown so the 'All Statuses' option can be selected to clear the filter.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Click the 'Interview' option (index 1451) to apply the Interview filter, then extract visible cards to confirm only Interview items are shown.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("Interview")
+        await elem.click(timeout=5000)
         
         # -> 1) Extract the currently visible application cards to verify whether only 'Interview' items are shown (confirm filtered state). 2) Open the status filter dropdown so the 'All Statuses' option can be selected next.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Extract the currently visible application cards to confirm the filtered results show only 'Interview' items, then click 'All Statuses' to clear the filter, then extract again to verify the full list is restored.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("All Statuses")
+        await elem.click(timeout=5000)
         
         # -> Open the status filter dropdown so the 'Interview' option can be selected next.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Extract the currently visible application cards to confirm the full list is visible, then click the 'Interview' option (index 1999) to apply the Interview filter.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("Interview")
+        await elem.click(timeout=5000)
         
         # -> Extract the currently visible application cards to confirm the filtered results show only 'Interview' items, then open the status filter dropdown (click combobox) so the 'All Statuses' option can be selected.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Click 'All Statuses' to clear the status filter, then extract the visible application cards to verify the full applications list is restored.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("All Statuses")
+        await elem.click(timeout=5000)
         
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +30,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,38 +47,37 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the status filter dropdown (All Statuses) to open the status options menu so APPLIED can be selected.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Select 'APPLIED' from the status dropdown and verify the text 'APPLIED' is visible (and that the displayed applications update accordingly).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("Applied")
+        await elem.click(timeout=5000)
         
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Select 'OFFER' from the open status list by clicking option index 680 so the page updates to show Offer applications, then verify the text 'OFFER' is visible and application cards update accordingly.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("Offer")
+        await elem.click(timeout=5000)
         
         # -> Open the status filter dropdown so the 'Offer' option can be re-selected (attempt to apply the Offer filter again).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,7 @@
 import asyncio
 from playwright import async_api
+from waits import wait_for_search_applied
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +31,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,51 +48,53 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Verify the applications list is visible by finding 'Vlexx' on the page, then type 'Acme' into the search input (index 6).
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Acme')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('Acme')
+        await wait_for_search_applied(page, 'Acme')
         
         # -> Click the status filter dropdown to open status options (click element index 73).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Click the 'Interview' option in the open status list to apply the INTERVIEWING status filter (use option element index 455).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("Interview")
+        await elem.click(timeout=5000)
         
         # -> Clear the search input (index 6) by setting it to an empty string.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Open the status filter combobox (click element index 73) to reveal options so the status filter can be cleared (select All/clear).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).status_filter
+        await elem.click(timeout=5000)
         
         # -> Click the 'All Statuses' option to clear the status filter (select the option at index 579), then verify the applications list becomes visible.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).option("All Statuses")
+        await elem.click(timeout=5000)
         
         # -> Clear the search input value (empty) so the filters are fully cleared, then verify the applications list becomes visible.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle, wait_for_search_applied
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,123 +49,138 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Type three spaces into the search bar (input element index 6) to verify that entering only spaces does not filter results.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('   ')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('   ')
+        await wait_for_search_applied(page, '   ')
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string so the application list can be restored.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string so the application list can be restored.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting its value to an empty string so the applications list can be restored, then verify the search bar is empty.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string (use clear=true) to restore the applications list, then verify the search bar is empty.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string (use clear=true) to restore the applications list.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string with clear=true to restore the applications list.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting its value to an empty string (use clear=true) to restore the applications list and allow verifying the search bar is empty.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting its value to an empty string (use clear=true) so the applications list can be restored, then verify the search bar is empty.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string (use clear=true) to restore the applications list and then verify the search bar is empty.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting its value to an empty string (use clear=true) to restore the applications list and allow verifying the search bar is empty.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting its value to an empty string (use clear=true) to restore the applications list.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string (clear=true) to restore the applications list, then extract the visible application cards to confirm the list and check for the 'No applications found' message.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string (clear=true), wait for the page to update, then extract the visible application cards and report whether 'No applications found' is present or the applications list is visible.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input (index 6) by setting it to an empty string, wait for the page to update, then extract the visible application cards and report whether 'No applications found' is present or the applications list is visible.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.click(timeout=5000)
         
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # -> Clear the search input correctly and submit the cleared value so the page updates, then extract the visible application cards and report whether 'No applications found' is still present or the applications list is visible.
         frame = context.pages[-1]
         # Input text
-        elem = frame.locator('xpath=html/body/main/div/div/div[1]/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        elem = ApplicationsDashboard(frame).search_input
+        await elem.fill('')
+        await wait_for_search_applied(page, '')
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
-        ```
         try:
             await expect(frame.locator('text=Applications').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: verifying that entering only spaces into the search bar does not filter results — expected the applications list ('Applications') to remain visible but it was not found")
-        ```
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,59 +49,57 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the Delete button for the first application (Vlexx) to open the confirmation dialog.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div[1]/div[3]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).delete_button()
+        await elem.click(timeout=5000)
         
         # -> Click the confirmation button in the dialog (the 'Delete' button) to confirm deletion of the Vlexx application.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[4]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).confirm_delete_button
+        await elem.click(timeout=5000)
         
         # -> Click the Delete button for the first application ('Test') to open the confirmation dialog (element index 176).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div[3]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).delete_button()
+        await elem.click(timeout=5000)
         
         # -> Click the confirmation 'Delete' button in the open dialog to confirm deletion of the 'Test' application (index 462).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[4]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).confirm_delete_button
+        await elem.click(timeout=5000)
         
         # -> Close the open delete dialog, then search the page for the application name 'Test' to verify whether it was removed (or still present).
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).close_button
+        await elem.click(timeout=5000)
         
         # -> Click the Delete button for the first visible application (Stark Industries) to open the confirmation dialog.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div[1]/div[3]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).delete_button()
+        await elem.click(timeout=5000)
         
         # -> Click the confirmation 'Delete' button in the open dialog for 'Stark Industries' (element index 819) to attempt deletion, then verify success message and that the item is removed.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[4]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).confirm_delete_button
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
-        ```
         try:
             await expect(frame.locator('text=Deleted').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: The test attempted to delete an application and expected a visible 'Deleted' success message after confirming deletion, but the success message did not appear — the application may not have been removed or the UI failed to show the confirmation")
-        ```
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +30,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,21 +47,20 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the 'Delete' button for the first application (Vlexx) to open the delete confirmation dialog.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div[1]/div[3]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).delete_button()
+        await elem.click(timeout=5000)
         
         # -> Click the 'Cancel' button in the delete confirmation dialog to close it.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[4]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).cancel_button
+        await elem.click(timeout=5000)
         
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,7 @@
 import asyncio
 from playwright import async_api
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +31,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,15 +48,16 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Click the Delete button for the first application (Vlexx) to open the confirmation dialog so the dialog content can be verified.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div[1]/div[3]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).delete_button()
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
         # -> Assertions: verify job applications list is visible
         await frame.wait_for_selector("text=Job Applications", timeout=5000)
@@ -69,7 +72,6 @@ async def run_test():
         assert await frame.locator("text=Cancel").is_visible(), "Cancel button not visible in delete confirmation dialog"
         await frame.wait_for_selector("text=Delete", timeout=5000)
         assert await frame.locator("text=Delete").is_visible(), "Confirm/Delete button not visible in delete confirmation dialog"
-        await asyncio.sleep(5)
 
     finally:
         if context:
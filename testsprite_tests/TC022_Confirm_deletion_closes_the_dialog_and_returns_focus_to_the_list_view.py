@@ -1,5 +1,8 @@
 import asyncio
 from playwright import async_api
+from playwright.async_api import expect
+from waits import wait_for_idle
+from dashboard import ApplicationsDashboard, base_url
 
 async def run_test():
     pw = None
@@ -29,7 +32,7 @@ async def run_test():
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,29 +49,27 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(base_url(), wait_until="commit", timeout=10000)
         
         # -> Verify element 'job applications list' is visible by extracting the application card/company names from the page.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div[1]/div[3]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).delete_button()
+        await elem.click(timeout=5000)
         
         # -> Click the 'Delete' (confirm) button inside the confirmation dialog to confirm deletion.
         frame = context.pages[-1]
         # Click element
-        elem = frame.locator('xpath=html/body/div[4]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = ApplicationsDashboard(frame).confirm_delete_button
+        await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
+        await wait_for_idle(page)
         frame = context.pages[-1]
-        ```
         try:
             await expect(frame.locator('text=Job Applications List').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: After confirming deletion the confirmation dialog should have closed and the job applications list should be visible again, but the list did not appear (the dialog may still be present or navigation back to the list failed)")
-        ```
-        await asyncio.sleep(5)
 
     finally:
         if context:
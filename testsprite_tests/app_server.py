@@ -0,0 +1,82 @@
+"""Run a private app server per e2e worker.
+
+Each server gets its own DATABASE_URL (a WorkerDatabase) and port, so workers
+never see each other's writes. ``next start`` serves the existing production
+build, so run ``pnpm build`` first, or set E2E_SERVER_COMMAND (e.g.
+"npx next dev") to use something else. The port is appended as ``-p PORT``.
+For Postgres workers the build must come from ``pnpm build:postgres``.
+"""
+
+import os
+import shlex
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from database import DATABASES_DIR
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_COMMAND = "npx next start"
+
+
+class AppServer:
+    def __init__(self, database, port, command=None):
+        self.database = database
+        self.port = port
+        self.command = shlex.split(command or os.environ.get("E2E_SERVER_COMMAND", DEFAULT_COMMAND))
+        self.log_path = DATABASES_DIR / f"{database.name}.log"
+        self._process = None
+
+    @property
+    def base_url(self):
+        return f"http://localhost:{self.port}"
+
+    def start(self, timeout=60):
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        env = os.environ | {
+            "DATABASE_URL": self.database.url,
+            "E2E_RESET_ENABLED": "1",
+            "PORT": str(self.port),
+        }
+        with open(self.log_path, "wb") as log:
+            self._process = subprocess.Popen(
+                [*self.command, "-p", str(self.port)],
+                cwd=REPO_DIR,
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+        self._wait_until_ready(timeout)
+
+    def _wait_until_ready(self, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"App server exited with {self._process.returncode}; see {self.log_path}")
+            try:
+                with urllib.request.urlopen(f"{self.base_url}/applications", timeout=5):
+                    return
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.1)
+        self.stop()
+        raise TimeoutError(f"App server not ready on port {self.port} after {timeout}s; see {self.log_path}")
+
+    def reset(self):
+        """Restore the seeded data and drop the server's caches of the old data."""
+        self.database.reset()
+        request = urllib.request.Request(f"{self.base_url}/api/e2e/reset", method="POST")
+        with urllib.request.urlopen(request, timeout=10):
+            pass
+
+    def stop(self):
+        if self._process is None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._process = None
@@ -0,0 +1,179 @@
+"""Page object for the /applications dashboard.
+
+Locators use roles, accessible names and form labels rather than absolute
+XPaths, so they survive layout changes and portal re-ordering (dialogs and
+select popovers are rendered at the end of <body>, and their position there
+depends on what else has been opened).
+"""
+
+import os
+import re
+
+from waits import CARD_SELECTOR, wait_for_idle, wait_for_results, wait_for_search_applied, wait_for_url_param
+
+DEFAULT_BASE_URL = "http://localhost:3000"
+
+
+def base_url():
+    """The app under test; conftest.py points this at the worker's own server."""
+    return os.environ.get("E2E_BASE_URL", DEFAULT_BASE_URL)
+
+
+STATUS_PARAMS = {
+    "All Statuses": None,
+    "Applied": "APPLIED",
+    "Interview": "INTERVIEW",
+    "Offer": "OFFER",
+    "Rejected": "REJECTED",
+    "Ghosted": "GHOSTED",
+}
+
+
+class ApplicationsDashboard:
+    def __init__(self, page):
+        self.page = page
+
+    # Toolbar
+
+    @property
+    def heading(self):
+        return self.page.get_by_role("heading", name="Job Applications")
+
+    @property
+    def new_application_button(self):
+        return self.page.get_by_role("button", name="New Application")
+
+    @property
+    def search_input(self):
+        return self.page.get_by_role("textbox", name="Search applications")
+
+    @property
+    def status_filter(self):
+        return self.page.get_by_role("combobox", name="Filter by status")
+
+    @property
+    def sort_select(self):
+        return self.page.get_by_role("combobox", name="Sort applications")
+
+    def option(self, name):
+        """An option of whichever select popover is currently open."""
+        return self.page.get_by_role("option", name=name, exact=True)
+
+    # Summary
+
+    @property
+    def status_summary(self):
+        return self.page.get_by_label("Applications by status")
+
+    def status_count(self, label):
+        """The figure shown for ``label`` ("Total", "Applied", ...) in the summary bar."""
+        return self.status_summary.locator("div").filter(has=self.page.get_by_text(label, exact=True)).locator("dd")
+
+    # List
+
+    @property
+    def cards(self):
+        return self.page.get_by_role("listitem")
+
+    @property
+    def empty_state(self):
+        return self.page.get_by_text("No applications found")
+
+    def card(self, company_name):
+        return self.cards.filter(has=self.page.get_by_text(company_name, exact=True))
+
+    def edit_button(self, company_name=None):
+        if company_name is None:
+            return self.page.locator(CARD_SELECTOR).first
+        return self.page.get_by_role("button", name=f"Edit application for {company_name}", exact=True)
+
+    def delete_button(self, company_name=None):
+        if company_name is None:
+            return self.page.locator('button[aria-label^="Delete application for"]').first
+        return self.page.get_by_role("button", name=f"Delete application for {company_name}", exact=True)
+
+    def select_checkbox(self, company_name):
+        return self.page.get_by_role("checkbox", name=f"Select application for {company_name}", exact=True)
+
+    @property
+    def bulk_toolbar(self):
+        return self.page.get_by_role("toolbar", name="Selected applications")
+
+    # Dialogs (application form and delete confirmation)
+
+    @property
+    def dialog(self):
+        return self.page.get_by_role("dialog")
+
+    def field(self, label):
+        """A form control by its label, e.g. "Company Name" or "Date Applied"."""
+        return self.dialog.get_by_label(label, exact=True)
+
+    @property
+    def submit_button(self):
+        return self.dialog.get_by_role("button", name=re.compile(r"^(Create|Update) Application$"))
+
+    @property
+    def close_button(self):
+        return self.dialog.get_by_role("button", name="Close")
+
+    @property
+    def confirm_delete_button(self):
+        return self.dialog.get_by_role("button", name="Delete", exact=True)
+
+    @property
+    def cancel_button(self):
+        return self.dialog.get_by_role("button", name="Cancel", exact=True)
+
+    @property
+    def mutation_error(self):
+        """The alert shown when the server rejects a create, edit or delete."""
+        return self.page.get_by_role("alert").filter(has_text="Your change was undone")
+
+    # Actions
+
+    async def goto(self, query=""):
+        await self.page.goto(f"{base_url()}/applications{query}")
+        await wait_for_results(self.page)
+
+    async def search(self, term):
+        await self.search_input.fill(term)
+        await wait_for_search_applied(self.page, term)
+
+    async def filter_status(self, label):
+        await self.status_filter.click()
+        await self.option(label).click()
+        await wait_for_url_param(self.page, "status", STATUS_PARAMS[label])
+        await wait_for_idle(self.page)
+
+    async def fill_form(self, **values):
+        """Fill the open application form; keys are field labels in snake_case."""
+        labels = {
+            "company_name": "Company Name",
+            "job_title": "Job Title",
+            "location": "Location",
+            "date_applied": "Date Applied",
+            "salary": "Salary (Optional)",
+            "notes": "Notes",
+        }
+        for key, value in values.items():
+            await self.field(labels[key]).fill(value)
+
+    async def create_application(self, **values):
+        await self.new_application_button.click()
+        await self.fill_form(**values)
+        await self.submit_button.click()
+        await self.dialog.wait_for(state="hidden")
+        await wait_for_idle(self.page)
+
+    async def delete_application(self, company_name):
+        await self.delete_button(company_name).click()
+        await self.confirm_delete_button.click()
+        await self.dialog.wait_for(state="hidden")
+
+    async def bulk_change_status(self, company_names, label):
+        for company_name in company_names:
+            await self.select_checkbox(company_name).check()
+        await self.bulk_toolbar.get_by_role("combobox", name="Change status of selected").click()
+        await self.option(label).click()
+        await wait_for_idle(self.page)
@@ -0,0 +1,194 @@
+"""Seeded, per-worker SQLite databases for the end-to-end suite.
+
+The template database is built straight from prisma/migrations and the rows in
+fixtures/applications.json with the stdlib sqlite3 module -- no Prisma CLI, no
+UI round-trips -- which takes a few milliseconds. Each worker then gets its own
+copy, and resetting a worker between tests restores it from the template with
+SQLite's online backup API. That is safe while the app server holds the file
+open, so the server does not need a restart.
+
+With E2E_POSTGRES_URL set, workers get a database each on that Postgres
+server instead (PostgresWorkerDatabase), migrated from prisma/postgres and
+reset by re-inserting the same fixtures. That needs psycopg 3.
+
+Usage (build a template by hand, e.g. to point `pnpm dev` at it):
+    PYTHONPATH=../scripts python database.py [PATH]
+"""
+
+import json
+import sqlite3
+import sys
+import uuid
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from rebuild_rollups import HISTORY_BACKFILL, rebuild_statements
+
+SUITE_DIR = Path(__file__).resolve().parent
+MIGRATIONS_DIR = SUITE_DIR.parent / "prisma" / "migrations"
+POSTGRES_MIGRATIONS_DIR = SUITE_DIR.parent / "prisma" / "postgres" / "migrations"
+FIXTURES_PATH = SUITE_DIR / "fixtures" / "applications.json"
+DATABASES_DIR = SUITE_DIR / "databases"
+
+# Fixed ids and timestamps keep every seeded database byte-for-byte alike.
+ID_NAMESPACE = uuid.UUID("6f1c1b7e-5d0a-4c35-9a57-2f3e0d4b8a10")
+SEEDED_AT = "2026-02-14"
+
+INSERT_SQL = (
+    'INSERT INTO "job_applications" ("id", "companyName", "jobTitle", "status", '
+    '"location", "salaryRange", "applicationDate", "notes", "createdAt", "updatedAt") '
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _epoch_ms(date):
+    """Prisma stores SQLite DateTime values as epoch milliseconds."""
+    parsed = datetime.fromisoformat(date).replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+def _utc_timestamp(date):
+    """Prisma stores Postgres DateTime values as UTC TIMESTAMP(3)."""
+    return datetime.fromisoformat(date)
+
+
+def fixture_rows(path=FIXTURES_PATH, timestamp=_epoch_ms):
+    seeded_at = timestamp(SEEDED_AT)
+    for index, record in enumerate(json.loads(Path(path).read_text())):
+        yield (
+            str(uuid.uuid5(ID_NAMESPACE, f"{index}:{record['companyName']}")),
+            record["companyName"],
+            record["jobTitle"],
+            record["status"],
+            record["location"],
+            record.get("salaryRange"),
+            timestamp(record["applicationDate"]),
+            record.get("notes", ""),
+            seeded_at,
+            seeded_at,
+        )
+
+
+def build_template(path, fixtures=FIXTURES_PATH):
+    """Create a migrated, seeded database at ``path``, replacing any existing file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in (path, path.with_name(path.name + "-journal"), path.with_name(path.name + "-wal")):
+        stale.unlink(missing_ok=True)
+
+    with closing(sqlite3.connect(path)) as conn:
+        for migration in sorted(MIGRATIONS_DIR.glob("*/migration.sql")):
+            conn.executescript(migration.read_text())
+        conn.executemany(INSERT_SQL, fixture_rows(fixtures))
+        # The app maintains the analytics rollups and status history itself;
+        # these rows bypass it.
+        for statement in rebuild_statements("sqlite"):
+            conn.execute(statement)
+        conn.execute(HISTORY_BACKFILL)
+        conn.commit()
+    return path
+
+
+class WorkerDatabase:
+    """One worker's database, restorable to the template at any time."""
+
+    def __init__(self, name, template, directory=DATABASES_DIR):
+        self.name = name
+        self.template = Path(template)
+        self.path = Path(directory) / f"{name}.db"
+
+    @property
+    def url(self):
+        """Value for the app server's DATABASE_URL."""
+        return f"file:{self.path}"
+
+    def reset(self):
+        """Restore the template's contents into this database."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.template)) as source, closing(sqlite3.connect(self.path, timeout=10)) as target:
+            source.backup(target)
+
+    def count(self):
+        with closing(sqlite3.connect(self.path)) as conn:
+            return conn.execute('SELECT COUNT(*) FROM "job_applications"').fetchone()[0]
+
+
+def _psycopg():
+    try:
+        import psycopg
+    except ImportError:
+        raise RuntimeError("E2E_POSTGRES_URL needs psycopg 3: pip install 'psycopg[binary]'") from None
+    return psycopg
+
+
+def _with_database(url, database, keep_query=True):
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(path=f"/{database}", query=parts.query if keep_query else ""))
+
+
+class PostgresWorkerDatabase:
+    """One worker's database on a Postgres server, restorable to the fixtures.
+
+    ``reset`` empties every table and re-inserts the fixtures in one
+    transaction rather than recreating the database, so the app server's
+    pooled connections stay valid.
+    """
+
+    def __init__(self, name, server_url):
+        self.name = name
+        self.server_url = server_url
+        self.database = f"jobtracker_e2e_{name}"
+
+    @property
+    def url(self):
+        """Value for the app server's DATABASE_URL."""
+        return _with_database(self.server_url, self.database)
+
+    def _connect(self, database, **kwargs):
+        # psycopg rejects Prisma-only parameters such as ?schema=, so drop the query.
+        return _psycopg().connect(_with_database(self.server_url, database, keep_query=False), **kwargs)
+
+    def create(self):
+        """(Re)create the database and apply prisma/postgres/migrations."""
+        from psycopg import sql
+
+        admin_database = urlsplit(self.server_url).path.lstrip("/") or "postgres"
+        with closing(self._connect(admin_database, autocommit=True)) as admin:
+            name = sql.Identifier(self.database)
+            admin.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(name))
+            admin.execute(sql.SQL("CREATE DATABASE {}").format(name))
+        with closing(self._connect(self.database)) as conn, conn.transaction():
+            for migration in sorted(POSTGRES_MIGRATIONS_DIR.glob("*/migration.sql")):
+                conn.execute(migration.read_text())
+
+    def reset(self):
+        """Replace all rows with the fixtures."""
+        from psycopg import sql
+
+        with closing(self._connect(self.database)) as conn, conn.transaction():
+            tables = [
+                row[0] for row in conn.execute("SELECT tablename FROM pg_tables WHERE schemaname = current_schema()")
+            ]
+            conn.execute(sql.SQL("TRUNCATE {}").format(sql.SQL(", ").join(map(sql.Identifier, tables))))
+            with conn.cursor() as cursor:
+                cursor.executemany(INSERT_SQL.replace("?", "%s"), fixture_rows(timestamp=_utc_timestamp))
+                for statement in rebuild_statements("postgresql"):
+                    cursor.execute(statement)
+                cursor.execute(HISTORY_BACKFILL)
+
+    def count(self):
+        with closing(self._connect(self.database)) as conn:
+            return conn.execute('SELECT COUNT(*) FROM "job_applications"').fetchone()[0]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = build_template(argv[0] if argv else DATABASES_DIR / "template.db")
+    print(f"Seeded {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""Run the TC*.py end-to-end scripts concurrently against one shared browser.
+
+Each TestSprite script is a standalone program that starts its own Playwright
+driver and Chromium, then calls ``asyncio.run(run_test())`` at import time.
+This runner loads the scripts without executing that last line, hands each
+``run_test`` a stand-in for ``async_playwright()`` whose ``chromium.launch()``
+returns a handle to a single shared browser, and runs the tests with bounded
+concurrency. Every test still creates its own ``BrowserContext`` (cookies,
+storage and pages are isolated); closing the "browser" only closes the
+contexts that test opened.
+
+Usage:
+    python run_suite.py [-k PATTERN] [--workers N] [--timeout SECONDS]
+                        [--json PATH] [--junit PATH] [--compare BASELINE.json]
+
+Reports default to reports/results.json and reports/results.xml. Pass the
+JSON report of an earlier run to --compare to print a before/after runtime
+table.
+"""
+
+import argparse
+import ast
+import asyncio
+import json
+import os
+import sys
+import time
+import traceback
+import types
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from playwright import async_api
+
+SUITE_DIR = Path(__file__).resolve().parent
+REPORTS_DIR = SUITE_DIR / "reports"
+
+BROWSER_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+]
+
+
+@dataclass
+class TestResult:
+    name: str
+    path: str
+    status: str  # "passed", "failed" or "error"
+    duration: float
+    message: str = ""
+    details: str = field(default="", repr=False)
+
+
+class SharedBrowser:
+    """Browser handle given to one test; owns only the contexts it creates."""
+
+    def __init__(self, browser):
+        self._browser = browser
+        self._contexts = []
+
+    async def new_context(self, **kwargs):
+        context = await self._browser.new_context(**kwargs)
+        self._contexts.append(context)
+        return context
+
+    async def new_page(self, **kwargs):
+        context = await self.new_context(**kwargs)
+        return await context.new_page()
+
+    @property
+    def contexts(self):
+        return list(self._contexts)
+
+    def is_connected(self):
+        return self._browser.is_connected()
+
+    async def close(self, **_kwargs):
+        for context in self._contexts:
+            try:
+                await context.close()
+            except async_api.Error:
+                pass
+        self._contexts.clear()
+
+
+class SharedPlaywright:
+    """Stand-in for the object returned by ``async_playwright().start()``."""
+
+    def __init__(self, browser):
+        self.chromium = types.SimpleNamespace(launch=self._launch)
+        self._browser = browser
+        self._handles = []
+
+    async def _launch(self, **_kwargs):
+        handle = SharedBrowser(self._browser)
+        self._handles.append(handle)
+        return handle
+
+    async def stop(self):
+        for handle in self._handles:
+            await handle.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        await self.stop()
+
+
+def shared_async_api(browser):
+    """A copy of ``playwright.async_api`` whose ``async_playwright`` reuses ``browser``."""
+    module = types.ModuleType("async_api")
+    module.__dict__.update(vars(async_api))
+
+    class _Starter:
+        def __init__(self):
+            self._playwright = SharedPlaywright(browser)
+
+        async def start(self):
+            return self._playwright
+
+        async def __aenter__(self):
+            return self._playwright
+
+        async def __aexit__(self, *exc):
+            await self._playwright.stop()
+
+    module.async_playwright = _Starter
+    return module
+
+
+def discover(pattern=None):
+    paths = sorted(SUITE_DIR.glob("TC*.py"))
+    if pattern:
+        paths = [path for path in paths if pattern.lower() in path.name.lower()]
+    return paths
+
+
+def load_run_test(path, browser):
+    """Compile a TC script without its trailing ``asyncio.run(...)`` call."""
+    tree = ast.parse(path.read_text(), filename=str(path))
+    tree.body = [
+        node
+        for node in tree.body
+        if not (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Call)
+            and ast.unparse(node.value.func) == "asyncio.run"
+        )
+    ]
+    namespace = {"__name__": f"testsprite_{path.stem}", "__file__": str(path)}
+    exec(compile(tree, str(path), "exec"), namespace)
+
+    # Rebind after exec so the script's own `from playwright import async_api`
+    # is replaced. TestSprite's executor provides `expect` globally, and some
+    # generated scripts rely on that.
+    namespace["async_api"] = shared_async_api(browser)
+    namespace.setdefault("expect", async_api.expect)
+    return namespace["run_test"]
+
+
+async def run_one(path, browser, semaphore, timeout):
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            run_test = load_run_test(path, browser)
+            await asyncio.wait_for(run_test(), timeout=timeout)
+            status, message, details = "passed", "", ""
+        except AssertionError as exc:
+            status, message, details = "failed", str(exc), traceback.format_exc()
+        except asyncio.TimeoutError:
+            status, message, details = "error", f"Timed out after {timeout}s", ""
+        except Exception as exc:  # noqa: BLE001 - report any script error
+            status = "error"
+            message = f"{type(exc).__name__}: {exc}"
+            details = traceback.format_exc()
+        duration = time.perf_counter() - started
+        print(f"{status.upper():<6} {duration:6.1f}s  {path.stem}", flush=True)
+        return TestResult(path.stem, str(path.relative_to(SUITE_DIR)), status, duration, message, details)
+
+
+async def run_suite(paths, workers, timeout):
+    semaphore = asyncio.Semaphore(workers)
+    async with async_api.async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+        try:
+            return await asyncio.gather(*(run_one(path, browser, semaphore, timeout) for path in paths))
+        finally:
+            await browser.close()
+
+
+def write_json(results, wall_time, destination):
+    summary = {
+        "total": len(results),
+        "passed": sum(r.status == "passed" for r in results),
+        "failed": sum(r.status == "failed" for r in results),
+        "errors": sum(r.status == "error" for r in results),
+        "wall_time": round(wall_time, 3),
+        "test_time": round(sum(r.duration for r in results), 3),
+        "tests": [asdict(r) | {"duration": round(r.duration, 3)} for r in results],
+    }
+    Path(destination).write_text(json.dumps(summary, indent=2))
+
+
+def write_junit(results, wall_time, destination):
+    suite = ET.Element(
+        "testsuite",
+        name="testsprite_tests",
+        tests=str(len(results)),
+        failures=str(sum(r.status == "failed" for r in results)),
+        errors=str(sum(r.status == "error" for r in results)),
+        time=f"{wall_time:.3f}",
+    )
+    for result in results:
+        case = ET.SubElement(suite, "testcase", classname="testsprite_tests", name=result.name, time=f"{result.duration:.3f}")
+        if result.status != "passed":
+            element = ET.SubElement(case, "failure" if result.status == "failed" else "error", message=result.message)
+            element.text = result.details
+    ET.ElementTree(suite).write(destination, encoding="utf-8", xml_declaration=True)
+
+
+def print_comparison(baseline_path, results, wall_time):
+    baseline = json.loads(Path(baseline_path).read_text())
+    before = {test["name"]: test["duration"] for test in baseline["tests"]}
+
+    print(f"\n{'test':<60} {'before':>8} {'after':>8} {'delta':>8}")
+    for result in results:
+        previous = before.get(result.name)
+        if previous is None:
+            print(f"{result.name[:60]:<60} {'-':>8} {result.duration:8.1f} {'-':>8}")
+        else:
+            print(f"{result.name[:60]:<60} {previous:8.1f} {result.duration:8.1f} {result.duration - previous:+8.1f}")
+
+    test_time = sum(r.duration for r in results)
+    print(f"{'total test time':<60} {baseline['test_time']:8.1f} {test_time:8.1f} {test_time - baseline['test_time']:+8.1f}")
+    print(f"{'suite wall time':<60} {baseline['wall_time']:8.1f} {wall_time:8.1f} {wall_time - baseline['wall_time']:+8.1f}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run tests whose file name contains PATTERN")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("E2E_WORKERS", 4)))
+    parser.add_argument("--timeout", type=float, default=300, help="per-test timeout in seconds")
+    parser.add_argument("--json", dest="json_path", default=REPORTS_DIR / "results.json")
+    parser.add_argument("--junit", dest="junit_path", default=REPORTS_DIR / "results.xml")
+    parser.add_argument("--compare", dest="baseline_path", help="JSON report of a previous run")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    paths = discover(args.pattern)
+    if not paths:
+        print("No tests matched.", file=sys.stderr)
+        return 1
+
+    print(f"Running {len(paths)} tests with {args.workers} workers", flush=True)
+    started = time.perf_counter()
+    results = asyncio.run(run_suite(paths, max(args.workers, 1), args.timeout))
+    wall_time = time.perf_counter() - started
+
+    for destination in (args.json_path, args.junit_path):
+        Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    write_json(results, wall_time, args.json_path)
+    write_junit(results, wall_time, args.junit_path)
+
+    if args.baseline_path:
+        print_comparison(args.baseline_path, results, wall_time)
+
+    passed = sum(r.status == "passed" for r in results)
+    print(f"\n{passed}/{len(results)} passed in {wall_time:.1f}s (sum of test times {sum(r.duration for r in results):.1f}s)")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Smoke tests for the applications dashboard written against the page object."""
+
+from playwright.async_api import expect
+
+
+async def test_dashboard_shows_toolbar(dashboard):
+    await expect(dashboard.heading).to_be_visible()
+    await expect(dashboard.search_input).to_be_editable()
+    await expect(dashboard.status_filter).to_be_visible()
+    await expect(dashboard.sort_select).to_be_visible()
+
+
+async def test_search_without_matches_shows_empty_state(dashboard):
+    await dashboard.search("zzzz-no-such-company")
+    await expect(dashboard.empty_state).to_be_visible()
+    await expect(dashboard.cards).to_have_count(0)
+
+    await dashboard.search("")
+    await expect(dashboard.empty_state.or_(dashboard.cards.first)).to_be_visible()
+
+
+async def test_new_application_form_requires_company_name(dashboard):
+    await dashboard.new_application_button.click()
+    await dashboard.fill_form(job_title="Engineer", location="Remote")
+    await dashboard.submit_button.click()
+
+    await expect(dashboard.dialog).to_be_visible()
+    await expect(dashboard.dialog.get_by_text("Company name is required")).to_be_visible()
+
+    await dashboard.close_button.click()
+    await expect(dashboard.dialog).to_be_hidden()
+
+
+async def test_status_filter_updates_url(dashboard):
+    await dashboard.filter_status("Interview")
+    await expect(dashboard.status_filter).to_have_text("Interview")
+
+    await dashboard.filter_status("All Statuses")
+    await expect(dashboard.status_filter).to_have_text("All Statuses")
+
+
+async def test_summary_counts_follow_creates(dashboard):
+    total = int(await dashboard.status_count("Total").inner_text())
+    await dashboard.create_application(
+        company_name="Counter Labs", job_title="Engineer", date_applied="2026-02-01", location="Remote"
+    )
+    await expect(dashboard.status_count("Total")).to_have_text(str(total + 1))
+
+
+async def test_failed_delete_restores_the_card(dashboard, page):
+    async def reject_actions(route):
+        # Server Actions POST to the page URL; page loads still go through.
+        if route.request.method == "POST":
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/applications**", reject_actions)
+    await dashboard.delete_application("Acme Corp")
+
+    await expect(dashboard.mutation_error).to_be_visible()
+    await expect(dashboard.card("Acme Corp")).to_be_visible()
+
+
+async def test_bulk_status_change_moves_every_selected_card(dashboard):
+    ghosted = int(await dashboard.status_count("Ghosted").inner_text())
+    await dashboard.bulk_change_status(["Acme Corp", "Vlexx"], "Ghosted")
+
+    await expect(dashboard.bulk_toolbar).to_be_hidden()
+    await expect(dashboard.status_count("Ghosted")).to_have_text(str(ghosted + 2))
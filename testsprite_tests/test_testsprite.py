@@ -0,0 +1,15 @@
+"""Collect the generated TC*.py scripts as pytest tests.
+
+Each script runs against the session's shared browser, exactly as under
+run_suite.py, so the same scripts can be run by either runner.
+"""
+
+import pytest
+
+from run_suite import discover, load_run_test
+
+
+@pytest.mark.parametrize("path", discover(), ids=lambda path: path.stem.split("_", 1)[0])
+async def test_script(path, browser):
+    run_test = load_run_test(path, browser)
+    await run_test()
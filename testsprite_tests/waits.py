@@ -0,0 +1,60 @@
+"""Condition-based waits shared by the TestSprite end-to-end scripts.
+
+These replace fixed ``wait_for_timeout``/``asyncio.sleep`` pauses: each helper
+returns as soon as the page reaches the state the next step depends on.
+Playwright actions (``click``, ``fill``) and ``expect`` assertions already
+auto-wait for their target, so helpers are only needed where a script reads
+state without retrying (``count()``, ``is_visible()``) or where the app updates
+asynchronously after an action, such as the search box's debounced
+``router.replace``.
+"""
+
+from urllib.parse import parse_qs, urlparse
+
+from playwright.async_api import Error, expect
+
+# Mirrors SEARCH_MIN_LENGTH in lib/constants/search.ts: shorter terms clear
+# the search instead of applying it.
+SEARCH_MIN_LENGTH = 2
+
+# Every rendered application card has exactly one edit button.
+CARD_SELECTOR = 'button[aria-label^="Edit application for"]'
+EMPTY_STATE_TEXT = "No applications found"
+
+
+async def wait_for_idle(page, timeout=5000):
+    """Wait until the page has had no network traffic for 500 ms."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except Error:
+        # Long-lived connections (e.g. dev-server HMR) can keep the page busy;
+        # the caller's own assertions still retry.
+        pass
+
+
+def _query_value(url, name):
+    return parse_qs(urlparse(url).query).get(name, [None])[0]
+
+
+async def wait_for_url_param(page, name, value, timeout=5000):
+    """Wait until query param ``name`` equals ``value`` (None: absent)."""
+    await page.wait_for_url(lambda url: _query_value(url, name) == value, timeout=timeout)
+
+
+async def wait_for_search_applied(page, term, timeout=5000):
+    """Wait for the debounced search box to push ``term`` into the URL and render."""
+    stripped = term.strip()
+    applied = stripped if len(stripped) >= SEARCH_MIN_LENGTH else None
+    await wait_for_url_param(page, "search", applied, timeout)
+    await wait_for_idle(page, timeout)
+
+
+async def wait_for_card_count(page, count, timeout=5000):
+    """Wait until exactly ``count`` application cards are rendered."""
+    await expect(page.locator(CARD_SELECTOR)).to_have_count(count, timeout=timeout)
+
+
+async def wait_for_results(page, timeout=5000):
+    """Wait until the list shows either at least one card or the empty state."""
+    results = page.locator(CARD_SELECTOR).or_(page.get_by_text(EMPTY_STATE_TEXT))
+    await expect(results.first).to_be_visible(timeout=timeout)